@@ -10,12 +10,20 @@ from tkinter import ttk
 import logging
 from typing import Optional, Any
 
+from ..models.application_state import DatasetStatus
+
 
 class LeftPanel:
     """
     Left panel component that provides dataset overview and selection.
     """
     
+    # Model events this panel subscribes to
+    STATE_TOPICS = (
+        "datasets_batch_added", "datasets_changed", "dataset_loaded", "focus_changed", "controller_changed",
+        "config_changed", "dataset_directory_changed", "dataset_config_changed",
+    )
+    
     def __init__(self, parent: tk.Widget):
         """
         Initialize the left panel.
@@ -394,87 +402,91 @@ class LeftPanel:
         
         # Add datasets with detailed information
         for name, dataset_info in datasets.items():
-            # Loaded status based on DatasetStatus
-            if dataset_info.status.value == "loaded":
-                loaded_status = "✓"
-            elif dataset_info.status.value == "loading":
-                loaded_status = "⏳"
-            elif dataset_info.status.value == "error":
-                loaded_status = "❌"
+            self._insert_dataset_row(name, dataset_info)
+    
+    def _insert_dataset_row(self, name, dataset_info):
+        """Append one dataset row to the treeview."""
+        # Loaded status based on DatasetStatus
+        if dataset_info.status is DatasetStatus.LOADED:
+            loaded_status = "✓"
+        elif dataset_info.status is DatasetStatus.LOADING:
+            loaded_status = "⏳"
+        elif dataset_info.status is DatasetStatus.ERROR:
+            loaded_status = "❌"
+        else:
+            loaded_status = "✗"
+        
+        # Date (formatted for display)
+        date_str = "-"
+        if dataset_info.last_modified:
+            try:
+                from datetime import datetime
+                if isinstance(dataset_info.last_modified, str):
+                    # Try to parse common date formats
+                    for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y"]:
+                        try:
+                            dt = datetime.strptime(dataset_info.last_modified, fmt)
+                            date_str = dt.strftime("%m/%d/%y")
+                            break
+                        except ValueError:
+                            continue
+                    if date_str == "-":
+                        # If parsing fails, use first 8 characters
+                        date_str = dataset_info.last_modified[:8]
+                else:
+                    date_str = str(dataset_info.last_modified)[:8]
+            except:
+                date_str = "-"
+        
+        # Size in MB (formatted to 1 decimal place)
+        size_mb_str = "-"
+        if dataset_info.size_bytes and dataset_info.size_bytes > 0:
+            size_mb = dataset_info.size_bytes / (1024 * 1024)
+            if size_mb >= 100:
+                size_mb_str = f"{size_mb:.0f}"
+            elif size_mb >= 10:
+                size_mb_str = f"{size_mb:.1f}"
             else:
-                loaded_status = "✗"
+                size_mb_str = f"{size_mb:.2f}"
+        
+        # PKL file existence (green check or red X)
+        pkl_status = "✓" if dataset_info.has_pkl else "✗"
+        
+        # Data indicators - show counts if loaded, otherwise availability
+        if dataset_info.status is DatasetStatus.LOADED:
+            # Show actual counts for loaded datasets
+            truth_str = str(len(dataset_info.truth_df)) if dataset_info.truth_df is not None else "0"
+            detections_str = str(len(dataset_info.detections_df)) if dataset_info.detections_df is not None else "0"
             
-            # Date (formatted for display)
-            date_str = "-"
-            if dataset_info.last_modified:
+            # For tracks, count unique track IDs if available
+            if dataset_info.tracks_df is not None and not dataset_info.tracks_df.empty:
                 try:
-                    from datetime import datetime
-                    if isinstance(dataset_info.last_modified, str):
-                        # Try to parse common date formats
-                        for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y"]:
-                            try:
-                                dt = datetime.strptime(dataset_info.last_modified, fmt)
-                                date_str = dt.strftime("%m/%d/%y")
-                                break
-                            except ValueError:
-                                continue
-                        if date_str == "-":
-                            # If parsing fails, use first 8 characters
-                            date_str = dataset_info.last_modified[:8]
+                    from ..utils.schema_access import get_col
+                    schema = getattr(dataset_info, 'schema', None)
+                    track_col = get_col(schema, 'tracks', 'track_id')
+                    if track_col in dataset_info.tracks_df.columns:
+                        tracks_str = str(len(dataset_info.tracks_df[track_col].unique()))
                     else:
-                        date_str = str(dataset_info.last_modified)[:8]
-                except:
-                    date_str = "-"
-            
-            # Size in MB (formatted to 1 decimal place)
-            size_mb_str = "-"
-            if dataset_info.size_bytes and dataset_info.size_bytes > 0:
-                size_mb = dataset_info.size_bytes / (1024 * 1024)
-                if size_mb >= 100:
-                    size_mb_str = f"{size_mb:.0f}"
-                elif size_mb >= 10:
-                    size_mb_str = f"{size_mb:.1f}"
-                else:
-                    size_mb_str = f"{size_mb:.2f}"
-            
-            # PKL file existence (green check or red X)
-            pkl_status = "✓" if dataset_info.has_pkl else "✗"
-            
-            # Data indicators - show counts if loaded, otherwise availability
-            if dataset_info.status.value == "loaded":
-                # Show actual counts for loaded datasets
-                truth_str = str(len(dataset_info.truth_df)) if dataset_info.truth_df is not None else "0"
-                detections_str = str(len(dataset_info.detections_df)) if dataset_info.detections_df is not None else "0"
-                
-                # For tracks, count unique track IDs if available
-                if dataset_info.tracks_df is not None and not dataset_info.tracks_df.empty:
-                    try:
-                        from ..utils.schema_access import get_col
-                        schema = getattr(dataset_info, 'schema', None)
-                        track_col = get_col(schema, 'tracks', 'track_id')
-                        if track_col in dataset_info.tracks_df.columns:
-                            tracks_str = str(len(dataset_info.tracks_df[track_col].unique()))
-                        else:
-                            tracks_str = "0"
-                            self.logger.error(f"{track_col} not in dataset {dataset_info.name}.tracks_df.columns")
-                    except Exception as e:
                         tracks_str = "0"
-                        self.logger.error(f"Error counting track ids from {dataset_info.name}: {e}")
-                else:
+                        self.logger.error(f"{track_col} not in dataset {dataset_info.name}.tracks_df.columns")
+                except Exception as e:
                     tracks_str = "0"
+                    self.logger.error(f"Error counting track ids from {dataset_info.name}: {e}")
             else:
-                # Show availability indicators for unloaded datasets
-                truth_str = "✓" if dataset_info.has_truth else "✗"
-                detections_str = "✓" if dataset_info.has_detections else "✗"
-                tracks_str = "✓" if dataset_info.has_tracks else "✗"
-            
-            # Insert item with all detailed information
-            self.dataset_tree.insert(
-                "",
-                "end",
-                text=name,
-                values=(loaded_status, date_str, size_mb_str, pkl_status, truth_str, detections_str, tracks_str)
-            )
+                tracks_str = "0"
+        else:
+            # Show availability indicators for unloaded datasets
+            truth_str = "✓" if dataset_info.has_truth else "✗"
+            detections_str = "✓" if dataset_info.has_detections else "✗"
+            tracks_str = "✓" if dataset_info.has_tracks else "✗"
+        
+        # Insert item with all detailed information
+        self.dataset_tree.insert(
+            "",
+            "end",
+            text=name,
+            values=(loaded_status, date_str, size_mb_str, pkl_status, truth_str, detections_str, tracks_str)
+        )
     
     # _update_focus_info removed
     
@@ -492,7 +504,15 @@ class LeftPanel:
             
             state = self.controller.get_state()
             
-            if event == "datasets_changed":
+            if event == "datasets_batch_added":
+                # Append only the new rows; existing rows are unchanged
+                datasets = state.datasets
+                for name in state.last_added_datasets:
+                    if name in datasets:
+                        self._insert_dataset_row(name, datasets[name])
+                self.process_btn.configure(state="normal" if datasets else "disabled")
+            
+            elif event == "datasets_changed":
                 self._update_dataset_tree(state.datasets)
                 
                 # Update button states (enable Process when datasets exist)
@@ -500,6 +520,11 @@ class LeftPanel:
                 has_datasets = len(dataset_names) > 0
                 self.process_btn.configure(state="normal" if has_datasets else "disabled")
             
+            elif event == "dataset_loaded":
+                # Row status/counts and the dataset's config snapshot both changed
+                self._update_dataset_tree(state.datasets)
+                self._sync_dataset_config_view()
+            
             elif event == "focus_changed":
                 # Update dataset config view
                 self._sync_dataset_config_view()
@@ -17,6 +17,9 @@ class MenuBar:
     Menu bar component that provides the main application menu system.
     """
     
+    # Model events this component subscribes to
+    STATE_TOPICS = ("recent_directories_changed", "controller_changed")
+    
     def __init__(self, parent: tk.Widget):
         """
         Initialize the menu bar.
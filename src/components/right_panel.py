@@ -9,26 +9,94 @@ Phase 4: Basic Visualization using Matplotlib
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Optional, Any, Dict, List
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional, Any, Callable, Dict, List, Protocol, Set, Tuple
 
+from ..models.application_state import DatasetStatus
 from ..visualization.plot_manager import PlotManager
 from ..plotting.backends import MatplotlibBackend
 from ..plotting.statistics_tab import StatisticsTabWidget
 from ..plotting.overview_tab import OverviewTabWidget
 from ..plotting.geospatial_tab import GeospatialTabWidget
-from ..plotting.animation_tab import AnimationTabWidget
 from ..plotting.xy_plot_tab import XYPlotTabWidget
 from ..plotting.histogram_plot_tab import HistogramPlotTabWidget
+from ..plotting.control_widgets import get_shared_font
 from ..plotting import histogram_config_formatters  # noqa: F401 ensure registry
 # Importing formatter names via registry lookup (functions kept for backward compatibility if needed)
 from ..plotting import xy_config_formatters  # noqa: F401  (ensures registry side-effects)
 
 
+class TabWidgetProtocol(Protocol):
+    """Methods RightPanel calls on tab widgets; all but set_controller are optional."""
+    
+    def set_controller(self, controller: Any) -> None: ...
+    def set_plot_manager(self, plot_manager: Any) -> None: ...
+    def auto_update(self) -> None: ...
+    def clear_plot(self) -> None: ...
+    def on_focus_dataset_changed(self) -> None: ...
+    def get_state(self) -> Optional[Dict[str, Any]]: ...
+    def restore_state(self, state: Dict[str, Any]) -> None: ...
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+@dataclass
+class _TabHooks:
+    """A tab widget's TabWidgetProtocol methods, with no-ops for those it lacks."""
+    set_controller: Callable[[Any], None]
+    set_plot_manager: Callable[[Any], None]
+    auto_update: Callable[[], None]
+    clear_plot: Callable[[], None]
+    on_focus_dataset_changed: Callable[[], None]
+    get_state: Callable[[], Optional[Dict[str, Any]]]
+    restore_state: Callable[[Dict[str, Any]], None]
+    compute_plot_data: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    
+    @classmethod
+    def from_widget(cls, tab_widget: Any) -> "_TabHooks":
+        return cls(
+            set_controller=getattr(tab_widget, 'set_controller', _noop),
+            set_plot_manager=getattr(tab_widget, 'set_plot_manager', _noop),
+            auto_update=getattr(tab_widget, 'auto_update', _noop),
+            clear_plot=getattr(tab_widget, 'clear_plot', _noop),
+            on_focus_dataset_changed=getattr(tab_widget, 'on_focus_dataset_changed', _noop),
+            get_state=getattr(tab_widget, 'get_state', _noop),
+            restore_state=getattr(tab_widget, 'restore_state', _noop),
+            compute_plot_data=getattr(tab_widget, 'compute_plot_data', None),
+        )
+
+
 class RightPanel:
     """
     Right panel component that provides analysis views and visualizations.
     """
     
+    # Model events this panel subscribes to
+    STATE_TOPICS = ("datasets_changed", "dataset_loaded", "focus_changed")
+    
+    # Plot tabs kept materialized at once; the least recently shown hidden ones
+    # beyond this are released. Raise it to trade figure memory for fewer rebuilds.
+    max_live_plot_tabs: int = 3
+    
+    # Plot tabs in notebook order: (key, tab text, widget class, formatter name, title).
+    # A widget class of None means the tab is built by the matching _build_<key>_tab method.
+    _PLOT_TAB_SPECS = (
+        ('statistics', "# Tracks", None, None, None),
+        ('xy_lifetimes', "Track Lifetimes", XYPlotTabWidget, "track_existence_over_time", "Track Lifetimes"),
+        ('geospatial', "Lat/Lon Scatter", None, None, None),
+        ('xy_rms_error', "XY RMS Error", XYPlotTabWidget, "rms_error_3d_over_time", "XY RMS Error"),
+        ('animation', "Animation", None, None, None),
+        ('xy_north_error', "North Error", XYPlotTabWidget, "north_error_over_time", "North Error"),
+        ('xy_east_error', "East Error", XYPlotTabWidget, "east_error_over_time", "East Error"),
+        ('north_error_hist', 'North Err Hist', HistogramPlotTabWidget, 'north_error_histogram', 'North Error Histogram'),
+        ('east_error_hist', 'East Err Hist', HistogramPlotTabWidget, 'east_error_histogram', 'East Error Histogram'),
+    )
+    
     def __init__(self, parent: tk.Widget):
         """
         Initialize the right panel.
@@ -40,6 +108,25 @@ class RightPanel:
         self.logger = logging.getLogger(__name__)
         self.controller: Optional[Any] = None
         self.plot_manager: Optional[PlotManager] = None
+        self.tab_widgets: Dict[str, Any] = {}
+        self._current_tab_text: str = ""
+        
+        # Coalesce bursts of state events into a single refresh
+        self._pending_event: Optional[str] = None
+        self._pending_cache_clear = False
+        self._after_id: Optional[str] = None
+        self._state_change_delay_ms = 30
+        
+        # Formatter/PlotManager work for tabs that support it runs off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="plot-compute")
+        # Latest in-flight computation per tab key
+        self._plot_futures: Dict[str, Future] = {}
+        # Finished computations, put by worker threads and drained on the Tk thread
+        self._plot_results: "queue.SimpleQueue[Tuple[str, Any, Future]]" = queue.SimpleQueue()
+        self._plot_poll_id: Optional[str] = None
+        self._plot_poll_interval_ms = 20
+        # Set by destroy(); no new computations are submitted afterwards
+        self._closed = False
         
         # Create the main frame
         self.frame = ttk.Frame(parent)
@@ -63,12 +150,9 @@ class RightPanel:
             self.plot_manager = PlotManager(controller.data_interface)
         
         # Pass controller and plot manager to all modular widgets
-        if hasattr(self, 'tab_widgets'):
-            for tab_name, tab_widget in self.tab_widgets.items():
-                tab_widget.set_controller(controller)
-                if hasattr(tab_widget, 'set_plot_manager'):
-                    if hasattr(self, 'plot_manager'):
-                        tab_widget.set_plot_manager(self.plot_manager)
+        for hooks in self._tab_hooks.values():
+            hooks.set_controller(controller)
+            hooks.set_plot_manager(self.plot_manager)
         
         self.logger.debug("Controller set for right panel")
     
@@ -78,7 +162,7 @@ class RightPanel:
         title_label = ttk.Label(
             self.frame,
             text="Visualization & Analysis",
-            font=("TkDefaultFont", 10, "bold")
+            font=get_shared_font(self.frame, 10, "bold")
         )
         title_label.pack(fill="x", padx=10, pady=(10, 5))
         
@@ -86,236 +170,278 @@ class RightPanel:
         self.notebook = ttk.Notebook(self.frame)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=5)
         
-        # Bind tab selection events
-        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
-        
-        # Create tabs with matplotlib integration
+        # Create tabs with matplotlib integration, then bind tab selection events
+        # so page adds during construction aren't handled as user selections
         self._create_tabs()
+        self.notebook.select(0)
+        self._current_tab_text = self._query_current_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
     
     def _create_tabs(self):
-            """Create the analysis view tabs with matplotlib integration for Phase 5."""
+            """
+            Create the analysis view tabs with matplotlib integration for Phase 5.
+            
+            Only the Overview tab is built eagerly. Every plot tab is registered as a
+            placeholder frame plus a factory, and its widget (with its own matplotlib
+            Figure and canvas) is created the first time the tab is selected.
+            """
+            self._tab_factories: Dict[str, Callable[[ttk.Frame], Any]] = {}
+            self._tab_keys: Dict[str, str] = {}
+            self._tab_frames: Dict[str, ttk.Frame] = {}
+            # Notebook tab id (widget path) -> tab text, for one-call selection lookups
+            self._tab_texts_by_id: Dict[str, str] = {}
+            
+            # Materialized plot tabs in least- to most-recently-shown order; older
+            # ones beyond max_live_plot_tabs are released to bound live figure/Agg buffers
+            self._live_plot_tabs: List[str] = []
+            # Control settings (and last plot result, while the data is unchanged)
+            # of released tabs, re-applied when they are rebuilt
+            self._saved_tab_states: Dict[str, Dict[str, Any]] = {}
+            
+            # Bound methods collected once per tab at registration, for the event fan-out
+            self._auto_update_fns: Dict[str, Callable[[], None]] = {}
+            self._clear_fns: List[Callable[[], None]] = []
+            self._focus_reset_fns: List[Callable[[], None]] = []
+            self._tab_hooks: Dict[str, _TabHooks] = {}
+            
+            # Tabs whose data changed while hidden; refreshed when next selected
+            self._dirty_tabs: Set[str] = set()
+            
             # Overview Tab
             self._create_overview_tab()
-            # Statistics Tab
-            self._create_statistics_tab()
-            # Track existence (lifetime) tab 
-            self._create_xy_lifetime_tab()
-            # Lat/Lon Scatter Tab
-            self._create_geospatial_tab()
-            # Generic XY RMS Error mirror tab
-            self._create_xy_rms_error_tab()
-            # Animation Tab
-            self._create_animation_tab()
-            # North / East error tabs
-            self._create_xy_north_error_tab()
-            self._create_xy_east_error_tab()
-            # Histograms
-            self._create_histogram_tabs()
+            
+            # Plot tabs, in notebook order
+            for key, label, widget_cls, formatter_name, title in self._PLOT_TAB_SPECS:
+                if widget_cls is None:
+                    factory = getattr(self, f"_build_{key}_tab")
+                else:
+                    factory = partial(self._build_generic_tab, widget_cls, formatter_name, title)
+                self._register_lazy_tab(key, label, factory)
     
     def _create_overview_tab(self):
         """Create the overview tab"""
         self.overview_tab = OverviewTabWidget(self.notebook)
         self.notebook.add(self.overview_tab, text="Overview")
+        self._tab_keys["Overview"] = 'overview'
+        self._tab_frames["Overview"] = self.overview_tab
+        self._tab_texts_by_id[str(self.overview_tab)] = "Overview"
         
         # Set dependencies
         if hasattr(self, 'controller'):
             self.overview_tab.set_controller(self.controller)
         
         # Store reference in the tab widgets dict
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['overview'] = self.overview_tab
-        
-    def _create_statistics_tab(self):
-        """Create the statistics tab using modular widget architecture."""
-        # Create backend for this tab
-        stats_backend = MatplotlibBackend()
+        self._register_tab_widget('overview', self.overview_tab)
+    
+    def _register_tab_widget(self, key: str, tab_widget: Any):
+        """
+        Store a tab widget and cache its optional update hooks.
         
-        # Create the statistics tab widget
-        self.statistics_tab = StatisticsTabWidget(self.notebook, stats_backend)
-        self.notebook.add(self.statistics_tab, text="# Tracks")
+        Args:
+            key: Key used for the widget in tab_widgets
+            tab_widget: The created tab widget
+        """
+        self.tab_widgets[key] = tab_widget
         
-        # Set dependencies
-        if hasattr(self, 'controller'):
-            self.statistics_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.statistics_tab.set_plot_manager(self.plot_manager)
-        
-        # Store reference in a separate dict for the new modular widgets
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['statistics'] = self.statistics_tab
+        hooks = _TabHooks.from_widget(tab_widget)
+        # XY tabs keep their lines and blit new data over a cached background
+        if isinstance(tab_widget, XYPlotTabWidget):
+            hooks.auto_update = partial(hooks.auto_update, mode='blit')
+        self._tab_hooks[key] = hooks
+        self._auto_update_fns[key] = hooks.auto_update
+        self._clear_fns.append(hooks.clear_plot)
+        self._focus_reset_fns.append(hooks.on_focus_dataset_changed)
     
-    def _create_geospatial_tab(self):
-        """Create the geospatial tab using modular widget architecture."""
-        # Create backend for this tab
-        geospatial_backend = MatplotlibBackend()
+    def _register_lazy_tab(self, key: str, text: str, factory: Callable[[ttk.Frame], Any]):
+        """
+        Add a placeholder notebook page whose widget is built on first selection.
         
-        # Create the geospatial tab widget
-        self.geospatial_tab = GeospatialTabWidget(self.notebook, geospatial_backend)
-        self.notebook.add(self.geospatial_tab, text="Lat/Lon Scatter")
+        Args:
+            key: Key used for the widget in tab_widgets
+            text: Notebook tab label
+            factory: Callable creating the tab widget inside the given parent frame
+        """
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._tab_frames[text] = frame
+        self._tab_texts_by_id[str(frame)] = text
+        self._tab_factories[text] = factory
+        self._tab_keys[text] = key
+    
+    def _ensure_tab(self, text: str):
+        """
+        Build the widget for a lazily registered tab if it does not exist yet.
         
-        # Set dependencies
-        if hasattr(self, 'controller'):
-            self.geospatial_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.geospatial_tab.set_plot_manager(self.plot_manager)
+        Args:
+            text: Notebook tab label
+        """
+        key = self._tab_keys.get(text)
+        if key is None or key in self.tab_widgets:
+            return
         
-        # Store reference in the tab widgets dict
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['geospatial'] = self.geospatial_tab
+        try:
+            tab_widget = self._tab_factories[text](self._tab_frames[text])
+            tab_widget.pack(fill="both", expand=True)
+            self._register_tab_widget(key, tab_widget)
+            hooks = self._tab_hooks[key]
+            
+            # Set dependencies
+            if self.controller:
+                hooks.set_controller(self.controller)
+            if self.plot_manager:
+                hooks.set_plot_manager(self.plot_manager)
+            self.logger.debug("Tab '%s' created on first use", text)
+            
+            # A tab released earlier gets its control settings back
+            saved_state = self._saved_tab_states.pop(key, None)
+            
+            # Catch up with any dataset that was loaded before the tab existed
+            if self.controller:
+                focus_info = self.controller.get_state().get_focus_dataset_info()
+                if focus_info and focus_info.status is DatasetStatus.LOADED:
+                    if saved_state is not None and hooks.compute_plot_data is not None:
+                        # restore_state draws (from the saved result when still
+                        # valid); the selection widgets only need the data listed
+                        hooks.on_focus_dataset_changed()
+                    else:
+                        hooks.auto_update()
+            
+            if saved_state is not None:
+                hooks.restore_state(saved_state)
+        except Exception as e:
+            self.logger.error(f"Error creating tab '{text}': {e}")
     
+    def _touch_live_tab(self, text: str):
+        """
+        Mark a lazily created tab as most recently shown and release the oldest
+        hidden tabs beyond the live-tab cap.
+        
+        Args:
+            text: Notebook tab label of the shown tab
+        """
+        key = self._tab_keys.get(text)
+        if key is None or key not in self.tab_widgets or text not in self._tab_factories:
+            return
+        
+        if key in self._live_plot_tabs:
+            self._live_plot_tabs.remove(key)
+        self._live_plot_tabs.append(key)
+        
+        while len(self._live_plot_tabs) > max(1, self.max_live_plot_tabs):
+            self._release_tab(self._live_plot_tabs.pop(0))
     
-    def _create_xy_lifetime_tab(self):
-        """Create the lifetime (existence) tab as an XY plot (track duration lines)."""
-        xy_backend = MatplotlibBackend()
-        self.xy_lifetime_tab = XYPlotTabWidget(
-            self.notebook,
-            xy_backend,
-            include_data_selection=False,
-            include_track_selection=True,
-            formatter_name="track_existence_over_time",
-            title="Track Lifetimes"
-        )
-        self.notebook.add(self.xy_lifetime_tab, text="Track Lifetimes")
-
-        if hasattr(self, 'controller'):
-            self.xy_lifetime_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.xy_lifetime_tab.set_plot_manager(self.plot_manager)
-
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['xy_lifetimes'] = self.xy_lifetime_tab
+    def destroy_tab(self, key: str):
+        """
+        Destroy a lazily created tab widget and release its figure.
+        
+        The notebook page stays; the widget is rebuilt, with its control settings
+        restored, the next time the tab is selected. Eagerly created tabs
+        (Overview) are left alone.
+        
+        Args:
+            key: Key of the widget in tab_widgets
+        """
+        if key not in self._tab_keys.values() or key == 'overview':
+            self.logger.debug("destroy_tab: '%s' is not a lazily created tab", key)
+            return
+        if key in self._live_plot_tabs:
+            self._live_plot_tabs.remove(key)
+        self._release_tab(key)
     
-    def _create_animation_tab(self):
-        """Create the animation tab using modular widget architecture."""
-        # Create backend for this tab
-        animation_backend = MatplotlibBackend()
+    def _release_tab(self, key: str):
+        """
+        Destroy a lazily created tab widget, leaving its placeholder to be rebuilt.
         
-        # Create the animation tab widget
-        self.animation_tab = AnimationTabWidget(self.notebook, animation_backend)
-        self.notebook.add(self.animation_tab, text="Animation")
+        The widget's control settings are saved first and restored on rebuild.
         
-        # Set dependencies
-        if hasattr(self, 'controller'):
-            self.animation_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.animation_tab.set_plot_manager(self.plot_manager)
+        Args:
+            key: Key of the widget in tab_widgets
+        """
+        tab_widget = self.tab_widgets.pop(key, None)
+        if tab_widget is None:
+            return
         
-        # Store reference in the tab widgets dict
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['animation'] = self.animation_tab
-
-    def _create_xy_north_error_tab(self):
-        """Create a generic XY tab for North (latitudinal) error vs time."""
-        xy_backend = MatplotlibBackend()
-        self.xy_north_error_tab = XYPlotTabWidget(
-            self.notebook,
-            xy_backend,
-            include_data_selection=False,
-            include_track_selection=True,
-            formatter_name="north_error_over_time",
-            title="North Error"
-        )
-        self.notebook.add(self.xy_north_error_tab, text="North Error")
-
-        if hasattr(self, 'controller'):
-            self.xy_north_error_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.xy_north_error_tab.set_plot_manager(self.plot_manager)
-
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['xy_north_error'] = self.xy_north_error_tab
-
-    def _create_xy_east_error_tab(self):
-        """Create a generic XY tab for East (longitudinal) error vs time."""
-        xy_backend = MatplotlibBackend()
-        self.xy_east_error_tab = XYPlotTabWidget(
-            self.notebook,
-            xy_backend,
-            include_data_selection=False,
-            include_track_selection=True,
-            formatter_name="east_error_over_time",
-            title="East Error"
-        )
-        self.notebook.add(self.xy_east_error_tab, text="East Error")
-
-        if hasattr(self, 'controller'):
-            self.xy_east_error_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.xy_east_error_tab.set_plot_manager(self.plot_manager)
-
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['xy_east_error'] = self.xy_east_error_tab
-
-    def _create_xy_rms_error_tab(self):
-        """Create a generic XY tab instance replicating the RMS Error plot (time vs 3D RMS)."""
-        xy_backend = MatplotlibBackend()
-        self.xy_rms_error_tab = XYPlotTabWidget(
-            self.notebook,
-            xy_backend,
-            include_data_selection=False,
-            include_track_selection=True,
-            formatter_name="rms_error_3d_over_time",
-            title="XY RMS Error"
-        )
-        self.notebook.add(self.xy_rms_error_tab, text="XY RMS Error")
-
-        if hasattr(self, 'controller'):
-            self.xy_rms_error_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager'):
-            self.xy_rms_error_tab.set_plot_manager(self.plot_manager)
-
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['xy_rms_error'] = self.xy_rms_error_tab
-
-    def _create_histogram_tabs(self):
-        """Create histogram tabs for north and east error distributions."""
-        north_backend = MatplotlibBackend()
-        self.north_error_hist_tab = HistogramPlotTabWidget(
-            self.notebook,
-            north_backend,
-            include_data_selection=False,
-            include_track_selection=True,
-            formatter_name='north_error_histogram',
-            title='North Error Histogram'
-        )
-        self.notebook.add(self.north_error_hist_tab, text='North Err Hist')
-
-        east_backend = MatplotlibBackend()
-        self.east_error_hist_tab = HistogramPlotTabWidget(
-            self.notebook,
-            east_backend,
+        # Nobody will draw this tab's pending result; drop it if not yet running
+        pending = self._plot_futures.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+        
+        try:
+            hooks = self._tab_hooks.pop(key, None)
+            if hooks is not None:
+                # Keep the controls' settings for when the tab is rebuilt
+                saved_state = hooks.get_state()
+                if saved_state is not None:
+                    if pending is not None:
+                        # The last drawn result predates a refresh that never landed
+                        saved_state.pop('plot_result', None)
+                    self._saved_tab_states[key] = saved_state
+                self._clear_fns.remove(hooks.clear_plot)
+                self._focus_reset_fns.remove(hooks.on_focus_dataset_changed)
+            self._auto_update_fns.pop(key, None)
+            # A rebuilt tab catches up in _ensure_tab
+            self._dirty_tabs.discard(key)
+            
+            # Let a running animation loop stop at its next tick
+            if getattr(tab_widget, 'is_playing', False):
+                tab_widget.is_playing = False
+            
+            backend = getattr(tab_widget, 'backend', None)
+            if backend is not None:
+                backend.close()
+            
+            tab_widget.destroy()
+            self.logger.debug("Released hidden tab widget '%s'", key)
+        except Exception as e:
+            self.logger.error(f"Error releasing tab '{key}': {e}")
+    
+    def _build_statistics_tab(self, parent: ttk.Frame):
+        """Create the statistics tab using modular widget architecture."""
+        return StatisticsTabWidget(parent, MatplotlibBackend())
+    
+    def _build_geospatial_tab(self, parent: ttk.Frame):
+        """Create the geospatial tab using modular widget architecture."""
+        return GeospatialTabWidget(parent, MatplotlibBackend())
+    
+    def _build_animation_tab(self, parent: ttk.Frame):
+        """Create the animation tab using modular widget architecture."""
+        from ..plotting.animation_tab import AnimationTabWidget
+        return AnimationTabWidget(parent, MatplotlibBackend())
+    
+    def _build_generic_tab(self, widget_cls: type, formatter_name: str, title: str, parent: ttk.Frame):
+        """
+        Create a formatter-driven XY or histogram tab.
+        
+        Args:
+            widget_cls: XYPlotTabWidget or HistogramPlotTabWidget
+            formatter_name: Registered formatter used to build the plot config
+            title: Plot title
+            parent: Placeholder frame hosting the tab
+        """
+        return widget_cls(
+            parent,
+            MatplotlibBackend(),
             include_data_selection=False,
             include_track_selection=True,
-            formatter_name='east_error_histogram',
-            title='East Error Histogram'
+            formatter_name=formatter_name,
+            title=title
         )
-        self.notebook.add(self.east_error_hist_tab, text='East Err Hist')
-
-        if hasattr(self, 'controller') and self.controller:
-            self.north_error_hist_tab.set_controller(self.controller)
-            self.east_error_hist_tab.set_controller(self.controller)
-        if hasattr(self, 'plot_manager') and self.plot_manager:
-            self.north_error_hist_tab.set_plot_manager(self.plot_manager)
-            self.east_error_hist_tab.set_plot_manager(self.plot_manager)
-
-        if not hasattr(self, 'tab_widgets'):
-            self.tab_widgets = {}
-        self.tab_widgets['north_error_hist'] = self.north_error_hist_tab
-        self.tab_widgets['east_error_hist'] = self.east_error_hist_tab
     
     def _on_tab_changed(self, event):
         """Handle tab change events."""
         try:
-            current_tab = self.get_current_tab()
-            self.logger.debug(f"Tab changed to: {current_tab}")
+            current_tab = self._current_tab_text = self._query_current_tab()
+            self.logger.debug("Tab changed to: %s", current_tab)
+            
+            # Build the tab's widget the first time it is shown
+            self._ensure_tab(current_tab)
+            self._touch_live_tab(current_tab)
+            
+            # Catch up on state changes that happened while the tab was hidden
+            key = self._tab_keys.get(current_tab)
+            if key in self._dirty_tabs:
+                self._dirty_tabs.discard(key)
+                self._refresh_tab(key)
         
         except Exception as e:
             self.logger.error(f"Error handling tab change: {e}")
@@ -325,9 +451,43 @@ class RightPanel:
         """
         Handle state changes from the application.
         
+        Dataset and focus events arrive in bursts (a load fires
+        'dataset_loaded' then 'focus_changed'), so they are coalesced and
+        handled once by _flush_state_change. 'dataset_loaded' is handled
+        like 'datasets_changed'.
+        
         Args:
             event: The type of state change event
         """
+        if event == "dataset_loaded":
+            event = "datasets_changed"
+        elif event not in ("datasets_changed", "focus_changed"):
+            return
+        
+        self._pending_event = event
+        if event == "datasets_changed":
+            self._pending_cache_clear = True
+        if self._after_id is None:
+            try:
+                self._after_id = self.frame.after(self._state_change_delay_ms, self._flush_state_change)
+            except tk.TclError as e:
+                # The panel is being destroyed; there is nothing left to refresh
+                self.logger.debug("Dropping state change '%s': %s", event, e)
+    
+    def _flush_state_change(self):
+        """Handle the most recent coalesced state change event."""
+        event = self._pending_event
+        clear_cache = self._pending_cache_clear
+        self._pending_event = None
+        self._pending_cache_clear = False
+        self._after_id = None
+        if event is None:
+            return
+        
+        # Plot results saved with released tabs describe data that may have changed
+        for saved_state in self._saved_tab_states.values():
+            saved_state.pop('plot_result', None)
+        
         try:
             if not self.controller:
                 return
@@ -335,62 +495,159 @@ class RightPanel:
             state = self.controller.get_state()
             
             if event in ("datasets_changed", "focus_changed"):
+                if clear_cache and self.plot_manager:
+                    # Dataset contents may have been reloaded; drop memoized plot data
+                    self.plot_manager.clear_cache()
+                
                 focus_info = state.get_focus_dataset_info()
-                if focus_info and focus_info.status.value == "loaded":
-                    # Auto-update all tabs when we have a loaded focus dataset
-                    for _, tab_widget in self.tab_widgets.items():
-                        if hasattr(tab_widget, 'auto_update'):
-                            tab_widget.auto_update()
-                    self.logger.debug(f"{event}: plots refreshed for loaded focus dataset")
+                if focus_info and focus_info.status is DatasetStatus.LOADED:
+                    # Refresh only the visible tab; the others catch up when selected
+                    current_key = self._tab_keys.get(self.get_current_tab())
+                    for key in self._auto_update_fns:
+                        if key == current_key:
+                            self._refresh_tab(key)
+                        else:
+                            self._dirty_tabs.add(key)
+                    self.logger.debug("%s: visible tab refreshed for loaded focus dataset", event)
                 else:
                     # No focus or not loaded: clear all plots and reset tab widgets
-                    for _, tab_widget in self.tab_widgets.items():
-                        if hasattr(tab_widget, 'clear_plot'):
-                            try:
-                                tab_widget.clear_plot()
-                            except Exception:
-                                pass
-                        # Also trigger focus-change handling to reset control widgets if available
-                        if hasattr(tab_widget, 'on_focus_dataset_changed'):
-                            try:
-                                tab_widget.on_focus_dataset_changed()
-                            except Exception:
-                                pass
-                    self.logger.debug(f"{event}: no focus or not loaded; plots cleared and widgets reset")
+                    self._dirty_tabs.clear()
+                    for clear_plot in self._clear_fns:
+                        try:
+                            clear_plot()
+                        except Exception:
+                            pass
+                    # Also trigger focus-change handling to reset control widgets
+                    for reset in self._focus_reset_fns:
+                        try:
+                            reset()
+                        except Exception:
+                            pass
+                    self.logger.debug("%s: no focus or not loaded; plots cleared and widgets reset", event)
 
                 # After plot refresh/clear, apply capability-based tab enable/disable
                 try:
                     self._apply_capability_tab_visibility(focus_info)
                 except Exception as e2:
-                    self.logger.debug(f"Capability tab visibility update skipped due to error: {e2}")
+                    self.logger.debug("Capability tab visibility update skipped due to error: %s", e2)
             
         except Exception as e:
             self.logger.error(f"Error handling state change '{event}': {e}")
     
+    def _refresh_tab(self, key: str):
+        """
+        Refresh a tab after a state change.
+        
+        Tabs exposing compute_plot_data() have their data prepared on the
+        executor and drawn back on the Tk thread; others run auto_update().
+        
+        Args:
+            key: Key of the widget in tab_widgets
+        """
+        tab_widget = self.tab_widgets.get(key)
+        hooks = self._tab_hooks.get(key)
+        if tab_widget is None or hooks is None or self._closed:
+            return
+        
+        if hooks.compute_plot_data is None:
+            hooks.auto_update()
+            return
+        
+        # Selection widgets are refreshed and read here, on the Tk thread
+        hooks.on_focus_dataset_changed()
+        inputs = tab_widget.snapshot_plot_inputs()
+        
+        # A newer snapshot supersedes any computation still queued for this tab
+        previous = self._plot_futures.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        future = self._executor.submit(hooks.compute_plot_data, inputs)
+        self._plot_futures[key] = future
+        future.add_done_callback(partial(self._on_plot_data_computed, key, tab_widget))
+        if self._plot_poll_id is None:
+            self._plot_poll_id = self.frame.after(self._plot_poll_interval_ms, self._drain_plot_results)
+    
+    def _on_plot_data_computed(self, key: str, tab_widget: Any, future: Future):
+        """Queue a finished background computation for the Tk thread (may run on a worker)."""
+        # No Tk calls here: the Tk thread picks results up in _drain_plot_results
+        self._plot_results.put((key, tab_widget, future))
+    
+    def _drain_plot_results(self):
+        """Apply finished computations; keep polling while any are in flight."""
+        self._plot_poll_id = None
+        while True:
+            try:
+                key, tab_widget, future = self._plot_results.get_nowait()
+            except queue.Empty:
+                break
+            if self._plot_futures.get(key) is future:
+                del self._plot_futures[key]
+            if not future.cancelled():
+                self._apply_computed_plot_data(key, tab_widget, future)
+        if self._plot_futures:
+            self._plot_poll_id = self.frame.after(self._plot_poll_interval_ms, self._drain_plot_results)
+    
+    def _apply_computed_plot_data(self, key: str, tab_widget: Any, future: Future):
+        """Draw background-computed plot data if the tab is still live."""
+        if self.tab_widgets.get(key) is not tab_widget:
+            return
+        try:
+            tab_widget.apply_plot_data(future.result())
+        except Exception as e:
+            self.logger.error(f"Error computing plot data for '{key}': {e}")
+            tab_widget.clear_plot()
+    
+    def destroy(self):
+        """
+        Stop background plot work before the window closes.
+        
+        Pending computations are cancelled and the executor is shut down
+        without waiting, so a running formatter cannot hold up exit.
+        """
+        self._closed = True
+        for future in self._plot_futures.values():
+            future.cancel()
+        self._plot_futures.clear()
+        self._executor.shutdown(wait=False)
+        
+        for after_id in (self._plot_poll_id, self._after_id):
+            if after_id is not None:
+                try:
+                    self.frame.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+        self._plot_poll_id = None
+        self._after_id = None
+        self.logger.debug("Right panel background work stopped")
+    
     # Utility Methods
     def get_current_tab(self) -> str:
         """
         Get the name of the currently selected tab.
         
+        The value is cached by the tab-changed handler, so no Tk calls are made.
+        
         Returns:
             Name of the current tab, or empty string if none selected
         """
+        return self._current_tab_text
+    
+    def _query_current_tab(self) -> str:
+        """Read the selected tab's text from the notebook."""
         try:
-            current_index = self.notebook.index(self.notebook.select())
-            return str(self.notebook.tab(current_index, "text") or "")
+            selected = str(self.notebook.select())
+            text = self._tab_texts_by_id.get(selected)
+            if text is None and selected:
+                text = str(self.notebook.tab(selected, "text") or "")
+            return text or ""
         except Exception as e:
             self.logger.error(f"Error getting current tab: {e}")
             return ""
 
     # Capability-based tab visibility -------------------------------------------------
     def _find_tab_id_by_text(self, text: str):
-        try:
-            for tab_id in self.notebook.tabs():
-                if self.notebook.tab(tab_id, 'text') == text:
-                    return tab_id
-        except Exception:
-            pass
-        return None
+        # Tab pages are recorded at creation; Tk accepts the page widget as a tab id
+        return self._tab_frames.get(text)
 
     def _apply_capability_tab_visibility(self, focus_info):
         """Enable/disable East Error tabs based on dataset capabilities.
@@ -402,7 +659,7 @@ class RightPanel:
         """
         has_precomputed = False
         try:
-            if focus_info and getattr(focus_info, 'status', None) and getattr(focus_info.status, 'value', '') == 'loaded':
+            if focus_info and getattr(focus_info, 'status', None) is DatasetStatus.LOADED:
                 caps = getattr(focus_info, 'capabilities', []) or []
                 has_precomputed = 'precomputed_errors' in caps
         except Exception:
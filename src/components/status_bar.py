@@ -8,7 +8,8 @@ application status information and progress indicators.
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Optional, Any
+import time
+from typing import Optional, Any, Callable, Dict, List
 
 
 class StatusBar:
@@ -16,6 +17,12 @@ class StatusBar:
     Status bar component that displays application status and progress.
     """
     
+    # Model events this component subscribes to (the keys of _handlers)
+    STATE_TOPICS = (
+        "processing_status_changed", "processing_progress_changed", "datasets_changed",
+        "datasets_batch_added", "dataset_loaded", "selection_changed", "view_changed",
+    )
+    
     def __init__(self, parent: tk.Widget):
         """
         Initialize the status bar.
@@ -27,6 +34,38 @@ class StatusBar:
         self.logger = logging.getLogger(__name__)
         self.controller: Optional[Any] = None
         
+        # Latest requested value per field, applied once per idle cycle
+        self._pending: Dict[str, Any] = {}
+        self._last: Dict[str, Any] = {}
+        self._flush_scheduled = False
+        
+        # Progress bar writes are throttled to one per interval
+        self._last_progress_ts = 0.0
+        self._progress_interval_ms = 50
+        
+        # Mirrors of the progress bar state, so updates need no Tk queries
+        self._progress_value = -1.0
+        self._progress_visible = False
+        
+        # Pending after() ids of a running flash_message sequence
+        self._flash_after_ids: List[str] = []
+        self._flash_interval_ms = 500
+        
+        # Single pending revert of show_temporary_message and the text it restores
+        self._temp_after_id: Optional[str] = None
+        self._pretemp_status: Optional[str] = None
+        
+        # Model event -> handler taking the application state
+        self._handlers: Dict[str, Callable[[Any], None]] = {
+            "processing_status_changed": self._handle_processing_status,
+            "processing_progress_changed": self._handle_processing_progress,
+            "datasets_changed": self._handle_dataset_counts,
+            "datasets_batch_added": self._handle_dataset_counts,
+            "dataset_loaded": self._handle_dataset_loaded,
+            "selection_changed": self._handle_dataset_counts,
+            "view_changed": self._handle_view_changed,
+        }
+        
         # Create the status bar frame
         self.frame = ttk.Frame(parent, relief="sunken", borderwidth=1)
         
@@ -94,6 +133,75 @@ class StatusBar:
         # Update initial values
         self.dataset_count_var.set("Datasets: 0")
         self.view_var.set("View: Overview")
+        self._last.update({'dataset_count': "Datasets: 0", 'view': "View: Overview"})
+    
+    def _schedule_flush(self, delay_ms: int = 0):
+        """Schedule a single flush of pending field updates."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        if delay_ms > 0:
+            self.frame.after(delay_ms, self._flush)
+        else:
+            self.frame.after_idle(self._flush)
+    
+    def _flush(self):
+        """Apply pending field updates, skipping values that haven't changed."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        
+        for key, value in pending.items():
+            if key == 'progress':
+                continue
+            if self._last.get(key) == value:
+                continue
+            self._last[key] = value
+            if key == 'status':
+                self.status_var.set(value)
+            elif key == 'dataset_count':
+                self.dataset_count_var.set(value)
+            elif key == 'view':
+                self.view_var.set(value)
+        
+        if 'progress' in pending:
+            self._apply_progress(pending['progress'])
+    
+    def _apply_progress(self, progress):
+        """Write a (value, visible) progress update, deferring it if one was just written."""
+        value, visible = progress
+        last = self._last.get('progress')
+        if last == progress:
+            return
+        
+        # Visibility changes go through at once; value-only changes are rate limited
+        elapsed_ms = (time.monotonic() - self._last_progress_ts) * 1000.0
+        if last is not None and last[1] == visible and elapsed_ms < self._progress_interval_ms:
+            self._pending.setdefault('progress', progress)
+            self._schedule_flush(int(self._progress_interval_ms - elapsed_ms) + 1)
+            return
+        
+        self._last['progress'] = progress
+        self._last_progress_ts = time.monotonic()
+        pct = value * 100.0  # Convert to percentage
+        if pct != self._progress_value:
+            self.progress_var.set(pct)
+            self._progress_value = pct
+        self._set_progress_visible(visible)
+    
+    def _set_progress_visible(self, visible: bool):
+        """Pack or unpack the progress bar when its visibility changes."""
+        if visible and not self._progress_visible:
+            # Show progress bar
+            self.progress_bar.pack(side="right", padx=(5, 10), pady=2)
+            self._progress_visible = True
+        elif not visible and self._progress_visible:
+            # Hide progress bar
+            self.progress_bar.pack_forget()
+            self._progress_visible = False
+    
+    def _get_status(self) -> str:
+        """Return the status message most recently requested, flushed or not."""
+        return self._pending.get('status', self.status_var.get())
     
     def set_status(self, message: str):
         """
@@ -102,8 +210,29 @@ class StatusBar:
         Args:
             message: The status message to display
         """
-        self.status_var.set(message)
-        self.logger.debug(f"Status updated: {message}")
+        # An explicit status replaces any flash still in progress
+        self._cancel_flash()
+        self._set_status_text(message)
+        self.logger.debug("Status updated: %s", message)
+    
+    def _set_status_text(self, message: str):
+        """Queue a status message without touching a running flash sequence."""
+        self._pending['status'] = message
+        self._schedule_flush()
+    
+    def _cancel_flash(self):
+        """Cancel the remaining steps of a running flash_message sequence."""
+        for after_id in self._flash_after_ids:
+            try:
+                self.frame.after_cancel(after_id)
+            except Exception:
+                pass
+        self._flash_after_ids.clear()
+    
+    def _finish_flash(self, message: str):
+        """Show the final text of a flash sequence and forget its finished steps."""
+        self._flash_after_ids.clear()
+        self._set_status_text(message)
     
     def set_progress(self, value: float, visible: bool = True):
         """
@@ -113,16 +242,10 @@ class StatusBar:
             value: Progress value (0.0 to 1.0)
             visible: Whether the progress bar should be visible
         """
-        self.progress_var.set(value * 100)  # Convert to percentage
-        
-        if visible and not self.progress_bar.winfo_ismapped():
-            # Show progress bar
-            self.progress_bar.pack(side="right", padx=(5, 10), pady=2)
-        elif not visible and self.progress_bar.winfo_ismapped():
-            # Hide progress bar
-            self.progress_bar.pack_forget()
+        self._pending['progress'] = (value, visible)
+        self._schedule_flush()
         
-        self.logger.debug(f"Progress updated: {value:.1%}, visible: {visible}")
+        self.logger.debug("Progress updated: %.1f%%, visible: %s", value * 100, visible)
     
     def set_dataset_count(self, total: int, selected: int = 0, loaded: int = 0):
         """
@@ -138,8 +261,9 @@ class StatusBar:
         else:
             count_text = f"Datasets: {total}"
         
-        self.dataset_count_var.set(count_text)
-        self.logger.debug(f"Dataset count updated: {count_text}")
+        self._pending['dataset_count'] = count_text
+        self._schedule_flush()
+        self.logger.debug("Dataset count updated: %s", count_text)
     
     def set_current_view(self, view_name: str):
         """
@@ -148,8 +272,9 @@ class StatusBar:
         Args:
             view_name: Name of the current view
         """
-        self.view_var.set(f"View: {view_name.title()}")
-        self.logger.debug(f"Current view updated: {view_name}")
+        self._pending['view'] = f"View: {view_name.title()}"
+        self._schedule_flush()
+        self.logger.debug("Current view updated: %s", view_name)
     
     def show_temporary_message(self, message: str, duration: int = 3000):
         """
@@ -159,16 +284,26 @@ class StatusBar:
             message: The temporary message to show
             duration: Duration in milliseconds to show the message
         """
-        # Store the current message
-        current_message = self.status_var.get()
+        # Overlapping temporaries share one revert back to the original message
+        if self._temp_after_id is not None:
+            self.frame.after_cancel(self._temp_after_id)
+        else:
+            self._pretemp_status = self._get_status()
         
         # Set the temporary message
         self.set_status(message)
         
         # Schedule revert to original message
-        self.frame.after(duration, lambda: self.set_status(current_message))
+        self._temp_after_id = self.frame.after(duration, self._restore_temp)
         
-        self.logger.debug(f"Temporary message shown: {message} (duration: {duration}ms)")
+        self.logger.debug("Temporary message shown: %s (duration: %sms)", message, duration)
+    
+    def _restore_temp(self):
+        """Restore the status shown before show_temporary_message."""
+        message = self._pretemp_status or ""
+        self._temp_after_id = None
+        self._pretemp_status = None
+        self.set_status(message)
     
     # State Management
     def on_state_changed(self, event: str):
@@ -178,39 +313,32 @@ class StatusBar:
         Args:
             event: The type of state change event
         """
-        try:
-            if not self.controller:
-                return
-            
-            state = self.controller.get_state()
-            
-            if event == "processing_status_changed":
-                self.set_status(state.processing_status)
-            
-            elif event == "processing_progress_changed":
-                # Show progress bar if processing
-                is_processing = state.processing_status not in ["Ready", "idle"]
-                self.set_progress(state.processing_progress, is_processing)
-            
-            elif event == "datasets_changed":
-                datasets = state.datasets
-                selected = state.selected_datasets
-                loaded_count = len([d for d in datasets.values() 
-                                  if hasattr(d, 'status') and d.status.value == 'loaded'])
-                self.set_dataset_count(len(datasets), len(selected), loaded_count)
-            
-            elif event == "selection_changed":
-                datasets = state.datasets
-                selected = state.selected_datasets
-                loaded_count = len([d for d in datasets.values() 
-                                  if hasattr(d, 'status') and d.status.value == 'loaded'])
-                self.set_dataset_count(len(datasets), len(selected), loaded_count)
-            
-            elif event == "view_changed":
-                self.set_current_view(state.current_view)
-            
-        except Exception as e:
-            self.logger.error(f"Error handling state change '{event}': {e}")
+        # Errors propagate to the model's per-observer guard
+        handler = self._handlers.get(event)
+        if handler is None or not self.controller:
+            return
+        handler(self.controller.get_state())
+    
+    def _handle_processing_status(self, state: Any):
+        self.set_status(state.processing_status)
+    
+    def _handle_processing_progress(self, state: Any):
+        # Show progress bar if processing
+        is_processing = state.processing_status not in ["Ready", "idle"]
+        self.set_progress(state.processing_progress, is_processing)
+    
+    def _handle_dataset_counts(self, state: Any):
+        # loaded_dataset_count is cached by the model between dataset changes
+        self.set_dataset_count(len(state.datasets), state.selected_dataset_count,
+                               state.loaded_dataset_count)
+    
+    def _handle_dataset_loaded(self, state: Any):
+        # A load updates the status message and the loaded count together
+        self._handle_processing_status(state)
+        self._handle_dataset_counts(state)
+    
+    def _handle_view_changed(self, state: Any):
+        self.set_current_view(state.current_view)
     
     # Utility Methods
     def clear_progress(self):
@@ -223,8 +351,10 @@ class StatusBar:
         self.progress_bar.start(10)  # 10ms interval
         
         # Show the progress bar
-        if not self.progress_bar.winfo_ismapped():
-            self.progress_bar.pack(side="right", padx=(5, 10), pady=2)
+        self._set_progress_visible(True)
+        # The animation steps the bound variable, so forget the mirrored value
+        self._last.pop('progress', None)
+        self._progress_value = -1.0
     
     def stop_pulse_progress(self):
         """Stop the indeterminate progress animation."""
@@ -240,23 +370,16 @@ class StatusBar:
             message: The message to flash
             flash_count: Number of times to flash
         """
-        current_message = self.status_var.get()
-        
-        def flash_toggle(count_remaining: int, showing_flash: bool):
-            if count_remaining <= 0:
-                self.set_status(current_message)
-                return
-            
-            if showing_flash:
-                self.set_status(current_message)
-            else:
-                self.set_status(message)
-            
-            # Schedule next toggle
-            self.frame.after(500, lambda: flash_toggle(
-                count_remaining - (1 if showing_flash else 0),
-                not showing_flash
-            ))
-        
-        # Start flashing
-        flash_toggle(flash_count, False)
+        self._cancel_flash()
+        current_message = self._get_status()
+        
+        # Alternate message / original text, then leave the original in place
+        steps = [message, current_message] * flash_count
+        if not steps:
+            return
+        for step, text in enumerate(steps[:-1]):
+            self._flash_after_ids.append(
+                self.frame.after(step * self._flash_interval_ms, self._set_status_text, text))
+        # The final step clears the id list so it never holds fired timers
+        self._flash_after_ids.append(
+            self.frame.after((len(steps) - 1) * self._flash_interval_ms, self._finish_flash, steps[-1]))
@@ -6,14 +6,20 @@ between the model (ApplicationState) and view (MainWindow) components.
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import partial
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, messagebox
 import threading
+import os
+import sys
 
 from ..models.application_state import ApplicationState, DatasetInfo, DatasetStatus
 from ..utils.dataset_scanner import DatasetScanner
 from ..business.data_interface import MockDataInterface
+from ..utils.schema_access import get_col
 
 
 class ApplicationController:
@@ -34,6 +40,23 @@ class ApplicationController:
         self.view = view
         self.logger = logging.getLogger(__name__)
         
+        # Bounded pool for directory scans and dataset loads
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ac-io")
+        
+        # Generation of the current directory scan; results from older scans are dropped
+        self._scan_gen = 0
+        self._scan_cancel: Optional[threading.Event] = None
+        
+        # Last completed scan: (directory, directory mtime_ns, unloaded DatasetInfo copies)
+        self._last_scan: Optional[Tuple[Path, int, List[DatasetInfo]]] = None
+        
+        # Latest status posted by worker threads, applied once per UI queue drain
+        self._pending_status: Optional[str] = None
+        self._status_lock = threading.Lock()
+        
+        # Scanned datasets are published to the model in batches of this size
+        self._dataset_batch_size = 128
+        
         # Initialize business logic components
         self.dataset_scanner = DatasetScanner()
         self.data_interface = MockDataInterface()
@@ -68,15 +91,8 @@ class ApplicationController:
         Args:
             event: The type of state change event
         """
-        try:
-            self.logger.debug(f"Handling state change: {event}")
-            
-            # Forward the event to the view
-            if hasattr(self.view, 'on_state_changed'):
-                self.view.on_state_changed(event)
-            
-        except Exception as e:
-            self.logger.error(f"Error handling state change '{event}': {e}")
+        # The view subscribes its components to the model directly, so events are not forwarded
+        self.logger.debug("Handling state change: %s", event)
     
     # View Event Handlers
     def on_window_close(self):
@@ -108,7 +124,8 @@ class ApplicationController:
             )
             
             if directory_path:
-                self.load_dataset_directory(directory_path)
+                # Let Tk repaint behind the closed dialog before the scan starts
+                self.view.get_root().after(0, self.load_dataset_directory, directory_path)
             else:
                 self.logger.debug("Directory selection cancelled")
             
@@ -166,47 +183,146 @@ class ApplicationController:
             # Add to recent directories
             self.model.add_recent_directory(directory_path)
             
+            # Stop any scan still running for a previously opened directory
+            if self._scan_cancel is not None:
+                self._scan_cancel.set()
+            self._scan_cancel = threading.Event()
+            self._scan_gen += 1
+            
             # Clear existing datasets
             self.model.clear_datasets()
             
-            # Scan for datasets in a separate thread to avoid blocking UI
-            threading.Thread(
-                target=self._scan_datasets_thread,
-                args=(Path(directory_path),),
-                daemon=True
-            ).start()
+            # Scan for datasets on the worker pool to avoid blocking UI
+            self._pool.submit(self._scan_datasets_thread, Path(directory_path),
+                              self._scan_gen, self._scan_cancel)
             
         except Exception as e:
             self.logger.error(f"Error loading dataset directory: {e}")
             self.view.show_error("Error", f"Failed to load directory: {e}")
             self.model.processing_status = "Ready"
     
-    def _scan_datasets_thread(self, directory_path: Path):
+    def _post_to_ui(self, callback: Callable[[], Any]):
+        """
+        Run a model update on the Tk thread.
+        
+        Worker threads call this instead of mutating the model, whose observers
+        update widgets. Falls back to a direct call if the view can't queue.
+        
+        Args:
+            callback: Callable taking no arguments
+        """
+        post = getattr(self.view, 'post', None)
+        if post is not None:
+            post(callback)
+        else:
+            callback()
+    
+    def _post_status(self, status: str):
+        """
+        Post a processing status from a worker thread.
+        
+        Statuses posted before the UI queue next drains are collapsed, so
+        only the latest one reaches the model and its observers.
+        
+        Args:
+            status: The status message
+        """
+        with self._status_lock:
+            already_posted = self._pending_status is not None
+            self._pending_status = status
+        if not already_posted:
+            self._post_to_ui(self._flush_pending_status)
+    
+    def _flush_pending_status(self):
+        """Apply the latest posted status on the Tk thread."""
+        with self._status_lock:
+            status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self.model.processing_status = status
+    
+    def _add_scanned_datasets(self, generation: int, datasets: List[DatasetInfo]):
+        """Add a scanned batch on the Tk thread unless a newer scan has started."""
+        if generation == self._scan_gen:
+            self.model.add_datasets(datasets)
+    
+    def _scan_datasets_thread(self, directory_path: Path, generation: int,
+                              cancel_event: threading.Event):
         """
         Scan for datasets in a background thread.
         
         Args:
             directory_path: Path to scan for datasets
+            generation: Scan generation; results are dropped once it is stale
+            cancel_event: Set when a newer scan supersedes this one
         """
         try:
-            # Discover datasets
-            datasets = self.dataset_scanner.scan_directory(directory_path)
-            
-            # Add discovered datasets to the model
-            for dataset_info in datasets:
-                self.model.add_dataset(dataset_info)
+            # Taken before scanning so changes made during the scan invalidate the cache
+            mtime_ns = os.stat(directory_path).st_mtime_ns
+            
+            # Discover datasets, handing them to the model on the Tk thread one batch at a time
+            batch_size = self._dataset_batch_size
+            batch: List[DatasetInfo] = []
+            scanned: List[DatasetInfo] = []
+            found = 0
+            for dataset_info in self.dataset_scanner.iter_directory(directory_path, cancel_event):
+                batch.append(dataset_info)
+                # Keep an untouched copy; the model's instance is mutated when loaded
+                scanned.append(replace(dataset_info))
+                found += 1
+                if len(batch) >= batch_size:
+                    self._post_to_ui(partial(self._add_scanned_datasets, generation, batch))
+                    self._post_status(f"Found {found} datasets so far...")
+                    batch = []
+            if cancel_event.is_set():
+                self.logger.info(f"Scan of {directory_path} superseded, stopping")
+                return
+            if batch:
+                self._post_to_ui(partial(self._add_scanned_datasets, generation, batch))
+            self._post_to_ui(partial(self._remember_scan, generation, directory_path, mtime_ns, scanned))
             
             # Update status
-            if datasets:
-                self.model.processing_status = f"Found {len(datasets)} datasets"
-                self.logger.info(f"Successfully loaded {len(datasets)} datasets")
+            if found:
+                self._post_status(f"Found {found} datasets")
+                self.logger.info(f"Successfully loaded {found} datasets")
             else:
-                self.model.processing_status = "No datasets found"
+                self._post_status("No datasets found")
                 self.logger.warning("No valid datasets found in directory")
             
         except Exception as e:
             self.logger.error(f"Error scanning for datasets: {e}")
-            self.model.processing_status = f"Error: {str(e)}"
+            if not cancel_event.is_set():
+                self._post_status(f"Error: {str(e)}")
+    
+    def _remember_scan(self, generation: int, directory_path: Path, mtime_ns: int,
+                       datasets: List[DatasetInfo]):
+        """Record a completed scan so refresh_datasets can reuse it."""
+        if generation == self._scan_gen:
+            self._last_scan = (directory_path, mtime_ns, datasets)
+    
+    def _cached_scan(self, directory_path: Path) -> Optional[List[DatasetInfo]]:
+        """
+        Get the last scan's results if the directory hasn't changed since.
+        
+        Only the directory's own mtime is compared, so datasets being added,
+        removed or renamed invalidate the cache but edits inside them do not.
+        
+        Args:
+            directory_path: Directory about to be rescanned
+            
+        Returns:
+            Unloaded DatasetInfo copies, or None if a scan is needed
+        """
+        if self._last_scan is None:
+            return None
+        last_path, last_mtime_ns, datasets = self._last_scan
+        if last_path != directory_path or not datasets:
+            return None
+        try:
+            if os.stat(directory_path).st_mtime_ns != last_mtime_ns:
+                return None
+        except OSError:
+            return None
+        return datasets
     
     def load_single_dataset(self, dataset_name: str):
         """
@@ -224,15 +340,10 @@ class ApplicationController:
             self.model.processing_status = f"Loading {dataset_name}..."
             
             # Update dataset status
-            dataset_info.status = DatasetStatus.LOADING
-            self.model.add_dataset(dataset_info)  # Trigger update
+            self.model.set_dataset_status(dataset_name, DatasetStatus.LOADING)
             
-            # Load dataset in background thread
-            threading.Thread(
-                target=self._load_dataset_thread,
-                args=(dataset_info,),
-                daemon=True
-            ).start()
+            # Load dataset on the worker pool
+            self._pool.submit(self._load_dataset_thread, dataset_info)
             
         except Exception as e:
             self.logger.error(f"Error starting dataset load: {e}")
@@ -249,31 +360,94 @@ class ApplicationController:
         try:
             # Load the dataset using the data interface
             dataframes = self.data_interface.load_dataset(dataset_info.path)
+            track_summary = self._build_track_summary(
+                dataset_info, dataframes.get('tracks'), dataframes.get('truth'))
+        except Exception as e:
+            self.logger.error(f"Error loading dataset {dataset_info.name}: {e}")
+            self._post_to_ui(partial(self._apply_dataset_load_error, dataset_info, str(e)))
+            return
+        
+        # Publish the loaded data on the Tk thread
+        self._post_to_ui(partial(self._apply_loaded_dataset, dataset_info, dataframes, track_summary))
+    
+    def _apply_loaded_dataset(self, dataset_info: DatasetInfo, dataframes: Dict[str, Any],
+                              track_summary: Optional[Dict[str, Any]]):
+        """
+        Store freshly loaded DataFrames on the dataset and publish it to the model.
+        
+        Args:
+            dataset_info: Dataset information object
+            dataframes: DataFrames returned by the data interface
+            track_summary: Summary computed by _build_track_summary
+        """
+        try:
+            # Store the loaded data, mark it loaded and update the status in one model event
+            self.model.apply_loaded_dataset(
+                dataset_info.name,
+                dataframes.get('truth'),
+                dataframes.get('detections'),
+                dataframes.get('tracks'),
+                f"Loaded {dataset_info.name}",
+                track_summary,
+            )
+            self.logger.info(f"Successfully loaded dataset: {dataset_info.name}")
             
-            # Store the loaded data
-            dataset_info.truth_df = dataframes.get('truth')
-            dataset_info.detections_df = dataframes.get('detections')
-            dataset_info.tracks_df = dataframes.get('tracks')
+        except Exception as e:
+            self._apply_dataset_load_error(dataset_info, str(e))
+    
+    def _apply_dataset_load_error(self, dataset_info: DatasetInfo, message: str):
+        """
+        Mark a dataset as failed to load and publish it to the model.
+        
+        Args:
+            dataset_info: Dataset information object
+            message: Error message
+        """
+        self.logger.error(f"Error loading dataset {dataset_info.name}: {message}")
+        self.model.set_dataset_status(dataset_info.name, DatasetStatus.ERROR, message)
+        self.model.processing_status = f"Error loading {dataset_info.name}"
+    
+    def _build_track_summary(self, dataset_info: DatasetInfo, tracks_df: Any,
+                             truth_df: Any) -> Optional[Dict[str, Any]]:
+        """
+        Compute the sorted unique track/truth IDs of a freshly loaded dataset.
+        
+        Selection widgets reuse this summary instead of recomputing unique IDs
+        on every focus change.
+        
+        Args:
+            dataset_info: Dataset information object (for schema and name)
+            tracks_df: Loaded tracks DataFrame (or None)
+            truth_df: Loaded truth DataFrame (or None)
             
-            # Update status to loaded
-            dataset_info.status = DatasetStatus.LOADED
-            self.model.add_dataset(dataset_info)  # Trigger update
-
-            # Capture a read-only config snapshot for this dataset (CSV-based load)
+        Returns:
+            Summary dictionary, or None if it could not be computed
+        """
+        def _sorted_ids(df, role: str, logical_name: str):
+            if df is None or df.empty:
+                return 0, ()
+            col = get_col(dataset_info.schema, role, logical_name)
+            if col not in df.columns:
+                return len(df), ()
+            ids = df[col].unique().tolist()
             try:
-                self.model.capture_active_config_for_dataset(dataset_info.name)
-            except Exception as e:
-                self.logger.debug(f"Config snapshot capture skipped for {dataset_info.name}: {e}")
-            
-            self.model.processing_status = f"Loaded {dataset_info.name}"
-            self.logger.info(f"Successfully loaded dataset: {dataset_info.name}")
-            
+                ids.sort()
+            except TypeError:
+                pass
+            return len(df), tuple(ids)
+        
+        try:
+            n_track_rows, track_ids = _sorted_ids(tracks_df, 'tracks', 'track_id')
+            n_truth_rows, truth_ids = _sorted_ids(truth_df, 'truth', 'truth_id')
+            return {
+                'n_track_rows': n_track_rows,
+                'track_ids': track_ids,
+                'n_truth_rows': n_truth_rows,
+                'truth_ids': truth_ids,
+            }
         except Exception as e:
-            self.logger.error(f"Error loading dataset {dataset_info.name}: {e}")
-            dataset_info.status = DatasetStatus.ERROR
-            dataset_info.error_message = str(e)
-            self.model.add_dataset(dataset_info)  # Trigger update
-            self.model.processing_status = f"Error loading {dataset_info.name}"
+            self.logger.debug("Track summary skipped for %s: %s", dataset_info.name, e)
+            return None
     
     def process_datasets(self, dataset_names: list):
         """
@@ -310,7 +484,7 @@ class ApplicationController:
         try:
             self.model.focus_dataset = dataset_name
             if dataset_name:
-                self.logger.debug(f"Focus set to dataset: {dataset_name}")
+                self.logger.debug("Focus set to dataset: %s", dataset_name)
             else:
                 self.logger.debug("Focus cleared")
         except Exception as e:
@@ -324,7 +498,7 @@ class ApplicationController:
             dataset_name: Name of dataset to toggle
         """
         try:
-            if dataset_name in self.model.selected_datasets:
+            if self.model.is_dataset_selected(dataset_name):
                 self.model.remove_selected_dataset(dataset_name)
             else:
                 self.model.add_selected_dataset(dataset_name)
@@ -335,7 +509,20 @@ class ApplicationController:
         """Refresh the dataset list by rescanning the current directory."""
         try:
             if self.model.dataset_directory:
-                self.load_dataset_directory(str(self.model.dataset_directory))
+                directory_path = Path(self.model.dataset_directory)
+                cached = self._cached_scan(directory_path)
+                if cached is None:
+                    self.load_dataset_directory(str(directory_path))
+                    return
+                
+                # Directory unchanged: repopulate from the last scan without touching the disk
+                self.logger.info(f"Directory unchanged since last scan, reusing {len(cached)} datasets")
+                if self._scan_cancel is not None:
+                    self._scan_cancel.set()
+                self._scan_gen += 1
+                self.model.clear_datasets()
+                self.model.add_datasets([replace(info) for info in cached])
+                self.model.processing_status = f"Found {len(cached)} datasets"
             else:
                 self.logger.warning("No dataset directory set for refresh")
                 self.view.show_info("No Directory", "Please select a dataset directory first")
@@ -352,7 +539,19 @@ class ApplicationController:
             # Remove observer from model
             self.model.remove_observer(self)
             
-            # Any other cleanup operations
+            # Persist config changes still waiting on the write delay
+            self.model.flush_config_now()
+            
+            # Stop an in-flight scan: pool workers are joined at interpreter exit
+            if self._scan_cancel is not None:
+                self._scan_cancel.set()
+            
+            # Drop queued scans/loads (cancel_futures needs Python 3.9+);
+            # running ones finish on their own
+            if sys.version_info >= (3, 9):
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._pool.shutdown(wait=False)
             
             self.logger.debug("Cleanup complete")
             
@@ -369,7 +568,7 @@ class ApplicationController:
         """
         try:
             self.model.remove_recent_directory(directory_path)
-            self.logger.debug(f"Removed recent directory: {directory_path}")
+            self.logger.debug("Removed recent directory: %s", directory_path)
         except Exception as e:
             self.logger.error(f"Error removing recent directory: {e}")
     
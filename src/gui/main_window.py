@@ -8,9 +8,8 @@ application layout and coordinates the different panels.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Optional, Any
-
-from matplotlib import style
+import queue
+from typing import Optional, Any, Callable
 
 from ..components.menu_bar import MenuBar
 from ..components.status_bar import StatusBar
@@ -42,6 +41,9 @@ class MainWindow:
         self.status_bar: Optional[StatusBar] = None
         self.left_panel: Optional[LeftPanel] = None
         self.right_panel: Optional[RightPanel] = None
+        # Stands in for the right panel until it is built after the first paint
+        self._right_placeholder: Optional[ttk.Frame] = None
+
         
         # Layout frames
         self.main_frame: Optional[ttk.Frame] = None
@@ -52,13 +54,50 @@ class MainWindow:
         self.left_panel_visible = True
         self.right_panel_visible = True
         
+        # Whether each panel frame is currently a pane (avoids querying panes())
+        self._left_in_pane = False
+        self._right_in_pane = False
+        
+        # Callables posted by worker threads, run on the Tk thread
+        self._ui_queue: "queue.SimpleQueue[Callable[[], Any]]" = queue.SimpleQueue()
+        self._ui_queue_interval_ms = 50
+        
         # Initialize the window
         self._setup_window()
         self._create_layout()
         self._create_components()
         
+        self.root.after(self._ui_queue_interval_ms, self._drain_ui_queue)
+        
         self.logger.info("Main window initialized")
     
+    def post(self, callback: Callable[[], Any]):
+        """
+        Queue a callable to run on the Tk thread.
+        
+        Safe to call from any thread; worker threads use it instead of touching
+        the model (and therefore the widgets observing it) directly.
+        
+        Args:
+            callback: Callable taking no arguments
+        """
+        self._ui_queue.put(callback)
+    
+    def _drain_ui_queue(self):
+        """Run callables posted by worker threads, then reschedule."""
+        try:
+            while True:
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback()
+                except Exception as e:
+                    self.logger.error(f"Error running posted UI callback: {e}")
+        finally:
+            self.root.after(self._ui_queue_interval_ms, self._drain_ui_queue)
+    
     def set_controller(self, controller: Any):
         """
         Set the controller for this view.
@@ -68,22 +107,29 @@ class MainWindow:
         """
         self.controller = controller
         
-        # Register this view as an observer of the model to receive state change notifications
+        # Subscribe this view to the model events it handles
         if hasattr(controller, 'model'):
-            controller.model.add_observer(self)
+            controller.model.subscribe("panel_visibility_changed", self.on_state_changed)
         
-        # Pass controller to child components
-        if self.menu_bar:
-            self.menu_bar.set_controller(controller)
-        if self.status_bar:
-            self.status_bar.set_controller(controller)
-        if self.left_panel:
-            self.left_panel.set_controller(controller)
-        if self.right_panel:
-            self.right_panel.set_controller(controller)
+        # Pass controller to child components (the right panel may not be built yet)
+        for component in (self.menu_bar, self.status_bar, self.left_panel, self.right_panel):
+            if component:
+                self._attach_component(component)
         
         self.logger.debug("Controller set for main window and child components")
     
+    def _attach_component(self, component: Any):
+        """
+        Subscribe a child component to its model events and give it the controller.
+        
+        Args:
+            component: A child component declaring STATE_TOPICS
+        """
+        model = getattr(self.controller, 'model', None)
+        if model is not None and getattr(component, 'STATE_TOPICS', None):
+            model.add_observer(component)
+        component.set_controller(self.controller)
+    
     def _setup_window(self):
         """Setup the main window properties."""
         # Window properties
@@ -131,10 +177,6 @@ class MainWindow:
                                             # sashpad=2  # Add padding around the sash
         )
         self.paned_window.grid(row=0, column=0, sticky="nsew")
-        
-        # Configure content frame grid
-        self.content_frame.grid_rowconfigure(0, weight=1)
-        self.content_frame.grid_columnconfigure(0, weight=1)
     
     def _create_components(self):
         """Create all GUI components."""
@@ -150,10 +192,13 @@ class MainWindow:
             # Create left panel
             self.left_panel = LeftPanel(self.paned_window)
             self.paned_window.add(self.left_panel.frame, weight=1)
+            self._left_in_pane = True
             
-            # Create right panel
-            self.right_panel = RightPanel(self.paned_window)
-            self.paned_window.add(self.right_panel.frame, weight=3)  # Right panel gets more space initially
+            # Reserve the right pane; the panel itself is built once the window is idle
+            self._right_placeholder = ttk.Frame(self.paned_window)
+            self.paned_window.add(self._right_placeholder, weight=3)  # Right panel gets more space initially
+            self._right_in_pane = True
+            self.root.after_idle(self._create_right_panel)
             
             self.logger.debug("All GUI components created")
             
@@ -161,11 +206,38 @@ class MainWindow:
             self.logger.error(f"Error creating GUI components: {e}")
             raise
     
+    def _create_right_panel(self):
+        """Build the right panel in place of its startup placeholder."""
+        if self.right_panel is not None:
+            return
+        try:
+            self.right_panel = RightPanel(self.paned_window)
+        except Exception as e:
+            self.logger.error(f"Error creating right panel: {e}")
+            return
+        
+        placeholder, self._right_placeholder = self._right_placeholder, None
+        if self._right_in_pane:
+            self.paned_window.insert(placeholder, self.right_panel.frame, weight=3)
+            self.paned_window.forget(placeholder)
+        placeholder.destroy()
+        
+        if self.controller:
+            self._attach_component(self.right_panel)
+            # Catch up on dataset/focus events fired before the panel existed
+            self.right_panel.on_state_changed("datasets_changed")
+        
+        self.logger.debug("Right panel created")
+    
     def _on_window_close(self):
         """Handle window close event."""
         try:
             self.logger.info("Window close requested")
             
+            # Stop background plot computations before the controller shuts down
+            if self.right_panel is not None:
+                self.right_panel.destroy()
+            
             # Ask controller to handle shutdown
             if self.controller and hasattr(self.controller, 'on_window_close'):
                 self.controller.on_window_close()
@@ -190,14 +262,16 @@ class MainWindow:
             
             if visible:
                 # Re-add the left panel to the paned window
-                if self.left_panel.frame not in self.paned_window.panes():
+                if not self._left_in_pane:
                     self.paned_window.insert(0, self.left_panel.frame, weight=1)
+                    self._left_in_pane = True
             else:
                 # Remove the left panel from the paned window
-                if self.left_panel.frame in self.paned_window.panes():
+                if self._left_in_pane:
                     self.paned_window.remove(self.left_panel.frame)
+                    self._left_in_pane = False
             
-            self.logger.debug(f"Left panel visibility: {visible}")
+            self.logger.debug("Left panel visibility: %s", visible)
     
     def set_right_panel_visible(self, visible: bool):
         """
@@ -206,19 +280,23 @@ class MainWindow:
         Args:
             visible: Whether the right panel should be visible
         """
-        if visible != self.right_panel_visible and self.right_panel:
+        # Before the right panel is built, its placeholder holds the pane
+        pane = self.right_panel.frame if self.right_panel else self._right_placeholder
+        if visible != self.right_panel_visible and pane is not None:
             self.right_panel_visible = visible
             
             if visible:
                 # Re-add the right panel to the paned window
-                if self.right_panel.frame not in self.paned_window.panes():
-                    self.paned_window.add(self.right_panel.frame, weight=3)
+                if not self._right_in_pane:
+                    self.paned_window.add(pane, weight=3)
+                    self._right_in_pane = True
             else:
                 # Remove the right panel from the paned window
-                if self.right_panel.frame in self.paned_window.panes():
-                    self.paned_window.remove(self.right_panel.frame)
+                if self._right_in_pane:
+                    self.paned_window.remove(pane)
+                    self._right_in_pane = False
             
-            self.logger.debug(f"Right panel visibility: {visible}")
+            self.logger.debug("Right panel visibility: %s", visible)
     
     # State Update Methods (called by controller)
     def on_state_changed(self, event: str):
@@ -236,11 +314,7 @@ class MainWindow:
                     self.set_left_panel_visible(state.left_panel_visible)
                     self.set_right_panel_visible(state.right_panel_visible)
             
-            # Forward event to child components
-            components = [self.menu_bar, self.status_bar, self.left_panel, self.right_panel]
-            for component in components:
-                if component and hasattr(component, 'on_state_changed'):
-                    component.on_state_changed(event)
+            # Child components receive their events through their own model subscriptions
             
         except Exception as e:
             self.logger.error(f"Error handling state change '{event}': {e}")
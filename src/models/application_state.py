@@ -5,25 +5,87 @@ This module contains the application state that represents the data model
 for the entire application following the MVC pattern.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Any
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from enum import Enum
-import pandas as pd
+from enum import IntEnum
+import atexit
+import functools
 import json
+import sys
+import threading
+import types
+import weakref
 from ..utils.config_loader import ConfigLoader
 
+if TYPE_CHECKING:
+    # Only needed for annotations; loaded DataFrames come from the data interface
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetStatus(IntEnum):
+    """
+    Enumeration for dataset status.
+    
+    Integer-valued so status checks compare as plain ints; use ``label``
+    for the display/serialization string.
+    """
+    UNKNOWN = 0
+    AVAILABLE = 1
+    LOADING = 2
+    LOADED = 3
+    ERROR = 4
+
+    @property
+    def label(self) -> str:
+        """Lower-case string form of the status (e.g. "loaded")."""
+        return _STATUS_LABELS[self]
+
+
+_STATUS_LABELS: Dict[DatasetStatus, str] = {status: status.name.lower() for status in DatasetStatus}
 
-class DatasetStatus(Enum):
-    """Enumeration for dataset status."""
-    UNKNOWN = "unknown"
-    AVAILABLE = "available"
-    LOADING = "loading"
-    LOADED = "loaded"
-    ERROR = "error"
+
+class _StrongRef:
+    """Strong stand-in for a weakref, for subscribed callables that are not bound methods."""
+    __slots__ = ('_callback',)
+    
+    def __init__(self, callback: Callable[[str], None]):
+        self._callback = callback
+    
+    def __call__(self) -> Callable[[str], None]:
+        return self._callback
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve_directory(directory_path: str) -> str:
+    """Resolve a directory path to an absolute string, caching the filesystem lookup."""
+    return str(Path(directory_path).resolve())
+
+
+def _with_slots(cls):
+    """
+    Recreate a dataclass with __slots__ for its fields.
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10; the
+    generated __init__ carries the defaults, so the class attributes that
+    would clash with the slots can be dropped.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_with_slots
 @dataclass
 class DatasetInfo:
     """Information about a single dataset."""
@@ -47,6 +109,21 @@ class DatasetInfo:
     schema: Optional[Dict[str, Dict[str, str]]] = None
     # Capability flags (e.g., 'precomputed_errors')
     capabilities: List[str] = field(default_factory=list)
+    # Summary computed once at load time: n_track_rows, track_ids, n_truth_rows, truth_ids
+    track_summary: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the dataset's fields as a shallow dict.
+        
+        Unlike dataclasses.asdict this does not deep-copy values, so loaded
+        DataFrames are returned by reference.
+        """
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
+
+
+# Field names resolved once, for to_dict and other serialization
+DatasetInfo._FIELD_NAMES = tuple(f.name for f in fields(DatasetInfo))
 
 
 class ApplicationState:
@@ -57,15 +134,30 @@ class ApplicationState:
     application data and providing methods to modify it safely.
     """
     
+    # Processing progress is stored in steps of this size (0.5%), so smaller
+    # changes don't notify observers
+    progress_epsilon: float = 0.005
+    
+    # Shared module logger; the model is a singleton so no per-instance logger is needed
+    logger = logger
+    
     def __init__(self):
         """Initialize the application state."""
-        self.logger = logging.getLogger(__name__)
-
         # Dataset management
         self._dataset_directory: Optional[Path] = None
+        # String form of the dataset directory, compared instead of Path objects
+        self._dataset_directory_str: Optional[str] = None
         self._datasets: Dict[str, DatasetInfo] = {}
-        self._selected_datasets: List[str] = []
+        self._datasets_view: Mapping[str, DatasetInfo] = types.MappingProxyType(self._datasets)
+        # Insertion-ordered set of selected names (dict keys give O(1) membership)
+        self._selected_datasets: Dict[str, None] = {}
+        # Tuple snapshot of the selection, rebuilt lazily after it changes
+        self._selected_tuple: Optional[Tuple[str, ...]] = None
         self._focus_dataset: Optional[str] = None
+        # Number of loaded datasets, kept current as datasets are added, removed or change status
+        self._loaded_dataset_count: int = 0
+        # Names added by the most recent add_datasets batch
+        self._last_added_datasets: List[str] = []
 
         # UI state
         self._current_view: str = "overview"
@@ -76,11 +168,21 @@ class ApplicationState:
         self._processing_status: str = "idle"
         self._processing_progress: float = 0.0
 
-        # Observers for state changes (for MVC communication)
-        self._observers: List[Any] = []
+        # Observers' on_state_changed methods (for MVC communication). Weakly held
+        # so a forgotten remove_observer doesn't keep an observer alive, and stored
+        # as a tuple that is replaced, never mutated, so notifying needs no copy
+        self._observers: Tuple["weakref.WeakMethod[Callable[[str], None]]", ...] = ()
+        # id(observer) -> its weak callback, for O(1) duplicate checks and removal
+        # (covers observers registered for all events and for specific ones)
+        self._observer_ids: Dict[int, "weakref.WeakMethod[Callable[[str], None]]"] = {}
+        # Topic subscriptions: event name -> references to callbacks taking the event
+        # name; bound methods are held weakly like observers, see subscribe()
+        self._subscribers: Dict[str, Tuple[Callable[[], Optional[Callable[[str], None]]], ...]] = {}
 
         # Recent directories (limited to 5 most recent, persistent across sessions)
         self._recent_directories: List[str] = []
+        # Tuple snapshot of the recent directories, rebuilt lazily after they change
+        self._recent_tuple: Optional[Tuple[str, ...]] = None
         self._max_recent_directories: int = 5
 
         # Per-dataset configuration snapshots (read-only display)
@@ -90,6 +192,18 @@ class ApplicationState:
         # Config management
         self._config_loader = ConfigLoader(self.logger)
         self._config_path: Path = (Path(__file__).resolve().parents[2] / "config.yaml")
+        # Serializes config.yaml read-modify-write saves (queued writes flush off-thread)
+        self._config_lock = threading.RLock()
+        # Last parsed config keyed by the file's (mtime_ns, size); treat as read-only
+        self._config_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
+        # Legacy recent-directories store, only read (and removed) when migrating
+        self._legacy_recent_file: Path = Path.home() / ".data_analysis_app" / "recent_directories.json"
+        
+        # Config writes are merged and flushed as one save after a quiet period
+        self._config_save_delay_s = 0.25
+        self._config_save_timer: Optional[threading.Timer] = None
+        self._pending_config: Dict[str, Any] = {}
+        atexit.register(self.flush_config_now)
 
         # Application configuration (loaded at startup)
         # ForceUpdate: whether to reprocess datasets even if .pkl files exist
@@ -122,10 +236,10 @@ class ApplicationState:
     def force_update(self, value: bool):
         if value != self._force_update:
             self._force_update = bool(value)
-            self.logger.debug(f"Config changed: force_update={self._force_update}")
+            self.logger.debug("Config changed: force_update=%s", self._force_update)
             # Persist to config file
             try:
-                self._config_loader.save(self._config_path, {"ForceUpdate": self._force_update})
+                self._queue_config_write({"ForceUpdate": self._force_update})
             except Exception as e:
                 self.logger.warning(f"Failed to persist ForceUpdate: {e}")
             self._notify_observers("config_changed")
@@ -143,9 +257,9 @@ class ApplicationState:
     def metric(self, value: str):
         if value and value != self._metric:
             self._metric = str(value)
-            self.logger.debug(f"Config changed: metric={self._metric}")
+            self.logger.debug("Config changed: metric=%s", self._metric)
             try:
-                self._config_loader.save(self._config_path, {"Metric": self._metric})
+                self._queue_config_write({"Metric": self._metric})
             except Exception as e:
                 self.logger.warning(f"Failed to persist Metric: {e}")
             self._notify_observers("config_changed")
@@ -158,9 +272,9 @@ class ApplicationState:
     def method(self, value: str):
         if value and value != self._method:
             self._method = str(value)
-            self.logger.debug(f"Config changed: method={self._method}")
+            self.logger.debug("Config changed: method=%s", self._method)
             try:
-                self._config_loader.save(self._config_path, {"Method": self._method})
+                self._queue_config_write({"Method": self._method})
             except Exception as e:
                 self.logger.warning(f"Failed to persist Method: {e}")
             self._notify_observers("config_changed")
@@ -173,9 +287,9 @@ class ApplicationState:
             v = self._distance_threshold
         if v != self._distance_threshold:
             self._distance_threshold = v
-            self.logger.debug(f"Config changed: distance_threshold={self._distance_threshold}")
+            self.logger.debug("Config changed: distance_threshold=%s", self._distance_threshold)
             try:
-                self._config_loader.save(self._config_path, {"DistanceThreshold": self._distance_threshold})
+                self._queue_config_write({"DistanceThreshold": self._distance_threshold})
             except Exception as e:
                 self.logger.warning(f"Failed to persist DistanceThreshold: {e}")
             self._notify_observers("config_changed")
@@ -189,55 +303,127 @@ class ApplicationState:
     @dataset_directory.setter
     def dataset_directory(self, path: Optional[Path]):
         """Set the dataset directory and notify observers."""
-        if path != self._dataset_directory:
+        path_str = str(path) if path is not None else None
+        if path_str != self._dataset_directory_str:
             self._dataset_directory = path
-            self.logger.info(f"Dataset directory set to: {path}")
+            self._dataset_directory_str = path_str
+            self.logger.info("Dataset directory set to: %s", path)
             # Persist to config and maintain recent list
             try:
-                if path is not None:
+                if path_str is not None:
                     # Persist as string to YAML
-                    self._config_loader.save(self._config_path, {"DatasetDirectory": str(Path(path))})
-                    self.add_recent_directory(str(path))
+                    self._queue_config_write({"DatasetDirectory": path_str})
+                    self.add_recent_directory(path_str)
             except Exception as e:
                 self.logger.warning(f"Failed to persist DatasetDirectory: {e}")
             self._notify_observers("dataset_directory_changed")
     
     # Dataset Management
     @property
-    def datasets(self) -> Dict[str, DatasetInfo]:
-        """Get all datasets."""
-        return self._datasets.copy()
+    def datasets(self) -> Mapping[str, DatasetInfo]:
+        """Get all datasets (a read-only live view)."""
+        return self._datasets_view
     
     def add_dataset(self, dataset_info: DatasetInfo):
         """Add a dataset to the collection."""
+        # Interned keys let lookups with interned names match by identity
+        dataset_info.name = sys.intern(dataset_info.name)
+        previous = self._datasets.get(dataset_info.name)
         self._datasets[dataset_info.name] = dataset_info
-        self.logger.debug(f"Added dataset: {dataset_info.name}")
+        self._loaded_dataset_count += self._loaded_delta(previous, dataset_info)
+        self.logger.debug("Added dataset: %s", dataset_info.name)
         self._notify_observers("datasets_changed")
     
+    def add_datasets(self, datasets: List[DatasetInfo]):
+        """
+        Add several datasets with a single notification.
+        
+        Fires "datasets_batch_added" (new names listed in last_added_datasets),
+        or "datasets_changed" if the batch replaces existing datasets.
+        """
+        if not datasets:
+            return
+        replaced = any(d.name in self._datasets for d in datasets)
+        for dataset_info in datasets:
+            dataset_info.name = sys.intern(dataset_info.name)
+        batch = {d.name: d for d in datasets}
+        self._loaded_dataset_count += sum(self._loaded_delta(self._datasets.get(name), d)
+                                          for name, d in batch.items())
+        # update() from a sized dict grows the table once for the whole batch
+        self._datasets.update(batch)
+        self._last_added_datasets = [d.name for d in datasets]
+        self.logger.debug("Added %s datasets", len(datasets))
+        self._notify_observers("datasets_changed" if replaced else "datasets_batch_added")
+    
+    @property
+    def last_added_datasets(self) -> List[str]:
+        """Get the names added by the most recent add_datasets batch."""
+        return list(self._last_added_datasets)
+    
+    def apply_loaded_dataset(self, dataset_name: str, truth_df: Optional[pd.DataFrame],
+                             detections_df: Optional[pd.DataFrame], tracks_df: Optional[pd.DataFrame],
+                             status_message: str, track_summary: Optional[Dict[str, Any]] = None):
+        """
+        Store a freshly loaded dataset's DataFrames and mark it loaded.
+        
+        The dataset update, its config snapshot and the processing status are
+        published together as a single "dataset_loaded" event.
+        
+        Args:
+            dataset_name: Name of the loaded dataset
+            truth_df: Loaded truth DataFrame (or None)
+            detections_df: Loaded detections DataFrame (or None)
+            tracks_df: Loaded tracks DataFrame (or None)
+            status_message: Processing status to show once loaded
+            track_summary: Optional precomputed track/truth ID summary
+        """
+        dataset_info = self._datasets.get(dataset_name)
+        if dataset_info is None:
+            self.logger.warning(f"Loaded data for unknown dataset: {dataset_name}")
+            return
+        
+        dataset_info.truth_df = truth_df
+        dataset_info.detections_df = detections_df
+        dataset_info.tracks_df = tracks_df
+        dataset_info.track_summary = track_summary
+        self._apply_status(dataset_info, DatasetStatus.LOADED)
+        
+        # Read-only config snapshot for this dataset (CSV-based load)
+        self.capture_active_config_for_dataset(dataset_name, notify=False)
+        
+        self._processing_status = status_message
+        self.logger.debug("Dataset loaded: %s", dataset_name)
+        self._notify_observers("dataset_loaded")
+    
     def remove_dataset(self, dataset_name: str):
         """Remove a dataset from the collection."""
-        if dataset_name in self._datasets:
-            del self._datasets[dataset_name]
-            
-            # Clean up related state
-            if dataset_name in self._selected_datasets:
-                self._selected_datasets.remove(dataset_name)
-            
-            if self._focus_dataset == dataset_name:
-                self._focus_dataset = None
+        dataset_name = sys.intern(dataset_name)
+        removed = self._datasets.pop(dataset_name, None)
+        if removed is None:
+            return
+        self._loaded_dataset_count += self._loaded_delta(removed, None)
+        
+        # Clean up related state
+        if dataset_name in self._selected_datasets:
+            self._selected_datasets.pop(dataset_name)
+            self._selected_tuple = None
+        
+        if self._focus_dataset == dataset_name:
+            self._focus_dataset = None
 
-            # Remove any associated config snapshot
-            if dataset_name in self._dataset_configs:
-                del self._dataset_configs[dataset_name]
-                self._notify_observers("dataset_config_changed")
-            
-            self.logger.debug(f"Removed dataset: {dataset_name}")
-            self._notify_observers("datasets_changed")
+        # Remove any associated config snapshot
+        if self._dataset_configs.pop(dataset_name, None) is not None:
+            self._notify_observers("dataset_config_changed")
+        
+        self.logger.debug("Removed dataset: %s", dataset_name)
+        self._notify_observers("datasets_changed")
     
     def clear_datasets(self):
         """Clear all datasets."""
         self._datasets.clear()
+        self._loaded_dataset_count = 0
         self._selected_datasets.clear()
+        self._selected_tuple = None
         self._focus_dataset = None
         self._dataset_configs.clear()
         self.logger.info("All datasets cleared")
@@ -246,32 +432,108 @@ class ApplicationState:
         self._notify_observers("datasets_changed")
         self._notify_observers("dataset_config_changed")
     
+    def set_dataset_status(self, dataset_name: str, status: DatasetStatus,
+                           error_message: Optional[str] = None):
+        """
+        Change a dataset's status and notify observers.
+        
+        Prefer this over assigning DatasetInfo.status directly, so the loaded
+        dataset count stays current without a rescan.
+        
+        Args:
+            dataset_name: Name of the dataset
+            status: New status
+            error_message: Optional error message to record (for ERROR)
+        """
+        dataset_info = self._datasets.get(sys.intern(dataset_name))
+        if dataset_info is None:
+            self.logger.warning(f"Cannot set status of non-existent dataset: {dataset_name}")
+            return
+        self._apply_status(dataset_info, status)
+        if error_message is not None:
+            dataset_info.error_message = error_message
+        self.logger.debug("Dataset %s status: %s", dataset_name, status.label)
+        self._notify_observers("datasets_changed")
+    
+    def _apply_status(self, dataset_info: DatasetInfo, status: DatasetStatus):
+        """Set a dataset's status, adjusting the cached loaded count on LOADED transitions."""
+        was_loaded = dataset_info.status is DatasetStatus.LOADED
+        dataset_info.status = status
+        self._loaded_dataset_count += (status is DatasetStatus.LOADED) - was_loaded
+    
+    @staticmethod
+    def _loaded_delta(old: Optional[DatasetInfo], new: Optional[DatasetInfo]) -> int:
+        """Change in the loaded count when ``old`` is replaced by ``new`` (either may be None)."""
+        return ((new is not None and new.status is DatasetStatus.LOADED)
+                - (old is not None and old.status is DatasetStatus.LOADED))
+    
+    @property
+    def loaded_dataset_count(self) -> int:
+        """
+        Get the number of loaded datasets.
+        
+        Maintained incrementally by add/remove/clear and status changes made
+        through set_dataset_status/apply_loaded_dataset, so this is O(1).
+        """
+        return self._loaded_dataset_count
+    
     # Dataset Selection Management
     @property
-    def selected_datasets(self) -> List[str]:
-        """Get list of selected dataset names."""
-        return self._selected_datasets.copy()
+    def selected_datasets(self) -> Tuple[str, ...]:
+        """Get the selected dataset names, in selection order."""
+        if self._selected_tuple is None:
+            self._selected_tuple = tuple(self._selected_datasets)
+        return self._selected_tuple
+    
+    @property
+    def selected_dataset_count(self) -> int:
+        """Get the number of selected datasets without copying the selection."""
+        return len(self._selected_datasets)
+    
+    def is_dataset_selected(self, dataset_name: str) -> bool:
+        """Check whether a dataset is selected."""
+        return dataset_name in self._selected_datasets
     
     def add_selected_dataset(self, dataset_name: str):
         """Add a dataset to the selection."""
+        dataset_name = sys.intern(dataset_name)
         if dataset_name in self._datasets and dataset_name not in self._selected_datasets:
-            self._selected_datasets.append(dataset_name)
-            self.logger.debug(f"Selected dataset: {dataset_name}")
+            self._selected_datasets[dataset_name] = None
+            self._selected_tuple = None
+            self.logger.debug("Selected dataset: %s", dataset_name)
             self._notify_observers("selection_changed")
     
+    def add_selected_datasets(self, dataset_names: Iterable[str]):
+        """Add several datasets to the selection with a single notification."""
+        added = [name for name in map(sys.intern, dataset_names)
+                 if name in self._datasets and name not in self._selected_datasets]
+        if not added:
+            return
+        self._selected_datasets.update(dict.fromkeys(added))
+        self._selected_tuple = None
+        self.logger.debug("Selected %s datasets", len(added))
+        self._notify_observers("selection_changed")
+    
     def remove_selected_dataset(self, dataset_name: str):
         """Remove a dataset from the selection."""
+        dataset_name = sys.intern(dataset_name)
         if dataset_name in self._selected_datasets:
-            self._selected_datasets.remove(dataset_name)
-            self.logger.debug(f"Deselected dataset: {dataset_name}")
+            del self._selected_datasets[dataset_name]
+            self._selected_tuple = None
+            self.logger.debug("Deselected dataset: %s", dataset_name)
             self._notify_observers("selection_changed")
     
     def set_selected_datasets(self, dataset_names: List[str]):
         """Set the complete list of selected datasets."""
         # Validate that all names exist
-        valid_names = [name for name in dataset_names if name in self._datasets]
-        self._selected_datasets = valid_names
-        self.logger.debug(f"Set selected datasets: {valid_names}")
+        valid_names = [name for name in map(sys.intern, dataset_names) if name in self._datasets]
+        selection = dict.fromkeys(valid_names)
+        if list(selection) == list(self._selected_datasets):
+            # Same names in the same order: nothing to notify
+            return
+        self._selected_datasets = selection
+        self._selected_tuple = None
+        self.logger.debug("Set selected datasets: %s", valid_names)
         self._notify_observers("selection_changed")
     
     # Focus Dataset Management
@@ -283,10 +545,12 @@ class ApplicationState:
     @focus_dataset.setter
     def focus_dataset(self, dataset_name: Optional[str]):
         """Set the focus dataset."""
+        if dataset_name is not None:
+            dataset_name = sys.intern(dataset_name)
         if dataset_name != self._focus_dataset:
             if dataset_name is None or dataset_name in self._datasets:
                 self._focus_dataset = dataset_name
-                self.logger.debug(f"Focus dataset set to: {dataset_name}")
+                self.logger.debug("Focus dataset set to: %s", dataset_name)
                 self._notify_observers("focus_changed")
             else:
                 self.logger.warning(f"Cannot set focus to non-existent dataset: {dataset_name}")
@@ -308,7 +572,7 @@ class ApplicationState:
         """Set the current view."""
         if view_name != self._current_view:
             self._current_view = view_name
-            self.logger.debug(f"Current view set to: {view_name}")
+            self.logger.debug("Current view set to: %s", view_name)
             self._notify_observers("view_changed")
     
     @property
@@ -346,7 +610,7 @@ class ApplicationState:
         """Set the processing status."""
         if status != self._processing_status:
             self._processing_status = status
-            self.logger.debug(f"Processing status: {status}")
+            self.logger.debug("Processing status: %s", status)
             self._notify_observers("processing_status_changed")
     
     @property
@@ -358,31 +622,120 @@ class ApplicationState:
     def processing_progress(self, progress: float):
         """Set the processing progress (0.0 to 1.0)."""
         progress = max(0.0, min(1.0, progress))  # Clamp to valid range
+        # Divide by a whole step count so values come out as exact decimals
+        steps = round(1 / self.progress_epsilon)
+        progress = round(progress * steps) / steps
         if progress != self._processing_progress:
             self._processing_progress = progress
             self._notify_observers("processing_progress_changed")
     
     # Observer Pattern for MVC Communication
-    def add_observer(self, observer: Any):
-        """Add an observer to be notified of state changes."""
-        if observer not in self._observers:
-            self._observers.append(observer)
-            self.logger.debug("Observer added")
+    def add_observer(self, observer: Any, events: Optional[Iterable[str]] = None):
+        """
+        Add an observer to be notified of state changes.
+        
+        The observer is held weakly and registered at most once, whether it
+        receives every event or only some.
+        
+        Args:
+            observer: Object with an on_state_changed(event) method
+            events: Events to deliver; None falls back to the observer's
+                STATE_TOPICS, and delivers every event if it has none
+        """
+        if id(observer) in self._observer_ids:
+            return
+        # Bind the callback once so notifying skips the attribute lookup
+        callback = getattr(observer, 'on_state_changed', None)
+        try:
+            ref = weakref.WeakMethod(callback, self._prune_observers)
+        except TypeError:
+            self.logger.warning(f"Observer {observer!r} has no on_state_changed method, ignoring")
+            return
+        self._observer_ids[id(observer)] = ref
+        
+        if events is None:
+            events = getattr(observer, 'STATE_TOPICS', None)
+        if events is None:
+            self._observers = self._observers + (ref,)
+        else:
+            # Deliver only the requested events, through the topic index
+            for event in events:
+                self._add_subscriber_ref(event, ref)
+        self.logger.debug("Observer added")
     
     def remove_observer(self, observer: Any):
-        """Remove an observer."""
-        if observer in self._observers:
-            self._observers.remove(observer)
+        """Remove an observer, including any per-event registrations."""
+        removed = self._observer_ids.pop(id(observer), None)
+        if removed is not None:
+            self._observers = tuple(ref for ref in self._observers if ref is not removed)
             self.logger.debug("Observer removed")
+        # Also drop callbacks of this observer passed to subscribe() directly
+        self._remove_subscriber_refs(
+            lambda ref: ref is removed or getattr(ref(), '__self__', None) is observer)
+    
+    def _prune_observers(self, _ref: "weakref.WeakMethod[Callable[[str], None]]"):
+        """Drop references to observers that have been garbage collected."""
+        self._observers = tuple(ref for ref in self._observers if ref() is not None)
+        self._observer_ids = {key: ref for key, ref in self._observer_ids.items() if ref() is not None}
+        self._remove_subscriber_refs(lambda ref: ref() is None)
+    
+    def subscribe(self, topic: str, callback: Callable[[str], None]):
+        """
+        Subscribe a callback to a single state change event.
+        
+        Bound methods are held weakly, like observers, so subscribing does not
+        keep their object alive. Other callables (functions, lambdas) are held
+        strongly until unsubscribe() is called.
+        
+        Args:
+            topic: The event name, e.g. "datasets_changed"
+            callback: Called with the event name when the event fires
+        """
+        if any(ref() == callback for ref in self._subscribers.get(topic, ())):
+            return
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback, self._prune_observers)
+        else:
+            ref = _StrongRef(callback)
+        self._add_subscriber_ref(topic, ref)
+    
+    def unsubscribe(self, topic: str, callback: Callable[[str], None]):
+        """Remove a callback subscribed to an event."""
+        callbacks = self._subscribers.get(topic, ())
+        remaining = tuple(ref for ref in callbacks if ref() != callback)
+        if len(remaining) != len(callbacks):
+            self._subscribers[topic] = remaining
+            self.logger.debug("Subscriber removed for %s", topic)
+    
+    def _add_subscriber_ref(self, topic: str, ref: Callable[[], Optional[Callable[[str], None]]]):
+        """Append a callback reference to a topic (copy-on-write, no duplicates)."""
+        refs = self._subscribers.get(topic, ())
+        if ref not in refs:
+            self._subscribers[topic] = refs + (ref,)
+            self.logger.debug("Subscriber added for %s", topic)
+    
+    def _remove_subscriber_refs(self, predicate: Callable[[Any], bool]):
+        """Remove the callback references matching predicate from every topic."""
+        for topic, refs in list(self._subscribers.items()):
+            if any(predicate(ref) for ref in refs):
+                self._subscribers[topic] = tuple(ref for ref in refs if not predicate(ref))
     
     def _notify_observers(self, event: str):
-        """Notify all observers of a state change."""
-        for observer in self._observers:
-            if hasattr(observer, 'on_state_changed'):
+        """Notify all observers, then the subscribers of this event, of a state change."""
+        for ref in self._observers:
+            callback = ref()
+            if callback is not None:
                 try:
-                    observer.on_state_changed(event)
+                    callback(event)
                 except Exception as e:
                     self.logger.error(f"Error notifying observer: {e}")
+        for ref in self._subscribers.get(event, ()):
+            callback = ref()
+            if callback is not None:
+                try:
+                    callback(event)
+                except Exception as e:
+                    self.logger.error(f"Error notifying subscriber of '{event}': {e}")
     
     # Utility Methods
     def get_statistics(self) -> Dict[str, Any]:
@@ -390,8 +743,7 @@ class ApplicationState:
         return {
             "total_datasets": len(self._datasets),
             "selected_datasets": len(self._selected_datasets),
-            "loaded_datasets": len([d for d in self._datasets.values() 
-                                  if d.status == DatasetStatus.LOADED]),
+            "loaded_datasets": self.loaded_dataset_count,
             "focus_dataset": self._focus_dataset,
             "current_view": self._current_view,
             "processing_status": self._processing_status
@@ -403,7 +755,9 @@ class ApplicationState:
         try:
             # Store a shallow copy to decouple from caller
             self._dataset_configs[dataset_name] = dict(config) if config is not None else {}
-            self.logger.debug(f"Config snapshot set for dataset '{dataset_name}' with keys: {list(self._dataset_configs[dataset_name].keys())}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Config snapshot set for dataset '%s' with keys: %s",
+                                  dataset_name, list(self._dataset_configs[dataset_name].keys()))
             self._notify_observers("dataset_config_changed")
         except Exception as e:
             self.logger.error(f"Error setting dataset config for '{dataset_name}': {e}")
@@ -414,7 +768,7 @@ class ApplicationState:
             return None
         return self._dataset_configs.get(dataset_name)
 
-    def capture_active_config_for_dataset(self, dataset_name: str):
+    def capture_active_config_for_dataset(self, dataset_name: str, notify: bool = True):
         """Capture the current active config values and associate with the dataset if not already set."""
         try:
             if dataset_name not in self._dataset_configs:
@@ -423,19 +777,22 @@ class ApplicationState:
                     "Metric": str(self._metric),
                     "Method": str(self._method),
                     "DistanceThreshold": float(self._distance_threshold),
-                    "DatasetDirectory": str(self._dataset_directory) if self._dataset_directory else None,
+                    "DatasetDirectory": self._dataset_directory_str,
                 }
                 self._dataset_configs[dataset_name] = cfg
-                self.logger.debug(f"Captured active config for dataset '{dataset_name}'")
-                self._notify_observers("dataset_config_changed")
+                self.logger.debug("Captured active config for dataset '%s'", dataset_name)
+                if notify:
+                    self._notify_observers("dataset_config_changed")
         except Exception as e:
             self.logger.error(f"Error capturing active config for dataset '{dataset_name}': {e}")
         
     # Recent Directories Management
     @property
-    def recent_directories(self) -> List[str]:
-        """Get the list of recent directories."""
-        return self._recent_directories.copy()
+    def recent_directories(self) -> Tuple[str, ...]:
+        """Get the recent directories, most recent first."""
+        if self._recent_tuple is None:
+            self._recent_tuple = tuple(self._recent_directories)
+        return self._recent_tuple
     
     def add_recent_directory(self, directory_path: str):
         """
@@ -446,7 +803,7 @@ class ApplicationState:
         """
         try:
             # Convert to absolute path string for consistency
-            abs_path = str(Path(directory_path).resolve())
+            abs_path = _resolve_directory(directory_path)
             
             # Remove if already exists (to move to front)
             if abs_path in self._recent_directories:
@@ -459,7 +816,7 @@ class ApplicationState:
             if len(self._recent_directories) > self._max_recent_directories:
                 self._recent_directories = self._recent_directories[:self._max_recent_directories]
             
-            self.logger.debug(f"Added recent directory: {abs_path}")
+            self.logger.debug("Added recent directory: %s", abs_path)
             
             # Save to disk immediately
             self._save_recent_directories()
@@ -489,10 +846,10 @@ class ApplicationState:
             directory_path: Path to remove
         """
         try:
-            abs_path = str(Path(directory_path).resolve())
+            abs_path = _resolve_directory(directory_path)
             if abs_path in self._recent_directories:
                 self._recent_directories.remove(abs_path)
-                self.logger.debug(f"Removed recent directory: {abs_path}")
+                self.logger.debug("Removed recent directory: %s", abs_path)
                 
                 # Save to disk
                 self._save_recent_directories()
@@ -502,37 +859,88 @@ class ApplicationState:
         except Exception as e:
             self.logger.error(f"Error removing recent directory: {e}")
     
-    def _get_config_directory(self) -> Path:
-        """Get the application configuration directory (legacy)."""
-        # Kept for backward compatibility; no longer primary config store
-        config_dir = Path.home() / ".data_analysis_app"
-        config_dir.mkdir(exist_ok=True)
-        return config_dir
-    
-    def _save_recent_directories(self):
-        """Persist recent directories into config.yaml."""
+    def _config_stat_key(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of config.yaml, or None if it cannot be stat'ed."""
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def _load_config(self) -> Dict[str, Any]:
+        """Load config.yaml, reusing the last parse while the file is unchanged on disk."""
+        with self._config_lock:
+            key = self._config_stat_key()
+            cache = self._config_cache
+            if key is not None and cache is not None and cache[:2] == key:
+                return cache[2]
+            cfg = self._config_loader.load(self._config_path)
+            self._config_cache = (*key, cfg) if key is not None else None
+            return cfg
+    
+    def _save_config(self, updates: Dict[str, Any]):
+        """Merge updates into config.yaml."""
+        with self._config_lock:
+            current = self._load_config()
+            cfg = self._config_loader.save(self._config_path, updates, current=current)
+            # Our own write changes mtime; re-key the cache instead of reparsing
+            key = self._config_stat_key()
+            self._config_cache = (*key, cfg) if key is not None else None
+    
+    def _queue_config_write(self, updates: Dict[str, Any]):
+        """
+        Schedule merging updates into config.yaml.
+        
+        Updates queued within the delay are combined into a single save;
+        anything still pending is flushed at exit.
+        
+        Args:
+            updates: Top-level config keys and their new values
+        """
+        with self._config_lock:
+            self._pending_config.update(updates)
+            if self._config_save_timer is not None:
+                self._config_save_timer.cancel()
+            self._config_save_timer = threading.Timer(self._config_save_delay_s,
+                                                      self.flush_config_now)
+            self._config_save_timer.daemon = True
+            self._config_save_timer.start()
+    
+    def flush_config_now(self):
+        """Write any queued config updates to config.yaml immediately."""
         try:
-            # Only save existing directories
-            existing_dirs = [d for d in self._recent_directories if Path(d).exists()]
-            self._recent_directories = existing_dirs
-            self._config_loader.save(self._config_path, {"RecentDirectories": existing_dirs})
+            with self._config_lock:
+                if self._config_save_timer is not None:
+                    self._config_save_timer.cancel()
+                    self._config_save_timer = None
+                if not self._pending_config:
+                    return
+                pending, self._pending_config = self._pending_config, {}
+                self._save_config(pending)
         except Exception as e:
-            self.logger.error(f"Error saving recent directories: {e}")
+            self.logger.error(f"Error saving configuration: {e}")
+    
+    def _save_recent_directories(self):
+        """Queue persisting recent directories; existence is only checked when loading."""
+        # Every mutator saves afterwards, so the snapshot is invalidated here
+        self._recent_tuple = None
+        self._queue_config_write({"RecentDirectories": list(self._recent_directories)})
     
     def _load_recent_directories(self):
         """Load recent directories from config.yaml or migrate from legacy JSON."""
+        self._recent_tuple = None
+        previous = list(self._recent_directories)
         try:
-            cfg = self._config_loader.load(self._config_path)
+            cfg = self._load_config()
             loaded_dirs = cfg.get("RecentDirectories", []) or []
             # Validate that directories still exist
             self._recent_directories = [d for d in loaded_dirs if Path(d).exists()]
 
             # Migration: if legacy JSON exists, merge in and delete it
-            legacy = self._get_config_directory() / "recent_directories.json"
+            legacy = self._legacy_recent_file
             if legacy.exists():
                 try:
-                    with open(legacy, 'r') as f:
-                        legacy_dirs = json.load(f) or []
+                    legacy_dirs = json.loads(legacy.read_bytes()) or []
                     for d in legacy_dirs:
                         if d not in self._recent_directories and Path(d).exists():
                             self._recent_directories.append(d)
@@ -543,15 +951,17 @@ class ApplicationState:
                 except Exception as me:
                     self.logger.warning(f"Failed to migrate legacy recent directories: {me}")
 
-            self._notify_observers("recent_directories_changed")
+            if self._recent_directories != previous:
+                self._notify_observers("recent_directories_changed")
         except Exception as e:
             self.logger.error(f"Error loading recent directories: {e}")
             self._recent_directories = []
+            self._recent_tuple = None
 
     def _load_configuration(self):
         """Load configuration values into the model from config.yaml."""
         try:
-            cfg = self._config_loader.load(self._config_path)
+            cfg = self._load_config()
             # Config values
             self._force_update = bool(cfg.get("ForceUpdate", False))
             if isinstance(cfg.get("Metric"), str) and cfg.get("Metric"):
@@ -3,40 +3,65 @@ Plotting module for the data analysis application.
 
 This module provides the plotting infrastructure including backends, widgets,
 and tab implementations for various types of data visualization.
+
+Names are imported lazily on first access, so importing a single submodule
+(e.g. ``src.plotting.backends``) does not pull in every tab and matplotlib.
 """
 
-# Import core plotting components
-from .backends import PlotBackend, MatplotlibBackend
-from .widgets import PlotCanvasWidget, PlotTabWidget
+import importlib
+from typing import Any, Dict
+
+# Public name -> submodule that defines it
+_LAZY: Dict[str, str] = {
+    # Core plotting components
+    'PlotBackend': '.backends',
+    'MatplotlibBackend': '.backends',
+    'PlotCanvasWidget': '.widgets',
+    'PlotTabWidget': '.widgets',
+
+    # Reusable control widgets
+    'DataSelectionWidget': '.control_widgets',
+    'CoordinateRangeWidget': '.control_widgets',
+    'TrackSelectionWidget': '.control_widgets',
+    'PlaybackControlWidget': '.control_widgets',
+
+    # Tab widget implementations
+    'OverviewTabWidget': '.overview_tab',
+    'GeospatialTabWidget': '.geospatial_tab',
+    'AnimationTabWidget': '.animation_tab',
+    'StatisticsTabWidget': '.statistics_tab',
+}
 
-# Import reusable control widgets
-from .control_widgets import (
-    DataSelectionWidget,
-    CoordinateRangeWidget,
-    TrackSelectionWidget,
-    PlaybackControlWidget    
-)
 
-# Import all tab widget implementations
-from .overview_tab import OverviewTabWidget
-from .geospatial_tab import GeospatialTabWidget
-from .animation_tab import AnimationTabWidget
-from .statistics_tab import StatisticsTabWidget
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Core plotting components
     'PlotBackend',
-    'MatplotlibBackend', 
+    'MatplotlibBackend',
     'PlotCanvasWidget',
     'PlotTabWidget',
     'StatisticsTabWidget',
-    
+
     # Control widgets
     'DataSelectionWidget',
     'CoordinateRangeWidget',
     'TrackSelectionWidget',
     'PlaybackControlWidget',
-    
+
     # Tab widgets
     'OverviewTabWidget',
     'GeospatialTabWidget',
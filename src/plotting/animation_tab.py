@@ -9,6 +9,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import List, Optional, Any, Dict
 import logging
+import time
+
+import numpy as np
 
 from ..utils.schema_access import get_col
 
@@ -38,9 +41,28 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
         self.current_frame = 0
         self.total_frames = 0
         self.animation_speed_var = tk.DoubleVar(value=1.0)
+        self._animation_speed = 1.0  # Cached copy of animation_speed_var for the timer loop
         self.animation_timestamps = []
         self.original_animation_data = {}
         
+        # Sorted timestamp arrays used to slice frames with searchsorted
+        self._tracks_ts = None
+        self._truth_ts = None
+        
+        # Per-frame row cutoffs into the sorted frames (one entry per animation frame)
+        self._tracks_cutoff = None
+        self._truth_cutoff = None
+        
+        # Wall-clock target (perf_counter seconds) for the next animation frame
+        self._next_frame_time: Optional[float] = None
+        
+        # Set while a frame is being drawn; flush_events() can re-enter the Tk loop
+        self._rendering = False
+        
+        # Snapshot of the animation bounds, refreshed by traces on the range variables
+        self._anim_lat_range: Optional[tuple] = None
+        self._anim_lon_range: Optional[tuple] = None
+        
         # Animation control widgets
         self.playback_widget = None
         
@@ -71,6 +93,12 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
         self.coord_range_widget.set_range_callback(self._on_coord_range_changed)
         self.coord_range_widget.set_reset_callback(self._on_reset_bounds)
         
+        # Keep the per-frame bounds snapshot in sync (also covers zoom-driven updates,
+        # which bypass the range callback)
+        for var in (self.coord_range_widget.lat_min_var, self.coord_range_widget.lat_max_var,
+                    self.coord_range_widget.lon_min_var, self.coord_range_widget.lon_max_var):
+            var.trace_add('write', self._snapshot_animation_ranges)
+        
         # Add playback control widget (collapsed by default to save space)
         self.playback_widget = PlaybackControlWidget(controls_frame, collapsed=True)
         self.playback_widget.pack(side="right", fill="y", padx=(5,0), pady=5)
@@ -107,6 +135,10 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
           self.total_frames = 0
           self.animation_timestamps = []
           self.original_animation_data = {}
+          self._tracks_ts = None
+          self._truth_ts = None
+          self._tracks_cutoff = None
+          self._truth_cutoff = None
           
           # Call parent method to update common widgets
           super().on_focus_dataset_changed()
@@ -116,6 +148,18 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
       except Exception as e:
           self.logger.error(f"Error handling animation focus dataset change: {e}")
     
+    def _on_state_restored(self, state: Dict[str, Any], same_dataset: bool):
+        """Rebuild the frames, then seek back to the saved (paused) frame position."""
+        super()._on_state_restored(state, same_dataset)
+        frame = (state.get('widgets') or {}).get('playback_widget', {}).get('frame')
+        if not same_dataset or not frame or self.total_frames == 0:
+            return
+        self.current_frame = min(int(frame), self.total_frames - 1)
+        if self.playback_widget:
+            self.playback_widget.set_current_frame(self.current_frame)
+        self._pause_animation()
+        self._update_current_frame()
+    
     def _on_coordinate_ranges_updated(self):
         """Handle coordinate range updates for animation."""
         # Update current frame with new ranges if we have data
@@ -181,6 +225,8 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
             self.logger.error(f"Error updating playback controls: {e}")
         
         # Start animation loop
+        self._snapshot_animation_ranges()
+        self._next_frame_time = time.perf_counter()
         self._animation_loop()
     
     def _on_pause(self):
@@ -237,6 +283,7 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
         """Handle animation speed changes from playback widget."""
         self.logger.debug(f"Animation speed changed to: {speed}")
         self.animation_speed_var.set(speed)
+        self._animation_speed = speed
     
     def _on_setup_animation(self):
         """Setup the animation with current settings."""
@@ -256,10 +303,24 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
                 focus_info           = app_state.get_focus_dataset_info() # type: ignore
                 tracks_timestamp_col = get_col(focus_info.schema, 'tracks', 'timestamp')
                 truth_timestamp_col  = get_col(focus_info.schema, 'truth', 'timestamp')
+                
+                # Sort once by timestamp so each frame is a prefix slice
+                anim_tracks_df, self._tracks_ts = self._sort_by_timestamp(
+                    plot_data.get('tracks_df'), tracks_timestamp_col)
+                anim_truth_df, self._truth_ts = self._sort_by_timestamp(
+                    plot_data.get('truth_df'), truth_timestamp_col)
+                
+                # Halve the bytes touched by every per-frame slice (only on the sorted
+                # copies; unsorted frames may be shared with the plot data cache)
+                if self._tracks_ts is not None:
+                    self._downcast_coordinates(anim_tracks_df, focus_info.schema, 'tracks')
+                if self._truth_ts is not None:
+                    self._downcast_coordinates(anim_truth_df, focus_info.schema, 'truth')
+                
                 # Store original animation data for frame filtering                
                 self.original_animation_data = {
-                    "tracks_df": plot_data.get('tracks_df', None),
-                    "truth_df": plot_data.get('truth_df', None),
+                    "tracks_df": anim_tracks_df,
+                    "truth_df": anim_truth_df,
                     "time_range": plot_data.get('time_range', {}),
                     "lat_range": plot_data.get('lat_range', (-1.0, 1.0)),
                     "lon_range": plot_data.get('lon_range', (-1.0, 1.0)),
@@ -270,25 +331,23 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
                 # Update coordinate ranges from calculated data
                 self._update_coordinate_ranges_from_plot_data(plot_data)
     
-                # Extract all unique timestamps for frame calculation
-                all_timestamps = set()
-                
-                if plot_data.get('tracks_df') is not None:
-                    tracks_df = plot_data['tracks_df']
-                    if tracks_timestamp_col in tracks_df.columns:
-                        all_timestamps.update(tracks_df[tracks_timestamp_col])
-
-                if plot_data.get('truth_df') is not None:
-                    truth_df = plot_data['truth_df']
-                    if truth_timestamp_col in truth_df.columns:
-                        all_timestamps.update(truth_df[truth_timestamp_col])
+                # Merge the already-sorted timestamp arrays into the frame sequence
+                timestamp_arrays = [ts for ts in (self._tracks_ts, self._truth_ts) if ts is not None]
+                if timestamp_arrays:
+                    sorted_timestamps = np.unique(np.concatenate(timestamp_arrays))
+                else:
+                    sorted_timestamps = np.empty(0)
                 
-                # Sort timestamps for frame sequence
-                sorted_timestamps = sorted(list(all_timestamps))
                 self.total_frames = len(sorted_timestamps)
                 self.animation_timestamps = sorted_timestamps
                 self.current_frame = 0
                 
+                # Precompute each frame's prefix length so playback only indexes
+                self._tracks_cutoff = (np.searchsorted(self._tracks_ts, sorted_timestamps, side='right')
+                                       if self._tracks_ts is not None else None)
+                self._truth_cutoff = (np.searchsorted(self._truth_ts, sorted_timestamps, side='right')
+                                      if self._truth_ts is not None else None)
+                
                 # Update playback widget
                 if self.playback_widget:
                     self.playback_widget.set_total_frames(self.total_frames)
@@ -316,20 +375,44 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
         if not self.is_playing:
             return
         
-        # Update to next frame
-        self.current_frame = (self.current_frame + 1) % self.total_frames
-        self._update_current_frame()
+        # All loop state is plain Python; no Tk variables are read here
+        perf_counter = time.perf_counter
+        total_frames = self.total_frames
+        
+        # Frame interval at 30 fps scaled by the playback speed
+        interval_s = max(0.010, 1.0 / (30 * self._animation_speed))
         
-        # Update playback widget
+        # Schedule against a wall-clock target so slow frames do not accumulate
+        # drift; if we have fallen more than one interval behind, skip frames
+        now = perf_counter()
+        next_time = self._next_frame_time if self._next_frame_time is not None else now
+        frames_to_skip = max(0, int((now - next_time) / interval_s))
+        next_time += (frames_to_skip + 1) * interval_s
+        self._next_frame_time = next_time
+        
+        # Update to next frame (only the final frame of a skipped range is drawn)
+        frame = (self.current_frame + 1 + frames_to_skip) % total_frames
+        self.current_frame = frame
+        if not self._rendering:
+            self._update_current_frame()
+        else:
+            # Previous frame still drawing: advance the timeline, drop this frame
+            self.logger.debug("Dropping animation frame %s: render in progress", frame)
+        
+        # Update playback widget (single Tcl write for the frame indicator)
         if self.playback_widget:
-            self.playback_widget.set_current_frame(self.current_frame)
+            self.playback_widget.set_current_frame(frame)
         
         # Schedule next frame
-        delay = int(1000 / (30 * self.animation_speed_var.get())) 
+        delay = max(1, int((next_time - perf_counter()) * 1000))
         self.after(delay, self._animation_loop)
     
     def _update_current_frame(self):
         """Update the display for the current frame."""
+        if self._rendering:
+            return
+        
+        self._rendering = True
         try:
             if not hasattr(self, 'animation_timestamps') or self.current_frame >= len(self.animation_timestamps):
                 return
@@ -337,7 +420,7 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
             current_timestamp = self.animation_timestamps[self.current_frame]
         
             if hasattr(self, 'original_animation_data'):
-                filtered_data = self._filter_data_to_timestamp(current_timestamp)
+                filtered_data = self._filter_data_to_timestamp(current_timestamp, self.current_frame)
                 
                 config = {
                     'title': f'Animation Frame {self.current_frame + 1}/{self.total_frames}',
@@ -348,13 +431,77 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
                     'truth_plot_mode': 'scatter',
                 }
                 
-                self.update_plot('animation_frame', filtered_data, config)
+                self.plot_canvas.update_animation_frame(filtered_data, config)
             
         except Exception as e:
             self.logger.error(f"Error updating frame: {e}")
+        finally:
+            self._rendering = False
 
-    def _filter_data_to_timestamp(self, current_timestamp):
-        """Filter animation data to show only data up to current timestamp."""
+    def _snapshot_animation_ranges(self, *args):
+        """Cache the coordinate range widget values for use by the frame filter."""
+        try:
+            widget = self.coord_range_widget
+            if widget:
+                # Read the variables directly: this trace may run before the widget's
+                # own trace has invalidated its get_ranges() cache
+                self._anim_lat_range = (widget.lat_min_var.get(), widget.lat_max_var.get())
+                self._anim_lon_range = (widget.lon_min_var.get(), widget.lon_max_var.get())
+        except (tk.TclError, ValueError):
+            # Partially typed spinbox values; keep the previous snapshot
+            pass
+    
+    def _downcast_coordinates(self, df: Any, schema: Any, role: str):
+        """
+        Convert float64 lat/lon columns of an animation DataFrame to float32 in place.
+        
+        Timestamps are left untouched since frame boundaries depend on exact values.
+        
+        Args:
+            df: Animation DataFrame owned by this tab (may be None)
+            schema: Dataset schema used to resolve column names
+            role: Schema role ('tracks' or 'truth')
+        """
+        if df is None:
+            return
+        
+        for logical_name in ('lat', 'lon'):
+            col = get_col(schema, role, logical_name)
+            try:
+                if col in df.columns and df[col].dtype == np.float64:
+                    df[col] = df[col].astype(np.float32)
+            except Exception as e:
+                self.logger.debug(f"Could not downcast {role}.{col}: {e}")
+    
+    def _sort_by_timestamp(self, df: Any, timestamp_col: str):
+        """
+        Sort a DataFrame by its timestamp column for prefix slicing.
+        
+        Args:
+            df: DataFrame to sort (may be None)
+            timestamp_col: Name of the timestamp column
+            
+        Returns:
+            Tuple of (sorted DataFrame, sorted timestamp array or None)
+        """
+        if df is None or timestamp_col not in df.columns:
+            return df, None
+        
+        try:
+            sorted_df = df.sort_values(timestamp_col, kind='mergesort')
+            return sorted_df, sorted_df[timestamp_col].to_numpy()
+        except Exception as e:
+            self.logger.warning(f"Could not sort animation data by {timestamp_col}: {e}")
+            return df, None
+    
+    def _filter_data_to_timestamp(self, current_timestamp, frame_idx: Optional[int] = None):
+        """
+        Filter animation data to show only data up to current timestamp.
+        
+        Args:
+            current_timestamp: Timestamp of the frame being shown
+            frame_idx: Frame index; when given, precomputed cutoffs are used
+        """
         filtered_data = {
             'tracks_df': None,
             'truth_df': None,
@@ -368,21 +515,34 @@ class AnimationTabWidget(BaseGeospatialTabWidget):
         if self.original_animation_data.get('tracks_df') is not None:            
             tracks_timestamp_col = self.original_animation_data.get('tracks_timestamp_col')
             tracks_df = self.original_animation_data['tracks_df']
-            filtered_tracks = tracks_df[tracks_df[tracks_timestamp_col] <= current_timestamp]
+            if frame_idx is not None and self._tracks_cutoff is not None:
+                filtered_tracks = tracks_df.iloc[:int(self._tracks_cutoff[frame_idx])]
+            elif self._tracks_ts is not None:
+                cut = np.searchsorted(self._tracks_ts, current_timestamp, side='right')
+                filtered_tracks = tracks_df.iloc[:cut]
+            else:
+                filtered_tracks = tracks_df[tracks_df[tracks_timestamp_col] <= current_timestamp]
             filtered_data['tracks_df'] = filtered_tracks
         
         # Filter truth
         if self.original_animation_data.get('truth_df') is not None:
             truth_df = self.original_animation_data['truth_df']
             truth_timestamp_col = self.original_animation_data.get('truth_timestamp_col')
-            filtered_truth = truth_df[truth_df[truth_timestamp_col] <= current_timestamp]
+            if frame_idx is not None and self._truth_cutoff is not None:
+                filtered_truth = truth_df.iloc[:int(self._truth_cutoff[frame_idx])]
+            elif self._truth_ts is not None:
+                cut = np.searchsorted(self._truth_ts, current_timestamp, side='right')
+                filtered_truth = truth_df.iloc[:cut]
+            else:
+                filtered_truth = truth_df[truth_df[truth_timestamp_col] <= current_timestamp]
             filtered_data['truth_df'] = filtered_truth
         
         # Include coordinate ranges
-        if hasattr(self, 'coord_range_widget') and self.coord_range_widget:
-            ranges = self.coord_range_widget.get_ranges()
-            filtered_data['lat_range'] = ranges.get('lat_range')
-            filtered_data['lon_range'] = ranges.get('lon_range')
+        if self._anim_lat_range is None or self._anim_lon_range is None:
+            self._snapshot_animation_ranges()
+        if self._anim_lat_range is not None and self._anim_lon_range is not None:
+            filtered_data['lat_range'] = self._anim_lat_range
+            filtered_data['lon_range'] = self._anim_lon_range
         
         return filtered_data
     
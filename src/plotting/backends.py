@@ -6,7 +6,7 @@ plot backends (matplotlib, plotly, etc.) to enable drop-in replacement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable, Tuple
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import logging
 import pandas as pd
 
@@ -96,6 +96,48 @@ class PlotBackend(ABC):
         """
         pass
     
+    def update_animation_frame(self, data: Dict[str, Any],
+                               config: Optional[Dict[str, Any]] = None) -> PlotResult:
+        """
+        Update the plot for a single animation frame.
+        
+        Backends that support incremental rendering should override this; the
+        default implementation redraws the full 'animation_frame' plot.
+        
+        Args:
+            data: Frame data dictionary (filtered tracks/truth and ranges)
+            config: Optional configuration parameters
+            
+        Returns:
+            PlotResult indicating success/failure
+        """
+        return self.create_plot('animation_frame', data, config)
+    
+    def close(self):
+        """
+        Release resources held by the backend (figures, canvases).
+        
+        Called when the owning tab is destroyed; the default does nothing.
+        """
+        pass
+    
+    def update_generic_xy(self, data: Dict[str, Any],
+                          config: Optional[Dict[str, Any]] = None) -> PlotResult:
+        """
+        Update a generic XY plot with new series data.
+        
+        Backends that can refresh the existing artists in place should override
+        this; the default implementation redraws the full 'generic_xy' plot.
+        
+        Args:
+            data: Series data dictionary from PlotManager
+            config: Optional configuration parameters
+            
+        Returns:
+            PlotResult indicating success/failure
+        """
+        return self.create_plot('generic_xy', data, config)
+    
     def set_zoom_callback(self, callback: Callable[[Tuple[float, float], Tuple[float, float]], None]):
         """
         Set callback function for zoom/pan events.
@@ -125,21 +167,26 @@ class MatplotlibBackend(PlotBackend):
     def __init__(self, parent_widget=None, figure_size: Tuple[int, int] = (8, 6)):
         super().__init__(parent_widget)
         self.figure_size = figure_size
+        
+        # Retained artists and cached background for blitted animation frames
+        self._anim_blit: Optional[Dict[str, Any]] = None
+        self._xy_blit: Optional[Dict[str, Any]] = None
+        self._xy_lines: Dict[str, Any] = {}
+        
         self._setup_matplotlib()
     
     def _setup_matplotlib(self):
         """Initialize matplotlib components."""
         import matplotlib
         matplotlib.use('TkAgg')
-        import matplotlib.pyplot as plt
         from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         from matplotlib.backends._backend_tk import NavigationToolbar2Tk
         from matplotlib.figure import Figure
         import tkinter as tk
         from tkinter import ttk
         
-        # Store matplotlib imports for use in methods
-        self.plt = plt
+        # Store matplotlib imports for use in methods. Figures are created with
+        # Figure() directly so pyplot's global registry never holds on to them.
         self.Figure = Figure
         self.FigureCanvasTkAgg = FigureCanvasTkAgg
         self.NavigationToolbar2Tk = NavigationToolbar2Tk
@@ -182,6 +229,9 @@ class MatplotlibBackend(PlotBackend):
             self.canvas.mpl_connect('key_release_event', self._on_navigation_event)
             self.canvas.mpl_connect('scroll_event', self._on_navigation_event)
             
+            # Re-capture the animation background after any full redraw
+            self.canvas.mpl_connect('draw_event', self._on_draw_event)
+            
             # Hook toolbar methods
             self._hook_toolbar_methods()
         else:
@@ -239,6 +289,9 @@ class MatplotlibBackend(PlotBackend):
                    config: Optional[Dict[str, Any]] = None) -> PlotResult:
         """Create a matplotlib plot."""
         try:
+            self._anim_blit = None
+            self._xy_blit = None
+            self._xy_lines = {}
             self.figure.clear()
             ax = self.figure.add_subplot(111)
             
@@ -533,6 +586,9 @@ class MatplotlibBackend(PlotBackend):
     def clear_plot(self) -> bool:
         """Clear the plot."""
         try:
+            self._anim_blit = None
+            self._xy_blit = None
+            self._xy_lines = {}
             self.figure.clear()
             if hasattr(self, 'canvas'):
                 self.canvas.draw()
@@ -541,6 +597,19 @@ class MatplotlibBackend(PlotBackend):
             self.logger.error(f"Error clearing plot: {e}")
             return False
     
+    def close(self):
+        """Clear the figure and destroy the Tk canvas so its Agg buffer can be freed."""
+        try:
+            self._anim_blit = None
+            self._xy_blit = None
+            self._xy_lines = {}
+            self.figure.clear()
+            canvas_widget = getattr(self, 'canvas_widget', None)
+            if canvas_widget is not None:
+                canvas_widget.destroy()
+        except Exception as e:
+            self.logger.error(f"Error closing plot backend: {e}")
+    
     def refresh(self) -> bool:
         """Refresh the plot."""
         try:
@@ -559,6 +628,308 @@ class MatplotlibBackend(PlotBackend):
         """Get the tkinter widget."""
         return getattr(self, 'frame', None)
     
+    def update_animation_frame(self, data: Dict[str, Any],
+                               config: Optional[Dict[str, Any]] = None) -> PlotResult:
+        """
+        Update an animation frame by blitting retained artists.
+        
+        The first frame after a full plot is drawn normally; its data artists are
+        then replaced by a few retained artists whose offsets/data are updated on
+        each subsequent frame and blitted over a cached background.
+        """
+        config = config or {}
+        blit = self._anim_blit
+        lat_range = data.get('lat_range')
+        lon_range = data.get('lon_range')
+        
+        if (blit is None or blit.get('background') is None
+                or blit['lat_range'] != lat_range or blit['lon_range'] != lon_range):
+            result = self.create_plot('animation_frame', data, config)
+            if result.success:
+                self._init_animation_blit(data, config)
+            return result
+        
+        try:
+            self._set_animation_artist_data(data, config)
+            blit['title'].set_text(config.get('title', 'Geospatial Plot'))
+            self._blit_animation_artists()
+            return PlotResult(success=True, plot_object=self.figure)
+        except Exception as e:
+            self.logger.debug(f"Blit update failed, falling back to full redraw: {e}")
+            self._anim_blit = None
+            return self.create_plot('animation_frame', data, config)
+    
+    def _init_animation_blit(self, data: Dict[str, Any], config: Dict[str, Any]):
+        """Swap the frame's data artists for retained animated artists and cache the background."""
+        if not hasattr(self, 'canvas') or self.canvas is None:
+            return
+        
+        try:
+            axes = self.figure.get_axes()
+            if not axes:
+                return
+            ax = axes[0]
+            
+            # Drop the per-track artists drawn by the full plot
+            for artist in list(ax.lines) + list(ax.collections):
+                artist.remove()
+            
+            tracks_line, = ax.plot([], [], 'b-', alpha=0.6, linewidth=2, animated=True,
+                                   label='Track Trajectory')
+            tracks_start = ax.scatter([], [], c='green', s=100, marker='o', animated=True, label='Start')
+            tracks_end = ax.scatter([], [], c='red', s=100, marker='s', animated=True, label='End')
+            truth_line, = ax.plot([], [], 'r--', alpha=0.6, linewidth=2, animated=True,
+                                  label='Truth Trajectory')
+            truth_points = ax.scatter([], [], s=10, alpha=0.5, c='red', animated=True, label='Truth')
+            ax.title.set_animated(True)
+            
+            # The frame-0 legend points at the artists just removed and lacks data
+            # that only appears later; it is part of the cached background, so
+            # rebuild it from the retained artists before the background is taken
+            truth_handle = truth_line if config.get('truth_plot_mode', 'scatter') == 'trajectory' else truth_points
+            ax.legend(handles=[tracks_line, tracks_start, tracks_end, truth_handle])
+            
+            self._anim_blit = {
+                'ax': ax,
+                'tracks_line': tracks_line,
+                'tracks_start': tracks_start,
+                'tracks_end': tracks_end,
+                'truth_line': truth_line,
+                'truth_points': truth_points,
+                'title': ax.title,
+                'background': None,
+                'lat_range': data.get('lat_range'),
+                'lon_range': data.get('lon_range'),
+            }
+            self._set_animation_artist_data(data, config)
+            
+            # Full draw renders only static content; draw_event captures the background
+            self.canvas.draw()
+            self._blit_animation_artists()
+        except Exception as e:
+            self.logger.debug(f"Could not initialize animation blitting: {e}")
+            self._anim_blit = None
+    
+    def _set_animation_artist_data(self, data: Dict[str, Any], config: Dict[str, Any]):
+        """Push frame data into the retained animation artists."""
+        import numpy as np
+        from ..utils.schema_access import get_col
+        blit = self._anim_blit
+        schema = config.get('schema')
+        empty = np.empty((0, 2))
+        
+        tracks_df = data.get('tracks_df')
+        if tracks_df is not None and not tracks_df.empty:
+            line_x, line_y, starts, ends = self._segment_by_id(
+                tracks_df,
+                get_col(schema, 'tracks', 'track_id'),
+                get_col(schema, 'tracks', 'lon'),
+                get_col(schema, 'tracks', 'lat'))
+            blit['tracks_line'].set_data(line_x, line_y)
+            blit['tracks_start'].set_offsets(starts)
+            blit['tracks_end'].set_offsets(ends)
+        else:
+            blit['tracks_line'].set_data([], [])
+            blit['tracks_start'].set_offsets(empty)
+            blit['tracks_end'].set_offsets(empty)
+        
+        truth_df = data.get('truth_df')
+        truth_mode = config.get('truth_plot_mode', 'scatter')
+        blit['truth_line'].set_data([], [])
+        blit['truth_points'].set_offsets(empty)
+        if truth_df is not None and not truth_df.empty:
+            lon_col = get_col(schema, 'truth', 'lon')
+            lat_col = get_col(schema, 'truth', 'lat')
+            if truth_mode == 'trajectory':
+                line_x, line_y, _, _ = self._segment_by_id(
+                    truth_df, get_col(schema, 'truth', 'truth_id'), lon_col, lat_col)
+                blit['truth_line'].set_data(line_x, line_y)
+            else:
+                blit['truth_points'].set_offsets(
+                    np.column_stack((truth_df[lon_col].to_numpy(dtype=float),
+                                     truth_df[lat_col].to_numpy(dtype=float))))
+    
+    @staticmethod
+    def _segment_by_id(df: pd.DataFrame, id_col: str, x_col: str, y_col: str):
+        """
+        Build a single NaN-separated polyline from per-id trajectories.
+        
+        Returns:
+            Tuple of (x, y, start_points, end_points) arrays
+        """
+        import numpy as np
+        ids = df[id_col].to_numpy()
+        order = np.argsort(ids, kind='stable')
+        ids = ids[order]
+        x = df[x_col].to_numpy(dtype=float)[order]
+        y = df[y_col].to_numpy(dtype=float)[order]
+        
+        breaks = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        first = np.concatenate(([0], breaks))
+        last = np.concatenate((breaks - 1, [len(ids) - 1]))
+        
+        starts = np.column_stack((x[first], y[first]))
+        ends = np.column_stack((x[last], y[last]))
+        return np.insert(x, breaks, np.nan), np.insert(y, breaks, np.nan), starts, ends
+    
+    def _blit_animation_artists(self):
+        """Restore the cached background and blit the animated artists."""
+        blit = self._anim_blit
+        if blit is None or blit.get('background') is None:
+            return
+        self.canvas.restore_region(blit['background'])
+        self._draw_animation_artists()
+        self.canvas.blit(self.figure.bbox)
+        self.canvas.flush_events()
+    
+    def _draw_animation_artists(self):
+        """Draw the retained animation artists onto the canvas renderer."""
+        blit = self._anim_blit
+        ax = blit['ax']
+        for key in ('truth_points', 'truth_line', 'tracks_line', 'tracks_start', 'tracks_end'):
+            ax.draw_artist(blit[key])
+        self.figure.draw_artist(blit['title'])
+    
+    def _on_draw_event(self, event):
+        """Capture the static background after a full canvas draw."""
+        blit = self._anim_blit
+        if blit is not None:
+            try:
+                blit['background'] = self.canvas.copy_from_bbox(self.figure.bbox)
+                self._draw_animation_artists()
+            except Exception as e:
+                self.logger.debug(f"Error capturing animation background: {e}")
+                self._anim_blit = None
+        
+        xy_blit = self._xy_blit
+        if xy_blit is not None:
+            try:
+                xy_blit['background'] = self.canvas.copy_from_bbox(xy_blit['ax'].bbox)
+                for line in xy_blit['lines'].values():
+                    xy_blit['ax'].draw_artist(line)
+            except Exception as e:
+                self.logger.debug(f"Error capturing XY background: {e}")
+                self._xy_blit = None
+    
+    def blit_update(self, dynamic_artists: List[Any]) -> bool:
+        """
+        Redraw only the given animated artists over the cached XY background.
+        
+        Args:
+            dynamic_artists: Artists (created with animated=True) to redraw
+            
+        Returns:
+            True if the artists were blitted, False if no background is cached
+        """
+        xy_blit = self._xy_blit
+        if xy_blit is None or xy_blit.get('background') is None:
+            return False
+        ax = xy_blit['ax']
+        self.canvas.restore_region(xy_blit['background'])
+        for artist in dynamic_artists:
+            ax.draw_artist(artist)
+        self.canvas.blit(ax.bbox)
+        self.canvas.flush_events()
+        return True
+    
+    def update_generic_xy(self, data: Dict[str, Any],
+                          config: Optional[Dict[str, Any]] = None) -> PlotResult:
+        """
+        Update a generic XY plot, blitting the series lines when possible.
+        
+        The lines of the previous plot are kept as animated artists. When the new
+        data has the same series, styles and labels, their data is replaced in
+        place; the cached background is reused unless the autoscaled limits
+        change. Anything else falls back to a full 'generic_xy' plot.
+        """
+        config = config or {}
+        signature = self._xy_signature(data, config)
+        xy_blit = self._xy_blit
+        
+        if (signature is None or xy_blit is None or xy_blit.get('background') is None
+                or xy_blit['signature'] != signature):
+            result = self.create_plot('generic_xy', data, config)
+            if result.success and signature is not None:
+                self._init_xy_blit(signature)
+            return result
+        
+        try:
+            ax = xy_blit['ax']
+            series = data['series']
+            x = series['x']
+            for key, line in xy_blit['lines'].items():
+                line.set_data(x, series[key])
+            
+            ax.relim()
+            ax.autoscale_view()
+            limits = (ax.get_xlim(), ax.get_ylim())
+            if limits != xy_blit['limits']:
+                # Axis ticks changed: full draw re-captures the background via draw_event
+                xy_blit['limits'] = limits
+                self.canvas.draw()
+                self._initialize_limit_tracking()
+            else:
+                self.blit_update(list(xy_blit['lines'].values()))
+            return PlotResult(success=True, plot_object=self.figure)
+        except Exception as e:
+            self.logger.debug(f"XY blit update failed, falling back to full redraw: {e}")
+            self._xy_blit = None
+            return self.create_plot('generic_xy', data, config)
+    
+    def _xy_signature(self, data: Dict[str, Any], config: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Describe everything about a generic XY plot other than its line data.
+        
+        Returns:
+            Hashable signature, or None when the plot can't be blitted (no data,
+            scatter series or custom y ticks)
+        """
+        series = (data or {}).get('series') or {}
+        if 'x' not in series or len(series) < 2:
+            return None
+        if config.get('y_ticks') or data.get('y_ticks'):
+            return None
+        
+        default_style = config.get('style', 'line')
+        series_styles = data.get('series_styles') or config.get('series_styles') or {}
+        if not isinstance(series_styles, dict):
+            series_styles = {}
+        styles = []
+        for key in series:
+            if key == 'x':
+                continue
+            sconf = series_styles.get(key, {})
+            if sconf.get('type', default_style) != 'line':
+                return None
+            styles.append((key, repr(sorted(sconf.items()))))
+        
+        return (tuple(styles),
+                config.get('title', data.get('title', 'XY Plot')),
+                config.get('xlabel', data.get('xlabel', 'X')),
+                config.get('ylabel', data.get('ylabel', 'Y')))
+    
+    def _init_xy_blit(self, signature: Tuple):
+        """Mark the freshly drawn XY lines as animated and cache the background."""
+        if not hasattr(self, 'canvas') or self.canvas is None or not self._xy_lines:
+            return
+        
+        try:
+            ax = next(iter(self._xy_lines.values())).axes
+            for line in self._xy_lines.values():
+                line.set_animated(True)
+            self._xy_blit = {
+                'ax': ax,
+                'lines': dict(self._xy_lines),
+                'signature': signature,
+                'limits': (ax.get_xlim(), ax.get_ylim()),
+                'background': None,
+            }
+            # Full draw renders only static content; draw_event captures the background
+            self.canvas.draw()
+        except Exception as e:
+            self.logger.debug(f"Could not initialize XY blitting: {e}")
+            self._xy_blit = None
+    
     def get_axis_limits(self) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
         """Get current axis limits."""
         try:
@@ -597,7 +968,8 @@ class MatplotlibBackend(PlotBackend):
             if ptype == 'scatter':
                 ax.scatter(x, values, s=markersize, alpha=alpha, label=label, c=color, marker=marker)
             else:
-                ax.plot(x, values, linestyle, linewidth=linewidth, alpha=alpha, label=label, color=color, marker=marker)
+                line, = ax.plot(x, values, linestyle, linewidth=linewidth, alpha=alpha, label=label, color=color, marker=marker)
+                self._xy_lines[key] = line
 
         # Titles and labels
         ax.set_title((config or {}).get('title', data.get('title', 'XY Plot')), fontsize=14, fontweight='bold')
@@ -228,6 +228,13 @@ class BaseGeospatialTabWidget(PlotTabWidget):
         """
         raise NotImplementedError("Subclasses must implement _generate_plot()")
     
+    def _on_state_restored(self, state: Dict[str, Any], same_dataset: bool):
+        """Pick up restored selections, then redraw."""
+        if same_dataset and self.data_selection_widget:
+            self.track_selection_var = self.data_selection_widget.get_selected_tracks()
+            self.truth_selection_var = self.data_selection_widget.get_selected_truth()
+        self._generate_plot()
+    
     def auto_update(self):
         """Auto-update the plot when data changes."""
         self.logger.debug("Auto-updating geospatial plot")
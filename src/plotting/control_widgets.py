@@ -7,9 +7,39 @@ across different plot tabs, promoting consistency and reducing code duplication.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, List, Dict, Callable, Any
+from tkinter import font as tkfont
+from typing import Optional, List, Dict, Callable, Any, Tuple
 import logging
+import weakref
 from ..utils.schema_access import get_col
+from ..models.application_state import DatasetStatus
+
+
+def get_shared_font(widget: tk.Widget, size: int, weight: str = "normal") -> tkfont.Font:
+    """
+    Return a TkDefaultFont variant shared by every widget of the same Tk root.
+    
+    The cache lives on the root window, so fonts never outlive their Tk
+    interpreter and a second root gets its own fonts.
+    
+    Args:
+        widget: Any widget of the application (used to find the Tk root)
+        size: Point size
+        weight: "normal" or "bold"
+        
+    Returns:
+        Font object that can be passed as a widget's font option
+    """
+    root = widget.nametowidget('.')
+    fonts: Optional[Dict[Tuple[int, str], tkfont.Font]] = getattr(root, '_shared_fonts', None)
+    if fonts is None:
+        fonts = root._shared_fonts = {}
+    key = (size, weight)
+    font = fonts.get(key)
+    if font is None:
+        font = tkfont.Font(root=root, font=("TkDefaultFont", size, weight))
+        fonts[key] = font
+    return font
 
 
 class CollapsibleWidget(ttk.Frame):
@@ -48,7 +78,7 @@ class CollapsibleWidget(ttk.Frame):
         self.title_label = ttk.Label(
             self.header_frame,
             text=title,
-            font=("TkDefaultFont", 9, "bold")
+            font=get_shared_font(self, 9, "bold")
         )
         self.title_label.pack(side="left")
         
@@ -90,6 +120,27 @@ class CollapsibleWidget(ttk.Frame):
             True if collapsed, False if expanded
         """
         return self.collapsed
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Capture the user-adjustable settings of this widget.
+        
+        Subclasses extend the returned dict; restore_state() accepts it back.
+        
+        Returns:
+            Plain-data dict of the widget's settings
+        """
+        return {'collapsed': self.collapsed}
+    
+    def restore_state(self, state: Dict[str, Any]):
+        """
+        Re-apply settings captured by get_state() without firing change callbacks.
+        
+        Args:
+            state: Dict returned by get_state()
+        """
+        if 'collapsed' in state:
+            self.set_collapsed(bool(state['collapsed']))
 
 
 class DataSelectionWidget(CollapsibleWidget):
@@ -124,6 +175,10 @@ class DataSelectionWidget(CollapsibleWidget):
         self.track_ids: List[str] = []
         self.truth_ids: List[str] = []
         
+        # Hashes of the ID sets currently shown, used to skip redundant repopulation
+        self._tracks_list_key: Optional[int] = None
+        self._truth_list_key: Optional[int] = None
+        
         self._create_controls()
     
     def _create_controls(self):
@@ -145,7 +200,7 @@ class DataSelectionWidget(CollapsibleWidget):
             selectmode=tk.EXTENDED,  # Enables Ctrl+Click and Shift+Click
             height=5,  # Compact height
             exportselection=False,  # Prevents losing selection when switching widgets
-            font=("TkDefaultFont", 8)
+            font=get_shared_font(self, 8)
         )
         
         tracks_scrollbar = ttk.Scrollbar(tracks_list_frame, orient="vertical", command=self.tracks_listbox.yview)
@@ -170,7 +225,7 @@ class DataSelectionWidget(CollapsibleWidget):
             selectmode=tk.EXTENDED,  # Enables Ctrl+Click and Shift+Click
             height=5,  # Compact height
             exportselection=False,  # Prevents losing selection when switching widgets
-            font=("TkDefaultFont", 8)
+            font=get_shared_font(self, 8)
         )
         
         truth_scrollbar = ttk.Scrollbar(truth_list_frame, orient="vertical", command=self.truth_listbox.yview)
@@ -187,6 +242,8 @@ class DataSelectionWidget(CollapsibleWidget):
     
     def _show_empty_state(self):
         """Show empty state when no data is loaded."""
+        self._tracks_list_key = None
+        self._truth_list_key = None
         if self.tracks_listbox:
             self.tracks_listbox.delete(0, tk.END)
             self.tracks_listbox.config(state="disabled")
@@ -200,6 +257,15 @@ class DataSelectionWidget(CollapsibleWidget):
         if not self.tracks_listbox:
             return
         
+        # Same track set already listed: only reset the selection to "All"
+        list_key = hash(tuple(track_ids)) if track_ids else None
+        if list_key is not None and list_key == self._tracks_list_key:
+            self.track_ids = track_ids
+            self.tracks_listbox.selection_clear(0, tk.END)
+            self.tracks_listbox.selection_set(0)
+            return
+        self._tracks_list_key = list_key
+        
         self.tracks_listbox.delete(0, tk.END)
         self.tracks_listbox.config(state="normal")
         
@@ -209,13 +275,9 @@ class DataSelectionWidget(CollapsibleWidget):
         
         self.track_ids = track_ids
         
-        # Add special options
-        self.tracks_listbox.insert(0, "All")
-        self.tracks_listbox.insert(1, "None")
-        
-        # Add track items
-        for track_id in sorted(track_ids):
-            self.tracks_listbox.insert(tk.END, f"Track {track_id}")
+        # Add special options and track items in a single Tcl call
+        self.tracks_listbox.insert(
+            tk.END, "All", "None", *(f"Track {track_id}" for track_id in sorted(track_ids)))
         
         # Select all tracks by default (skip "None" and separator)
         self.tracks_listbox.selection_set(0)  # Select "All Tracks"
@@ -225,6 +287,15 @@ class DataSelectionWidget(CollapsibleWidget):
         if not self.truth_listbox:
             return
         
+        # Same truth set already listed: only reset the selection to "All"
+        list_key = hash(tuple(truth_ids)) if truth_ids else None
+        if list_key is not None and list_key == self._truth_list_key:
+            self.truth_ids = truth_ids
+            self.truth_listbox.selection_clear(0, tk.END)
+            self.truth_listbox.selection_set(0)
+            return
+        self._truth_list_key = list_key
+        
         self.truth_listbox.delete(0, tk.END)
         self.truth_listbox.config(state="normal")
         
@@ -235,13 +306,9 @@ class DataSelectionWidget(CollapsibleWidget):
         
         self.truth_ids = truth_ids
         
-        # Add special options
-        self.truth_listbox.insert(0, "All")
-        self.truth_listbox.insert(1, "None")
-        
-        # Add truth items
-        for truth_id in sorted(truth_ids):
-            self.truth_listbox.insert(tk.END, f"Truth {truth_id}")
+        # Add special options and truth items in a single Tcl call
+        self.truth_listbox.insert(
+            tk.END, "All", "None", *(f"Truth {truth_id}" for truth_id in sorted(truth_ids)))
         
         # Select all truth by default (skip "None" and separator)
         self.truth_listbox.selection_set(0)  # Select "All Truth"
@@ -343,6 +410,15 @@ class DataSelectionWidget(CollapsibleWidget):
             # Load initial data if available
             self._update_data_from_focus()
     
+    def destroy(self):
+        """Unregister from the model before the widget is destroyed."""
+        if self.controller:
+            try:
+                self.controller.model.remove_observer(self)
+            except Exception as e:
+                self.logger.debug(f"Error removing observer: {e}")
+        super().destroy()
+    
     def on_state_changed(self, event: str):
         """Handle state changes from the application."""
         if event == "focus_changed":
@@ -357,17 +433,21 @@ class DataSelectionWidget(CollapsibleWidget):
             state = self.controller.get_state()
             focus_info = state.get_focus_dataset_info()
             
-            if not focus_info or focus_info.status.value != "loaded":
+            if not focus_info or focus_info.status is not DatasetStatus.LOADED:
                 self._show_empty_state()
                 return
             
             # Extract track IDs
             track_ids = []
             schema = getattr(focus_info, 'schema', None)
+            summary = getattr(focus_info, 'track_summary', None)
             if focus_info.tracks_df is not None and not focus_info.tracks_df.empty:
                 try:
                     track_col = get_col(schema, 'tracks', 'track_id')
-                    if track_col in focus_info.tracks_df.columns:
+                    if summary and summary.get('n_track_rows') == len(focus_info.tracks_df) and summary.get('track_ids'):
+                        # Precomputed at load time
+                        track_ids = list(summary['track_ids'])
+                    elif track_col in focus_info.tracks_df.columns:
                         track_ids = focus_info.tracks_df[track_col].unique().tolist()
                     else:
                         self.logger.error(f"{track_col} not in dataset {focus_info.name}.tracks_df.columns")
@@ -378,7 +458,9 @@ class DataSelectionWidget(CollapsibleWidget):
             truth_ids = []
             if focus_info.truth_df is not None and not focus_info.truth_df.empty:
                 truth_col = get_col(schema, 'truth', 'truth_id')
-                if truth_col in focus_info.truth_df.columns:
+                if summary and summary.get('n_truth_rows') == len(focus_info.truth_df) and summary.get('truth_ids'):
+                    truth_ids = list(summary['truth_ids'])
+                elif truth_col in focus_info.truth_df.columns:
                     truth_ids = focus_info.truth_df[truth_col].unique().tolist()
             
             # Update the UI
@@ -481,45 +563,62 @@ class DataSelectionWidget(CollapsibleWidget):
         """Set tracks selection."""
         if not self.tracks_listbox or not self.track_ids:
             return
-        
-        self.tracks_listbox.selection_clear(0, tk.END)
-        
-        if not track_ids:
-            # Select "None"
-            self.tracks_listbox.selection_set(1)
-        elif set(track_ids) == set(self.track_ids):
-            # Select "All Tracks"
-            self.tracks_listbox.selection_set(0)
-        else:
-            # Select individual tracks
-            for i in range(3, self.tracks_listbox.size()):  # Skip "All", "None", separator
-                item = self.tracks_listbox.get(i)
-                if item.startswith("Track "):
-                    track_id = item.replace("Track ", "")
-                    if track_id in track_ids:
-                        self.tracks_listbox.selection_set(i)
+        self._set_listbox_selection(self.tracks_listbox, "Track ", track_ids, self.track_ids)
     
     def set_truth_selection(self, truth_ids: List[str]):
         """Set truth selection."""
         if not self.truth_listbox or not self.truth_ids:
             return
+        self._set_listbox_selection(self.truth_listbox, "Truth ", truth_ids, self.truth_ids)
+    
+    @staticmethod
+    def _set_listbox_selection(listbox: tk.Listbox, prefix: str, ids: List[Any], all_ids: List[Any]):
+        """
+        Select the given IDs in a listbox laid out as "All", "None", then one row per ID.
         
-        self.truth_listbox.selection_clear(0, tk.END)
-        
-        if not truth_ids:
+        IDs are matched by their string form, since that is what the rows show.
+        IDs no longer listed are ignored; if none remain, "All" is selected.
+        """
+        listbox.selection_clear(0, tk.END)
+        wanted = {str(i) for i in ids}
+        if not wanted:
             # Select "None"
-            self.truth_listbox.selection_set(1)
-        elif set(truth_ids) == set(self.truth_ids):
-            # Select "All Truth"
-            self.truth_listbox.selection_set(0)
-        else:
-            # Select individual truth items
-            for i in range(3, self.truth_listbox.size()):  # Skip "All", "None", separator
-                item = self.truth_listbox.get(i)
-                if item.startswith("Truth "):
-                    truth_id = item.replace("Truth ", "")
-                    if truth_id in truth_ids:
-                        self.truth_listbox.selection_set(i)
+            listbox.selection_set(1)
+            return
+        if wanted == {str(i) for i in all_ids}:
+            # Select "All"
+            listbox.selection_set(0)
+            return
+        matched = False
+        for i in range(2, listbox.size()):  # Skip "All", "None"
+            item = listbox.get(i)
+            if item.startswith(prefix) and item[len(prefix):] in wanted:
+                listbox.selection_set(i)
+                matched = True
+        if not matched:
+            listbox.selection_set(0)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Capture collapsed state and the track/truth selections (None means "All")."""
+        state = super().get_state()
+        state['tracks'] = (None if self._all_selected(self.tracks_listbox, self.track_ids)
+                           else self.get_selected_tracks())
+        state['truth'] = (None if self._all_selected(self.truth_listbox, self.truth_ids)
+                          else self.get_selected_truth())
+        return state
+    
+    def restore_state(self, state: Dict[str, Any]):
+        """Re-apply selections captured by get_state(); unknown IDs are skipped."""
+        super().restore_state(state)
+        if state.get('tracks') is not None:
+            self.set_tracks_selection(state['tracks'])
+        if state.get('truth') is not None:
+            self.set_truth_selection(state['truth'])
+    
+    @staticmethod
+    def _all_selected(listbox: Optional[tk.Listbox], ids: List[Any]) -> bool:
+        """True when nothing is listed or the "All" row is selected."""
+        return not listbox or not ids or 0 in listbox.curselection()
 
 
 class CoordinateRangeWidget(CollapsibleWidget):
@@ -549,6 +648,9 @@ class CoordinateRangeWidget(CollapsibleWidget):
         self.range_callback: Optional[Callable] = None
         self.reset_callback: Optional[Callable] = None
         
+        # Cached ranges, invalidated by the variable traces
+        self._cached_ranges: Optional[Dict[str, tuple]] = None
+        
         self._create_controls()
     
     def _create_controls(self):
@@ -627,6 +729,7 @@ class CoordinateRangeWidget(CollapsibleWidget):
     
     def _on_range_changed(self, *args):
         """Handle coordinate range changes."""
+        self._cached_ranges = None
         if self.range_callback:
             self.range_callback(self.get_ranges())
     
@@ -645,10 +748,13 @@ class CoordinateRangeWidget(CollapsibleWidget):
     
     def get_ranges(self) -> Dict[str, tuple]:
         """Get current coordinate ranges."""
-        return {
-            'lat_range': (self.lat_min_var.get(), self.lat_max_var.get()),
-            'lon_range': (self.lon_min_var.get(), self.lon_max_var.get())
-        }
+        # Avoid four Tcl round-trips per call when nothing has changed
+        if self._cached_ranges is None:
+            self._cached_ranges = {
+                'lat_range': (self.lat_min_var.get(), self.lat_max_var.get()),
+                'lon_range': (self.lon_min_var.get(), self.lon_max_var.get())
+            }
+        return dict(self._cached_ranges)
     
     def set_ranges(self, lat_range: tuple, lon_range: tuple):
         """Set coordinate ranges."""
@@ -661,6 +767,29 @@ class CoordinateRangeWidget(CollapsibleWidget):
         self.lat_max_spin.set(f"{lat_range[1]:.4f}")
         self.lon_min_spin.set(f"{lon_range[0]:.4f}")
         self.lon_max_spin.set(f"{lon_range[1]:.4f}")
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Capture collapsed state and the current ranges."""
+        state = super().get_state()
+        try:
+            state.update(self.get_ranges())
+        except (tk.TclError, ValueError):
+            # Partially typed spinbox value; keep only what can be read
+            pass
+        return state
+    
+    def restore_state(self, state: Dict[str, Any]):
+        """Re-apply ranges captured by get_state() without firing the range callback."""
+        super().restore_state(state)
+        lat_range = state.get('lat_range')
+        lon_range = state.get('lon_range')
+        if lat_range and lon_range:
+            original_callback = self.range_callback
+            self.range_callback = None
+            try:
+                self.set_ranges(lat_range, lon_range)
+            finally:
+                self.range_callback = original_callback
 
 
 class TrackSelectionWidget(CollapsibleWidget):
@@ -693,6 +822,17 @@ class TrackSelectionWidget(CollapsibleWidget):
         self.track_ids: List[str] = []
         self._id_lookup: Dict[str, Any] = {}
         
+        # Small LRU cache of unique track IDs keyed by (id(tracks_df), column); each
+        # entry keeps a weakref to its frame so a reused id() is never a hit
+        self._track_ids_cache: Dict[Tuple[int, str], Tuple[weakref.ref, List[Any]]] = {}
+        self._track_ids_cache_size = 4
+        
+        # Hash of the track ID set currently shown, used to skip redundant repopulation
+        self._tracks_list_key: Optional[int] = None
+        
+        # Track IDs in listbox order (offset by the two special rows)
+        self._listed_track_ids: List[Any] = []
+        
         self._create_controls()
     
     def _create_controls(self):
@@ -706,7 +846,7 @@ class TrackSelectionWidget(CollapsibleWidget):
             selectmode=tk.EXTENDED,  # Enables Ctrl+Click and Shift+Click
             height=5,  # More room for tracks in single widget
             exportselection=False,  # Prevents losing selection when switching widgets
-            font=("TkDefaultFont", 8)
+            font=get_shared_font(self, 8)
         )
         
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tracks_listbox.yview)
@@ -723,6 +863,7 @@ class TrackSelectionWidget(CollapsibleWidget):
     
     def _show_empty_state(self):
         """Show empty state when no tracks are loaded."""
+        self._tracks_list_key = None
         if self.tracks_listbox:
             self.tracks_listbox.delete(0, tk.END)
             self.tracks_listbox.config(state="disabled")
@@ -737,6 +878,15 @@ class TrackSelectionWidget(CollapsibleWidget):
         if not self.tracks_listbox:
             return
         
+        # Same track set already listed: only reset the selection to "All Tracks"
+        list_key = hash(tuple(track_ids)) if track_ids else None
+        if list_key is not None and list_key == self._tracks_list_key:
+            self.track_ids = track_ids
+            self.tracks_listbox.selection_clear(0, tk.END)
+            self.tracks_listbox.selection_set(0)
+            return
+        self._tracks_list_key = list_key
+        
         self.tracks_listbox.delete(0, tk.END)
         self.tracks_listbox.config(state="normal")
         
@@ -746,14 +896,11 @@ class TrackSelectionWidget(CollapsibleWidget):
         
         self.track_ids = track_ids
         self._id_lookup = {str(t): t for t in track_ids}
+        self._listed_track_ids = sorted(track_ids)
         
-        # Add special options
-        self.tracks_listbox.insert(0, "All Tracks")
-        self.tracks_listbox.insert(1, "None")
-        
-        # Add track items
-        for track_id in sorted(track_ids):
-            self.tracks_listbox.insert(tk.END, f"Track {track_id}")
+        # Add special options and track items in a single Tcl call
+        self.tracks_listbox.insert(
+            tk.END, "All Tracks", "None", *(f"Track {track_id}" for track_id in self._listed_track_ids))
         
         # Select all tracks by default
         self.tracks_listbox.selection_set(0)  # Select "All Tracks"
@@ -803,12 +950,8 @@ class TrackSelectionWidget(CollapsibleWidget):
             self.tracks_listbox.selection_set(1)  # "None"
             selected_tracks = []
         else:
-            # Normal selection - extract IDs from "Track X" format
-            selected_tracks = []
-            for item in selected_items:
-                if item.startswith("Track ") and not item.startswith("─"):
-                    track_id = item.replace("Track ", "")
-                    selected_tracks.append(track_id)
+            # Normal selection - map listbox positions straight to track IDs
+            selected_tracks = self._track_ids_for_indices(selected_indices)
         
         if self.selection_callback:
             self.selection_callback(selected_tracks)
@@ -822,6 +965,15 @@ class TrackSelectionWidget(CollapsibleWidget):
             # Load initial data if available
             self._update_tracks_from_focus()
     
+    def destroy(self):
+        """Unregister from the model before the widget is destroyed."""
+        if self.controller:
+            try:
+                self.controller.model.remove_observer(self)
+            except Exception as e:
+                self.logger.debug(f"Error removing observer: {e}")
+        super().destroy()
+    
     def on_state_changed(self, event: str):
         """Handle state changes from the application."""
         if event == "focus_changed":
@@ -836,7 +988,7 @@ class TrackSelectionWidget(CollapsibleWidget):
             state = self.controller.get_state()
             focus_info = state.get_focus_dataset_info()
             
-            if not focus_info or focus_info.status.value != "loaded":
+            if not focus_info or focus_info.status is not DatasetStatus.LOADED:
                 self._show_empty_state()
                 return
             
@@ -846,8 +998,12 @@ class TrackSelectionWidget(CollapsibleWidget):
                 from ..utils.schema_access import get_col
                 schema = getattr(focus_info, 'schema', None)
                 track_col = get_col(schema, 'tracks', 'track_id')
-                if track_col in focus_info.tracks_df.columns:
-                    track_ids = focus_info.tracks_df[track_col].unique().tolist()
+                summary = getattr(focus_info, 'track_summary', None)
+                if summary and summary.get('n_track_rows') == len(focus_info.tracks_df) and summary.get('track_ids'):
+                    # Precomputed at load time
+                    track_ids = list(summary['track_ids'])
+                elif track_col in focus_info.tracks_df.columns:
+                    track_ids = self._get_cached_track_ids(focus_info.tracks_df, track_col)
                 else:
                     self.logger.error(f"{track_col} not in dataset {focus_info.name}.tracks_df.columns")
             
@@ -861,6 +1017,32 @@ class TrackSelectionWidget(CollapsibleWidget):
             self.logger.error(f"Error updating tracks from focus: {e}")
             self._show_empty_state()
     
+    def _get_cached_track_ids(self, tracks_df: Any, track_col: str) -> List[Any]:
+        """
+        Get the unique track IDs for a tracks DataFrame, memoized by identity.
+        
+        Args:
+            tracks_df: Tracks DataFrame of the focus dataset
+            track_col: Physical name of the track ID column
+            
+        Returns:
+            List of unique track IDs (sorted for display by _populate_tracks)
+        """
+        key = (id(tracks_df), track_col)
+        entry = self._track_ids_cache.pop(key, None)
+        if entry is not None and entry[0]() is tracks_df:
+            track_ids = entry[1]
+        else:
+            # Miss, or a dead frame whose id() was reused by this one
+            track_ids = tracks_df[track_col].unique().tolist()
+        
+        # Re-insert so the most recently used entry is last; evict the oldest
+        self._track_ids_cache[key] = (weakref.ref(tracks_df), track_ids)
+        while len(self._track_ids_cache) > self._track_ids_cache_size:
+            self._track_ids_cache.pop(next(iter(self._track_ids_cache)))
+        
+        return list(track_ids)
+    
     def set_selection_callback(self, callback: Callable[[List[str]], None]):
         """Set callback for selection changes."""
         self.selection_callback = callback
@@ -882,44 +1064,62 @@ class TrackSelectionWidget(CollapsibleWidget):
         elif "None" in selected_items:
             return []
         else:
-            selected_tracks = []
-            for item in selected_items:
-                if item.startswith("Track ") and not item.startswith("─"):
-                    raw = item.replace("Track ", "")
-                    if raw in getattr(self, '_id_lookup', {}):
-                        selected_tracks.append(self._id_lookup[raw])
-                    else:
-                        try:
-                            selected_tracks.append(int(raw))
-                        except ValueError:
-                            selected_tracks.append(raw)
-            return selected_tracks
+            return self._track_ids_for_indices(selected_indices)
+    
+    def _track_ids_for_indices(self, selected_indices) -> List[Any]:
+        """
+        Map selected listbox indices to track IDs in their original dtype.
+        
+        Args:
+            selected_indices: Indices returned by Listbox.curselection()
+            
+        Returns:
+            List of selected track IDs
+        """
+        listed = self._listed_track_ids
+        return [listed[i - 2] for i in selected_indices if 2 <= i < len(listed) + 2]
     
     def get_selection(self) -> List[str]:
         """Get current selection (alias for compatibility)."""
         return self.get_selected_tracks()
     
     def set_selection(self, track_ids: List[str]):
-        """Set track selection."""
+        """Set track selection; IDs no longer listed are ignored."""
         if not self.tracks_listbox or not self.track_ids:
             return
         
         self.tracks_listbox.selection_clear(0, tk.END)
         
-        if not track_ids:
+        wanted = {str(t) for t in track_ids}
+        if not wanted:
             # Select "None"
             self.tracks_listbox.selection_set(1)
-        elif set(track_ids) == set(self.track_ids):
+        elif wanted == {str(t) for t in self.track_ids}:
             # Select "All Tracks"
             self.tracks_listbox.selection_set(0)
         else:
-            # Select individual tracks
-            for i in range(3, self.tracks_listbox.size()):  # Skip "All", "None", separator
-                item = self.tracks_listbox.get(i)
-                if item.startswith("Track "):
-                    track_id = item.replace("Track ", "")
-                    if track_id in track_ids:
-                        self.tracks_listbox.selection_set(i)
+            # Select individual tracks (rows follow the two special entries)
+            matched = False
+            for offset, track_id in enumerate(self._listed_track_ids):
+                if str(track_id) in wanted:
+                    self.tracks_listbox.selection_set(offset + 2)
+                    matched = True
+            if not matched:
+                self.tracks_listbox.selection_set(0)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Capture collapsed state and the track selection (None means "All Tracks")."""
+        state = super().get_state()
+        all_selected = (not self.tracks_listbox or not self.track_ids
+                        or 0 in self.tracks_listbox.curselection())
+        state['tracks'] = None if all_selected else self.get_selected_tracks()
+        return state
+    
+    def restore_state(self, state: Dict[str, Any]):
+        """Re-apply the selection captured by get_state()."""
+        super().restore_state(state)
+        if state.get('tracks') is not None:
+            self.set_selection(state['tracks'])
 
 
 class PlaybackControlWidget(CollapsibleWidget):
@@ -944,10 +1144,15 @@ class PlaybackControlWidget(CollapsibleWidget):
         self.current_frame = tk.IntVar(value=0)
         self.speed = tk.DoubleVar(value=1.0)
         
+        # Plain Python mirror of current_frame to avoid Tcl round-trips per frame
+        self._frame_idx = 0
+        
         # Animation data and timing
         self.max_frames = 0
         self.timer_id: Optional[str] = None
         self.base_interval = 100  # Base interval in milliseconds
+        self._speed_debounce_id: Optional[str] = None
+        self._speed_debounce_ms = 50
         
         # Callbacks
         self.play_callback: Optional[Callable] = None
@@ -1060,7 +1265,14 @@ class PlaybackControlWidget(CollapsibleWidget):
             self.step_callback(1)
     
     def _on_speed_changed(self, *args):
-        """Handle speed change."""
+        """Handle speed change, coalescing rapid updates while the scale is dragged."""
+        if self._speed_debounce_id is not None:
+            self.after_cancel(self._speed_debounce_id)
+        self._speed_debounce_id = self.after(self._speed_debounce_ms, self._apply_speed_change)
+    
+    def _apply_speed_change(self):
+        """Apply the most recent speed value to the label and callback."""
+        self._speed_debounce_id = None
         speed_val = self.speed.get()
         self.speed_label.config(text=f"{speed_val:.1f}x")
         if self.speed_callback:
@@ -1101,18 +1313,22 @@ class PlaybackControlWidget(CollapsibleWidget):
     
     def set_current_frame(self, frame: int):
         """Set the current frame."""
+        # Skip the Tcl variable write and label reconfigure when nothing changed
+        if frame == self._frame_idx:
+            return
+        self._frame_idx = frame
         self.current_frame.set(frame)
         self.update_frame_display()
     
     def update_frame_display(self):
         """Update the frame indicator."""
-        current = self.current_frame.get()
+        current = self._frame_idx
         total = self.max_frames
         self.frame_label.config(text=f"Frame: {current + 1}/{total}")
     
     def get_current_frame(self) -> int:
         """Get current frame."""
-        return self.current_frame.get()
+        return self._frame_idx
     
     def get_speed(self) -> float:
         """Get current speed."""
@@ -1125,6 +1341,24 @@ class PlaybackControlWidget(CollapsibleWidget):
     def set_playing(self, playing: bool):
         """Set playing state."""
         self.playing.set(playing)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Capture collapsed state, speed and frame position."""
+        state = super().get_state()
+        state['speed'] = self.get_speed()
+        state['frame'] = self._frame_idx
+        return state
+    
+    def restore_state(self, state: Dict[str, Any]):
+        """
+        Re-apply the speed captured by get_state().
+        
+        The frame position is left to the owning tab, which has to rebuild its
+        frames before it can seek.
+        """
+        super().restore_state(state)
+        if state.get('speed') is not None:
+            self.speed.set(state['speed'])
 
 
 class HistogramControlWidget(CollapsibleWidget):
@@ -1309,6 +1543,35 @@ class HistogramControlWidget(CollapsibleWidget):
     def set_change_callback(self, cb: Callable[[], None]):
         self._change_callback = cb
 
+    # Tk variables captured by get_state()/restore_state()
+    _STATE_VARS = (
+        'gaussian_var', 'unit_gaussian_var', 'best_fit_gaussian_var', 'bin_count_var',
+        'sigma_extent_var', 'sigma_bands_var', 'y_range_mode_var', 'scatter_enabled_var',
+        'scatter_var_choice',
+    )
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        for name in self._STATE_VARS:
+            try:
+                state[name] = getattr(self, name).get()
+            except (tk.TclError, ValueError):
+                # Partially typed spinbox value; the default is kept on restore
+                pass
+        return state
+
+    def restore_state(self, state: Dict[str, Any]):
+        super().restore_state(state)
+        # Silence the change callback; the owning tab redraws once afterwards
+        callback, self._change_callback = self._change_callback, None
+        try:
+            for name in self._STATE_VARS:
+                if name in state:
+                    getattr(self, name).set(state[name])
+            self._update_extent_state()
+        finally:
+            self._change_callback = callback
+
 __all__ = [
     'CollapsibleWidget',
     'DataSelectionWidget',
@@ -10,17 +10,20 @@ centralizes:
     - Nearest-truth row matching for per-track timestamps
     - Time axis alignment + truncation of multi-series to a common length
     - Simple style generation (colors / markers / line variants)
+    - Thread-safe snapshots of formatter inputs (widgets + focus dataset)
 
 These helpers intentionally avoid any GUI dependencies beyond the minimal
 "widget has method" duck-typing already present in existing code.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import itertools
 
+from ..models.application_state import DatasetStatus
+
 try:  # Optional heavy dependencies (guard for faster import path)
     import pandas as pd  # type: ignore
     import numpy as np  # type: ignore
@@ -47,6 +50,67 @@ class FocusDataFrames:
     schema: Any = None  # mapping or None
     capabilities: Any = None  # list or None
 
+class WidgetSnapshot:
+    """Frozen stand-in for a formatter widget, safe to hand to a worker thread.
+
+    Calls the widget's formatter-facing accessors (listed in ACCESSORS) once on
+    the Tk thread and replays them, so formatters keep duck-typing against the
+    same method names without touching Tk variables. An accessor that raised is
+    replayed as the same exception.
+    """
+
+    # Accessors formatters read: Track/DataSelectionWidget, CoordinateRangeWidget,
+    # HistogramControlWidget
+    ACCESSORS = (
+        'get_selected_tracks', 'get_selected_truth',
+        'get_ranges',
+        'get_bin_count', 'get_sigma_extent', 'y_range_mode', 'sigma_bands_enabled',
+        'gaussian_overlay_enabled', 'unit_gaussian_enabled', 'best_fit_gaussian_enabled',
+        'scatter_overlay_enabled', 'get_scatter_variable',
+    )
+
+    def __init__(self, widget: Any):
+        self._values: Dict[str, Any] = {}
+        self._errors: Dict[str, Exception] = {}
+        for name in self.ACCESSORS:
+            accessor = getattr(widget, name, None)
+            if accessor is None:
+                continue
+            try:
+                self._values[name] = accessor()
+            except Exception as e:
+                self._errors[name] = e
+
+    def __getattr__(self, name: str):
+        values = self.__dict__.get('_values', {})
+        if name in values:
+            value = values[name]
+            return lambda: value
+        error = self.__dict__.get('_errors', {}).get(name)
+        if error is not None:
+            def _raise():
+                raise error
+            return _raise
+        raise AttributeError(name)
+
+
+class StateSnapshot:
+    """Frozen stand-in for ApplicationState, safe to hand to a worker thread.
+
+    Formatters and PlotManager only read the focus dataset. A shallow copy of
+    its DatasetInfo is taken on the Tk thread, so a concurrent reload or
+    clear_datasets() cannot swap DataFrames or status under a computation.
+    """
+
+    def __init__(self, app_state: Any):
+        focus = app_state.get_focus_dataset_info()
+        self.focus_dataset: Optional[str] = getattr(focus, 'name', None)
+        self._focus_info = replace(focus) if focus is not None else None
+
+    def get_focus_dataset_info(self) -> Any:
+        return self._focus_info
+
+
 class FormatterSupport:
     """Namespace of static helper methods used by formatters."""
 
@@ -55,7 +119,7 @@ class FormatterSupport:
         """Return FocusDataFrames if focus dataset loaded & non-empty else None."""
         try:
             focus = app_state.get_focus_dataset_info()
-            if not focus or focus.status.value != "loaded":
+            if not focus or focus.status is not DatasetStatus.LOADED:
                 return None
             return FocusDataFrames(
                 tracks_df   =getattr(focus, 'tracks_df', None),
@@ -84,6 +148,129 @@ class FormatterSupport:
                 continue
         return None
 
+    @staticmethod
+    def timestamp_values(series) -> Any:
+        """Return timestamps as a float64 array (ns for datetimes) with NaN for missing values."""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            if getattr(series.dt, 'tz', None) is not None:
+                series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+            values = series.to_numpy(dtype='datetime64[ns]').view('int64').astype(float)
+            values[series.isna().to_numpy()] = np.nan
+            return values
+        return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+
+    @staticmethod
+    def nearest_indices(query: Any, reference: Any) -> Any:
+        """Positions in ``reference`` of the value nearest to each ``query`` value (-1 if none).
+
+        Vectorized replacement for a per-row ``(reference - t).abs().idxmin()`` scan:
+        one sort of the reference plus a binary search per query. Among equally
+        near reference values (duplicates, or one either side at exactly half the
+        gap) the first one in original order wins, as with idxmin.
+        """
+        result = np.full(len(query), -1, dtype=np.int64)
+        order = np.argsort(reference, kind='mergesort')  # NaN sorts last
+        n_valid = int(np.count_nonzero(~np.isnan(reference)))
+        if n_valid == 0 or len(query) == 0:
+            return result
+        order = order[:n_valid]
+        ref_sorted = reference[order]
+
+        ok = ~np.isnan(query)
+        q = query[ok]
+        pos = np.searchsorted(ref_sorted, q, side='left')
+        lo = np.clip(pos - 1, 0, n_valid - 1)
+        hi = np.clip(pos, 0, n_valid - 1)
+        # Stable sort: the leftmost of a run of equal values is its first row
+        lo_row = order[np.searchsorted(ref_sorted, ref_sorted[lo], side='left')]
+        hi_row = order[np.searchsorted(ref_sorted, ref_sorted[hi], side='left')]
+        lo_dist = np.abs(q - ref_sorted[lo])
+        hi_dist = np.abs(ref_sorted[hi] - q)
+        result[ok] = np.where(
+            lo_dist < hi_dist, lo_row,
+            np.where(hi_dist < lo_dist, hi_row, np.minimum(lo_row, hi_row)))
+        return result
+
+    @staticmethod
+    def nearest_truth_errors(
+        tracks_df,
+        truth_df,
+        schema: Any,
+        components: Sequence[str] = ('north', 'east'),
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Position errors of each track row against the truth row nearest in time.
+
+        components: any of 'north', 'east', 'alt' (metres; 'alt' is 0 when either
+        frame lacks an altitude column).
+
+        Returns (matched, errors): a boolean mask over tracks_df rows that found a
+        truth row, and per-component float arrays for the matched rows. As with
+        the old per-row loop, a row whose position values cannot be converted to
+        numbers is skipped (and a bad altitude only zeroes that row's 'alt').
+        """
+        from ..utils.schema_access import get_col
+        t_ts = FormatterSupport.timestamp_values(tracks_df[get_col(schema, 'tracks', 'timestamp')])
+        tr_ts = FormatterSupport.timestamp_values(truth_df[get_col(schema, 'truth', 'timestamp')])
+        idx = FormatterSupport.nearest_indices(t_ts, tr_ts)
+        matched = idx >= 0
+        idx = idx[matched]
+        # Rows holding a value that is present but not numeric
+        invalid = np.zeros(len(idx), dtype=bool)
+
+        def _values(df, role: str, name: str, rows):
+            series = df[get_col(schema, role, name)]
+            values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+            bad = np.isnan(values) & series.notna().to_numpy()
+            return values[rows], bad[rows]
+
+        errors: Dict[str, Any] = {}
+        if 'north' in components or 'east' in components:
+            truth_lat, bad = _values(truth_df, 'truth', 'lat', idx)
+            invalid |= bad
+        if 'north' in components:
+            track_lat, bad = _values(tracks_df, 'tracks', 'lat', matched)
+            invalid |= bad
+            errors['north'] = (track_lat - truth_lat) * 111000.0
+        if 'east' in components:
+            track_lon, bad_track = _values(tracks_df, 'tracks', 'lon', matched)
+            truth_lon, bad_truth = _values(truth_df, 'truth', 'lon', idx)
+            invalid |= bad_track | bad_truth
+            errors['east'] = (track_lon - truth_lon) * 111000.0 * np.cos(np.radians(truth_lat))
+        if 'alt' in components:
+            alt_error = np.zeros(len(idx))
+            if (get_col(schema, 'tracks', 'alt') in tracks_df.columns
+                    and get_col(schema, 'truth', 'alt') in truth_df.columns):
+                track_alt, bad_track = _values(tracks_df, 'tracks', 'alt', matched)
+                truth_alt, bad_truth = _values(truth_df, 'truth', 'alt', idx)
+                alt_error = np.where(bad_track | bad_truth, 0.0, track_alt - truth_alt)
+            errors['alt'] = alt_error
+
+        if invalid.any():
+            keep = ~invalid
+            matched[np.flatnonzero(matched)[invalid]] = False
+            errors = {name: values[keep] for name, values in errors.items()}
+        return matched, errors
+
+    @staticmethod
+    def split_by_id(ids: Any, order_values: Any) -> List[Tuple[Any, Any]]:
+        """Group flat per-row arrays by id without a per-group DataFrame pass.
+
+        Sorts once by (id, order_values) and cuts at id boundaries. Ids come out in
+        sorted order (as with groupby); rows with a missing id are dropped.
+
+        Returns list of (id, positions) where positions index the input arrays,
+        ordered by order_values within each id.
+        """
+        codes, uniques = pd.factorize(ids, sort=True)
+        order = np.lexsort((order_values, codes))
+        order = order[codes[order] >= 0]
+        if len(order) == 0:
+            return []
+        codes = codes[order]
+        bounds = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        first = np.concatenate(([0], bounds))
+        return list(zip(uniques[codes[first]], np.split(order, bounds)))
+
     @staticmethod
     def build_time_axis_and_truncate(
         series_dict: Dict[str, List[float]],
@@ -153,6 +340,8 @@ class FormatterSupport:
 __all__ = [
     'FormatterSupport',
     'FocusDataFrames',
+    'WidgetSnapshot',
+    'StateSnapshot',
     'COLOR_CYCLE',
     'MARKER_CYCLE',
 ]
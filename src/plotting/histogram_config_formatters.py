@@ -11,7 +11,6 @@ Design:
 """
 from __future__ import annotations
 from typing import Any, Dict, Sequence, Callable, Optional, List
-import math
 
 from .formatter_support import FormatterSupport as FS
 from ..utils.schema_access import get_col
@@ -65,18 +64,9 @@ def _collect_track_errors(app_state, widgets: Sequence[Any], component: str) ->
     if tracks_df is None or truth_df is None or tracks_df.empty or truth_df.empty:
         return []
 
-    # Resolve columns via schema mapping
+    # Resolve columns via schema mapping (missing position columns raise below)
     schema = getattr(focus, 'schema', None)
-    t_ts_col   = get_col(schema, 'tracks', 'timestamp')
-    t_lat_col  = get_col(schema, 'tracks', 'lat')
-    t_lon_col  = get_col(schema, 'tracks', 'lon')
-    t_id_col   = get_col(schema, 'tracks', 'track_id')
-    tr_ts_col  = get_col(schema, 'truth', 'timestamp')
-    tr_lat_col = get_col(schema, 'truth', 'lat')
-    tr_lon_col = get_col(schema, 'truth', 'lon')
-
-    if any(c not in tracks_df.columns for c in [t_ts_col, t_lat_col, t_lon_col]) or any(c not in truth_df.columns for c in [tr_ts_col, tr_lat_col, tr_lon_col]):
-        return []
+    t_id_col = get_col(schema, 'tracks', 'track_id')
 
     selected_tracks = FS.extract_selected_tracks(widgets)
     if selected_tracks is not None and len(selected_tracks) == 0:
@@ -86,23 +76,11 @@ def _collect_track_errors(app_state, widgets: Sequence[Any], component: str) ->
         if tracks_df.empty:
             return []
 
-    errors: List[float] = []
     try:
-        for _, row in tracks_df.iterrows():
-            try:
-                diffs = (truth_df[tr_ts_col] - row[t_ts_col]).abs()
-                idx = diffs.idxmin()
-                truth_row = truth_df.loc[idx]
-                if component == 'north':
-                    err = (row[t_lat_col] - truth_row[tr_lat_col]) * 111000.0
-                else:
-                    err = (row[t_lon_col] - truth_row[tr_lon_col]) * 111000.0 * math.cos(math.radians(truth_row[tr_lat_col]))
-                errors.append(float(err))
-            except Exception:
-                continue
+        _, errs = FS.nearest_truth_errors(tracks_df, truth_df, schema, (component,))
+        return errs[component].tolist()
     except Exception:
         return []
-    return errors
 
 def _build_error_histogram(app_state, widgets: Sequence[Any], component: str, title: str) -> Dict[str, Any]:
     """Generic builder for error histograms (north/east) including optional secondary scatter.
@@ -126,10 +104,10 @@ def _build_error_histogram(app_state, widgets: Sequence[Any], component: str, ti
     mean = float(arr.mean())
     std = float(arr.std(ddof=0)) or 1.0
 
-    # Control widget detection
+    # Control widget detection (duck-typed so widget snapshots match too)
     hist_ctrl = None
     for w in widgets:
-        if w.__class__.__name__ == 'HistogramControlWidget':
+        if hasattr(w, 'get_bin_count'):
             hist_ctrl = w
             break
     extent_sigma              = 4.0
@@ -224,30 +202,14 @@ def _build_error_histogram(app_state, widgets: Sequence[Any], component: str, ti
             tracks_df = focus.tracks_df if focus else None
             truth_df = focus.truth_df if focus else None
             if tracks_df is not None and truth_df is not None and not tracks_df.empty and scatter_var in tracks_df.columns:
-                # Re-run per-row loop to align scatter values with error values
-                scatter_vals: List[float] = []
-                error_vals: List[float] = []
-                for _, row in tracks_df.iterrows():
-                    try:
-                        schema = focus.schema if focus else None
-                        track_time_col = get_col(schema, 'tracks', 'timestamp')
-                        truth_time_col = get_col(schema, 'truth', 'timestamp')
-                        diffs = abs(truth_df[truth_time_col] - row[track_time_col])
-                        idx = diffs.idxmin()
-                        truth_row = truth_df.loc[idx]
-                        if component == 'north':
-                            err = (row['lat'] - truth_row['lat']) * 111000.0
-                        else:
-                            err = (row['lon'] - truth_row['lon']) * 111000.0 * math.cos(math.radians(truth_row['lat']))
-                        sv = row[scatter_var]
-                        if sv is not None and not (isinstance(sv, float) and math.isnan(sv)):
-                            error_vals.append(float(err))
-                            scatter_vals.append(float(sv))
-                    except Exception:
-                        continue
-                if error_vals:
-                    error_arr = np.array(error_vals, dtype=float)
-                    scatter_arr = np.array(scatter_vals, dtype=float)
+                # Recompute errors over all tracks to align scatter values with error values
+                import pandas as pd
+                matched, errs = FS.nearest_truth_errors(tracks_df, truth_df, focus.schema, (component,))
+                scatter_all = pd.to_numeric(tracks_df[scatter_var], errors='coerce').to_numpy(dtype=float)[matched]
+                has_value = ~np.isnan(scatter_all)
+                if has_value.any():
+                    error_arr = errs[component][has_value]
+                    scatter_arr = scatter_all[has_value]
                     bin_indices = np.searchsorted(edges_arr, error_arr, side='right') - 1
                     nbins = len(edges_arr) - 1
                     bin_sums = np.zeros(nbins, dtype=float)
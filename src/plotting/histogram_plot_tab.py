@@ -2,6 +2,9 @@
 
 Analogous to XYPlotTabWidget but specialized for histogram render requests.
 Formatter returns values + stats; PlotManager prepares; backend renders.
+
+Background refresh follows XYPlotTabWidget: snapshot_plot_inputs() (Tk thread)
+-> compute_plot_data(inputs) (any thread) -> apply_plot_data(result) (Tk thread).
 """
 from __future__ import annotations
 import tkinter as tk
@@ -12,6 +15,7 @@ from .widgets import PlotTabWidget
 from .backends import PlotBackend
 from .control_widgets import DataSelectionWidget, TrackSelectionWidget, HistogramControlWidget
 from .histogram_config_formatters import get_hist_formatter
+from .formatter_support import StateSnapshot, WidgetSnapshot
 
 class HistogramPlotTabWidget(PlotTabWidget):
     def __init__(
@@ -30,9 +34,14 @@ class HistogramPlotTabWidget(PlotTabWidget):
         self._explicit_formatter = config_formatter
         self._explicit_formatter_widgets = list(formatter_widgets) if formatter_widgets else []
         self._formatter_name = formatter_name
+        self._formatter = config_formatter
+        if self._formatter is None and formatter_name:
+            self._formatter = get_hist_formatter(formatter_name)
         self.data_selection_widget = None
         self.track_selection_widget = None
         self.hist_control_widget: Optional[HistogramControlWidget] = None
+        # Bumped per snapshot so results of superseded background computations are dropped
+        self._plot_generation = 0
         super().__init__(parent, backend, title)
         self._update_histogram()
 
@@ -74,19 +83,8 @@ class HistogramPlotTabWidget(PlotTabWidget):
     def request_update(self):
         self._update_histogram()
 
-    def _build_hist_config(self) -> Dict[str, Any]:
-        if not self.controller:
-            return {'histograms': []}
-        formatter = self._explicit_formatter
-        if formatter is None and self._formatter_name:
-            try:
-                formatter = get_hist_formatter(self._formatter_name)  # type: ignore[assignment]
-            except Exception:
-                formatter = None
-        if formatter is None:
-            formatter = self.get_config_formatter()
-        if not formatter:
-            return {'histograms': []}
+    def _formatter_widgets(self) -> List[Any]:
+        """Collect the widgets passed to the formatter."""
         widgets: List[Any] = []
         if self.include_data_selection and self.data_selection_widget:
             widgets.append(self.data_selection_widget)
@@ -97,7 +95,21 @@ class HistogramPlotTabWidget(PlotTabWidget):
             widgets.append(self.hist_control_widget)
         widgets.extend(self._explicit_formatter_widgets)
         widgets.extend(self.get_formatter_widgets())
-        app_state = self.controller.get_state()
+        return widgets
+
+    def _build_hist_config(self, widgets: Optional[List[Any]] = None,
+                           app_state: Optional[Any] = None) -> Dict[str, Any]:
+        if not self.controller:
+            return {'histograms': []}
+        formatter = self._formatter
+        if formatter is None:
+            formatter = self.get_config_formatter()
+        if not formatter:
+            return {'histograms': []}
+        if widgets is None:
+            widgets = self._formatter_widgets()
+        if app_state is None:
+            app_state = self.controller.get_state()
         try:
             cfg = formatter(app_state, widgets) or {}
         except Exception as e:
@@ -110,22 +122,59 @@ class HistogramPlotTabWidget(PlotTabWidget):
             cfg = {'histograms': [single], 'title': single.get('title','Histogram')}
         return cfg
 
+    def snapshot_plot_inputs(self) -> Dict[str, Any]:
+        """Capture the formatter inputs on the Tk thread for compute_plot_data()."""
+        self._plot_generation += 1
+        widgets = [WidgetSnapshot(w) for w in self._formatter_widgets()]
+        app_state = StateSnapshot(self.controller.get_state()) if self.controller else None
+        return {'generation': self._plot_generation, 'widgets': widgets, 'app_state': app_state}
+
+    def compute_plot_data(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the formatter and PlotManager preparation; touches no Tk or Matplotlib objects."""
+        result: Dict[str, Any] = {'generation': inputs.get('generation'), 'plot_data': None}
+        app_state = inputs.get('app_state')
+        if not (self.plot_manager and self.controller and app_state is not None):
+            return result
+        cfg = self._build_hist_config(inputs.get('widgets'), app_state)
+        plot_data = self.plot_manager.prepare_plot_data('histogram', app_state, cfg)
+        if plot_data and plot_data.get('histograms'):
+            result['plot_data'] = plot_data
+        return result
+
+    def apply_plot_data(self, result: Dict[str, Any]):
+        """Draw a compute_plot_data() result unless a newer snapshot superseded it."""
+        if result.get('generation') != self._plot_generation:
+            return
+        self._last_plot_result = result
+        try:
+            plot_data = result.get('plot_data')
+            if plot_data:
+                self.update_plot('histogram', plot_data, {'title': plot_data.get('title','Histogram')})
+            else:
+                self.clear_plot()
+        except Exception as e:
+            logging.getLogger(__name__).error(f'Error applying histogram data: {e}')
+            self.clear_plot()
+
     def _update_histogram(self):
         try:
             if not (self.plot_manager and self.controller):
                 self.clear_plot()
                 return
-            cfg = self._build_hist_config()
-            app_state = self.controller.get_state()
-            plot_data = self.plot_manager.prepare_plot_data('histogram', app_state, cfg)
-            if plot_data and plot_data.get('histograms'):
-                self.update_plot('histogram', plot_data, {'title': plot_data.get('title','Histogram')})
-            else:
-                self.clear_plot()
+            self.apply_plot_data(self.compute_plot_data(self.snapshot_plot_inputs()))
         except Exception as e:
             logging.getLogger(__name__).error(f'Error updating histogram: {e}')
             self.clear_plot()
 
+    def _on_state_restored(self, state: Dict[str, Any], same_dataset: bool):
+        result = state.get('plot_result') if same_dataset else None
+        if result is None:
+            self.request_update()
+            return
+        # Data and settings unchanged since the tab was released: redraw as-is
+        self._plot_generation += 1
+        self.apply_plot_data(dict(result, generation=self._plot_generation))
+
     def auto_update(self):
         self.on_focus_dataset_changed()
         self._update_histogram()
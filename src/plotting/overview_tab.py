@@ -11,7 +11,7 @@ from typing import Optional, Any, Dict
 import logging
 
 from ..utils.schema_access import get_col
-from ..models.application_state import DatasetInfo
+from ..models.application_state import DatasetInfo, DatasetStatus
 from datetime import datetime
 import math
 
@@ -82,7 +82,7 @@ class OverviewTabWidget(ttk.Frame):
         try:
             state = self.controller.get_state()
             focus = state.get_focus_dataset_info()
-            if not focus or focus.status.value != "loaded":
+            if not focus or focus.status is not DatasetStatus.LOADED:
                 for v in self.fields.values():
                     v.set("-")
                 return
@@ -10,6 +10,7 @@ from tkinter import ttk, messagebox
 from typing import Optional, Any, Dict, Callable
 import logging
 from .backends import PlotBackend
+from ..models.application_state import DatasetStatus
 
 
 class PlotCanvasWidget(ttk.Frame):
@@ -89,6 +90,38 @@ class PlotCanvasWidget(ttk.Frame):
         except Exception as e:
             self.logger.error(f"Error creating plot: {e}")
     
+    def update_animation_frame(self, data: Dict[str, Any],
+                               config: Optional[Dict[str, Any]] = None):
+        """
+        Update the current animation frame using the backend's incremental path.
+        
+        Args:
+            data: Frame data
+            config: Optional configuration parameters
+        """
+        try:
+            result = self.backend.update_animation_frame(data, config)
+            if not result.success:
+                self.logger.error(f"Animation frame update failed: {result.error}")
+        except Exception as e:
+            self.logger.error(f"Error updating animation frame: {e}")
+    
+    def update_generic_xy(self, data: Dict[str, Any],
+                          config: Optional[Dict[str, Any]] = None):
+        """
+        Update a generic XY plot using the backend's incremental path.
+        
+        Args:
+            data: Series data
+            config: Optional configuration parameters
+        """
+        try:
+            result = self.backend.update_generic_xy(data, config)
+            if not result.success:
+                self.logger.error(f"XY plot update failed: {result.error}")
+        except Exception as e:
+            self.logger.error(f"Error updating XY plot: {e}")
+    
     def set_axis_limits(self, x_range: Optional[tuple] = None, y_range: Optional[tuple] = None):
         """Set axis limits for the current plot."""
         self.backend.set_axis_limits(x_range, y_range)
@@ -115,8 +148,18 @@ class PlotTabWidget(ttk.Frame):
     - Control panel structure
     - Data update handling
     - Auto-update interface for data changes
+    - Control state capture/restore across widget rebuilds
     """
     
+    # Child control widgets whose settings survive the tab being rebuilt
+    _STATE_WIDGETS = ('data_selection_widget', 'track_selection_widget', 'coord_range_widget',
+                      'hist_control_widget', 'playback_widget')
+    # Of those, the ones whose settings only apply to the dataset they were captured on
+    _DATASET_STATE_WIDGETS = ('data_selection_widget', 'track_selection_widget', 'coord_range_widget')
+    
+    # Last result drawn by apply_plot_data(), for tabs that compute in the background
+    _last_plot_result: Optional[Dict[str, Any]] = None
+    
     def __init__(self, parent: tk.Widget, backend: PlotBackend, tab_name: str):
         """
         Initialize the plot tab widget.
@@ -215,6 +258,71 @@ class PlotTabWidget(ttk.Frame):
         # Default implementation - override in subclasses
         pass
     
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Capture the settings of this tab's control widgets.
+        
+        Tabs that compute in the background also carry their last drawn
+        result under 'plot_result', so a rebuilt tab whose data and settings
+        are unchanged can redraw it without rerunning its formatter. Callers
+        drop that key once the data changes.
+        
+        Returns:
+            Plain-data dict to pass to restore_state() on a rebuilt tab
+        """
+        widgets: Dict[str, Any] = {}
+        for name in self._STATE_WIDGETS:
+            widget = getattr(self, name, None)
+            if widget is None or not hasattr(widget, 'get_state'):
+                continue
+            try:
+                widgets[name] = widget.get_state()
+            except Exception as e:
+                self.logger.debug(f"Could not capture state of {name}: {e}")
+        state: Dict[str, Any] = {'focus': self._focus_dataset_name(), 'widgets': widgets}
+        if self._last_plot_result is not None:
+            state['plot_result'] = self._last_plot_result
+        return state
+    
+    def restore_state(self, state: Dict[str, Any]):
+        """
+        Re-apply settings captured by get_state(), then redraw.
+        
+        Dataset-specific settings (selections, coordinate ranges) are only
+        restored if the focus dataset is the one they were captured on.
+        
+        Args:
+            state: Dict returned by get_state()
+        """
+        same_dataset = state.get('focus') == self._focus_dataset_name()
+        for name, widget_state in (state.get('widgets') or {}).items():
+            if not same_dataset and name in self._DATASET_STATE_WIDGETS:
+                continue
+            widget = getattr(self, name, None)
+            if widget is None or not hasattr(widget, 'restore_state'):
+                continue
+            try:
+                widget.restore_state(widget_state)
+            except Exception as e:
+                self.logger.debug(f"Could not restore state of {name}: {e}")
+        self._on_state_restored(state, same_dataset)
+    
+    def _on_state_restored(self, state: Dict[str, Any], same_dataset: bool):
+        """
+        Redraw after restore_state(). Override in subclasses.
+        
+        Args:
+            state: Dict passed to restore_state()
+            same_dataset: Whether dataset-specific settings were restored
+        """
+        pass
+    
+    def _focus_dataset_name(self) -> Optional[str]:
+        """Name of the current focus dataset, if a controller is set."""
+        if not self.controller:
+            return None
+        return self.controller.get_state().focus_dataset
+    
     def should_auto_update(self, focus_info: Any) -> bool:
         """
         Check if this tab should auto-update for the given focus dataset.
@@ -226,7 +334,7 @@ class PlotTabWidget(ttk.Frame):
             True if the tab should update, False otherwise
         """
         # Default implementation - checks if focus dataset is loaded with data
-        if not focus_info or focus_info.status.value != "loaded":
+        if not focus_info or focus_info.status is not DatasetStatus.LOADED:
             return False
         
         # Check if there's any data to display
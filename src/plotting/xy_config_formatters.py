@@ -24,6 +24,16 @@ def register_formatter(name: str) -> Callable[[Formatter], Formatter]:
 def get_formatter(name: str) -> Optional[Formatter]:
     return FORMATTER_REGISTRY.get(name)
 
+def _add_track_series(series_dict: Dict[str, List[float]], time_arrays: List[List[Any]],
+                      prefix: str, track_ids, timestamps, values) -> None:
+    """Append one time-ordered series per track from flat, row-aligned inputs.
+
+    track_ids/timestamps are Series and values an array over the same rows.
+    """
+    for track_id, rows in FS.split_by_id(track_ids.to_numpy(), FS.timestamp_values(timestamps)):
+        series_dict[f"{prefix} {track_id}"] = values[rows].tolist()
+        time_arrays.append(timestamps.iloc[rows].tolist())
+
 @register_formatter('north_error_over_time')
 def north_error_over_time(app_state, widgets: Sequence[Any]) -> Dict[str, Any]:
     """Formatter for north (latitudinal) positional error vs time, per track (multi-series).
@@ -57,13 +67,10 @@ def north_error_over_time(app_state, widgets: Sequence[Any]) -> Dict[str, Any]:
                 df = errors_df[errors_df[track_col].isin(selected_tracks)] if selected_tracks else errors_df
                 if not df.empty:
                     try:
-                        for track_id, grp in df.groupby(track_col):
-                            grp_sorted = grp.sort_values(ts_col)
-                            errs = grp_sorted[north_col].dropna().astype(float).tolist()
-                            ts = pd.to_datetime(grp_sorted[ts_col])
-                            if errs and not ts.empty:
-                                series_dict[f"North Error {track_id}"] = errs
-                                time_arrays.append(ts.tolist())
+                        df = df[df[north_col].notna()]
+                        _add_track_series(series_dict, time_arrays, "North Error",
+                                          df[track_col], pd.to_datetime(df[ts_col]),
+                                          df[north_col].to_numpy(dtype=float))
                     except Exception:
                         series_dict = {}
                         time_arrays = []
@@ -84,23 +91,12 @@ def north_error_over_time(app_state, widgets: Sequence[Any]) -> Dict[str, Any]:
             tracks_df = tracks_df[tracks_df[t_id_col].isin(selected_tracks)]
             if tracks_df.empty:
                 return {'x': [], 'y': [], 'title': 'North Error'}
-        for track_id, df_track in tracks_df.groupby(t_id_col):
-            df_track = df_track.sort_values(t_ts_col)
-            north_errors: List[float] = []
-            times: List[Any] = []
-            for _, track_row in df_track.iterrows():
-                try:
-                    diffs = (truth_df[tr_ts_col] - track_row[t_ts_col]).abs()
-                    idx = diffs.idxmin()
-                    truth_row = truth_df.loc[idx]
-                    lat_error = (track_row[t_lat_col] - truth_row[tr_lat_col]) * 111000.0
-                except Exception:
-                    continue
-                north_errors.append(float(lat_error))
-                times.append(track_row[t_ts_col])
-            if north_errors and times:
-                series_dict[f"North Error {track_id}"] = north_errors
-                time_arrays.append(times)
+        try:
+            matched, errs = FS.nearest_truth_errors(tracks_df, truth_df, schema, ('north',))
+            _add_track_series(series_dict, time_arrays, "North Error",
+                              tracks_df[t_id_col][matched], tracks_df[t_ts_col][matched], errs['north'])
+        except Exception:
+            return {'x': [], 'y': [], 'title': 'North Error'}
 
     if not series_dict:
         return {'x': [], 'y': [], 'title': 'North Error'}
@@ -153,13 +149,10 @@ def east_error_over_time(app_state, widgets: Sequence[Any]) -> Dict[str, Any]:
             df = errors_df[errors_df[track_col].isin(selected_tracks)] if selected_tracks else errors_df
             if not df.empty:
                 try:
-                    for track_id, grp in df.groupby(track_col):
-                        grp_sorted = grp.sort_values(ts_col)
-                        errs = grp_sorted[east_col].dropna().astype(float).tolist()
-                        ts = pd.to_datetime(grp_sorted[ts_col])
-                        if errs and not ts.empty:
-                            series_dict[f"East Error {track_id}"] = errs
-                            time_arrays.append(ts.tolist())
+                    df = df[df[east_col].notna()]
+                    _add_track_series(series_dict, time_arrays, "East Error",
+                                      df[track_col], pd.to_datetime(df[ts_col]),
+                                      df[east_col].to_numpy(dtype=float))
                 except Exception:
                     series_dict = {}
                     time_arrays = []
@@ -180,23 +173,12 @@ def east_error_over_time(app_state, widgets: Sequence[Any]) -> Dict[str, Any]:
             tracks_df = tracks_df[tracks_df[t_id_col].isin(selected_tracks)]
             if tracks_df.empty:
                 return {'x': [], 'y': [], 'title': 'East Error'}
-        for track_id, df_track in tracks_df.groupby(t_id_col):
-            df_track = df_track.sort_values(t_ts_col)
-            east_errors: List[float] = []
-            times: List[Any] = []
-            for _, track_row in df_track.iterrows():
-                try:
-                    diffs = (truth_df[tr_ts_col] - track_row[t_ts_col]).abs()
-                    idx = diffs.idxmin()
-                    truth_row = truth_df.loc[idx]
-                    east_error = (track_row[t_lon_col] - truth_row[tr_lon_col]) * 111000.0 * np.cos(np.radians(truth_row[tr_lat_col]))
-                except Exception:
-                    continue
-                east_errors.append(float(east_error))
-                times.append(track_row[t_ts_col])
-            if east_errors and times:
-                series_dict[f"East Error {track_id}"] = east_errors
-                time_arrays.append(times)
+        try:
+            matched, errs = FS.nearest_truth_errors(tracks_df, truth_df, schema, ('east',))
+            _add_track_series(series_dict, time_arrays, "East Error",
+                              tracks_df[t_id_col][matched], tracks_df[t_ts_col][matched], errs['east'])
+        except Exception:
+            return {'x': [], 'y': [], 'title': 'East Error'}
 
     if not series_dict:
         return {'x': [], 'y': [], 'title': 'East Error'}
@@ -271,31 +253,10 @@ def rms_error_3d_over_time(app_state, widgets: Sequence[Any]) -> Dict[str, Any]:
     if tracks_df.empty:
         return {'x': [], 'y': [], 'title': 'RMS 3D Error'}
     try:
-        for track_id, df_track in tracks_df.groupby(t_id_col):
-            df_track = df_track.sort_values(t_ts_col)
-            errs: List[float] = []
-            times: List[Any] = []
-            for _, track_row in df_track.iterrows():
-                try:
-                    diffs = (truth_df[tr_ts_col] - track_row[t_ts_col]).abs()
-                    idx = diffs.idxmin()
-                    truth_row = truth_df.loc[idx]
-                    lat_error = (track_row[t_lat_col] - truth_row[tr_lat_col]) * 111000.0
-                    lon_error = (track_row[t_lon_col] - truth_row[tr_lon_col]) * 111000.0 * np.cos(np.radians(truth_row[tr_lat_col]))
-                    alt_error = 0.0
-                    if t_alt_col in track_row and tr_alt_col in truth_row:
-                        try:
-                            alt_error = (track_row[t_alt_col] - truth_row[tr_alt_col])
-                        except Exception:
-                            alt_error = 0.0
-                    err_mag = float(np.sqrt(lat_error**2 + lon_error**2 + alt_error**2))
-                except Exception:
-                    continue
-                errs.append(err_mag)
-                times.append(track_row[t_ts_col])
-            if errs and times:
-                series_dict[f"RMS 3D Error {track_id}"] = errs
-                time_arrays.append(times)
+        matched, errs = FS.nearest_truth_errors(tracks_df, truth_df, schema, ('north', 'east', 'alt'))
+        err_mag = np.sqrt(errs['north']**2 + errs['east']**2 + errs['alt']**2)
+        _add_track_series(series_dict, time_arrays, "RMS 3D Error",
+                          tracks_df[t_id_col][matched], tracks_df[t_ts_col][matched], err_mag)
     except Exception:
         return {'x': [], 'y': [], 'title': 'RMS 3D Error'}
 
@@ -15,6 +15,12 @@ Extension points for subclasses:
     - override build_custom_controls(parent_frame) to add UI elements; call request_update() when they change
     - override modify_config(config) to post-process the formatter output before plotting
 
+Background refresh:
+    snapshot_plot_inputs() (Tk thread) -> compute_plot_data(inputs) (any thread)
+    -> apply_plot_data(result) (Tk thread). The formatter and modify_config may
+    therefore run off the Tk thread; they only see snapshots of the formatter
+    widgets and of the focus dataset.
+
 Formatter output contract:
     Required: 'x' (sequence), 'y' (sequence or dict name->sequence)
     Optional: 'title', 'xlabel', 'ylabel', 'style' (line|scatter)
@@ -29,6 +35,8 @@ import logging
 from .widgets import PlotTabWidget
 from .backends import PlotBackend
 from .control_widgets import DataSelectionWidget, TrackSelectionWidget
+from .xy_config_formatters import get_formatter
+from .formatter_support import StateSnapshot, WidgetSnapshot
 
 
 class XYPlotTabWidget(PlotTabWidget):
@@ -51,13 +59,17 @@ class XYPlotTabWidget(PlotTabWidget):
             self.include_data_selection = include_data_selection
             self.include_track_selection = include_track_selection
 
-            # Formatter plumbing
+            # Formatter plumbing (resolved once; the registry is filled at import time)
             self._formatter_name = formatter_name
+            self._formatter = get_formatter(formatter_name) if formatter_name else None
 
             # Widget references (created later if flags enabled)
             self.data_selection_widget = None
             self.track_selection_widget = None
 
+            # Bumped per snapshot so results of superseded background computations are dropped
+            self._plot_generation = 0
+
             super().__init__(parent, backend, title)
 
             # Initial plot attempt
@@ -111,20 +123,25 @@ class XYPlotTabWidget(PlotTabWidget):
         """Trigger a plot refresh (safe to call from UI callbacks)."""
         self._update_xy_plot()
 
-    def _build_plot_config(self) -> Dict[str, Any]:
+    def _formatter_widgets(self) -> List[Any]:
+        """Collect the widgets passed to the formatter."""
+        widgets: List[Any] = []
+        if self.include_data_selection and self.data_selection_widget:
+            widgets.append(self.data_selection_widget)
+        if self.include_track_selection and self.track_selection_widget:
+            widgets.append(self.track_selection_widget)
+        widgets.extend(self.get_formatter_widgets())
+        return widgets
+
+    def _build_plot_config(self, widgets: Optional[List[Any]] = None,
+                           app_state: Optional[Any] = None) -> Dict[str, Any]:
         """Build config via the provided formatter; supply defaults; allow subclass post-processing."""
         if not self.controller:
             return {'x': [], 'y': []}
 
         # The formatters are registered in the xy_config_formatters.py file
-        # The formatter name is passed in to this class's constructor
-        formatter = None
-        if formatter is None and getattr(self, '_formatter_name', None):
-            try:
-                from .xy_config_formatters import get_formatter
-                formatter = get_formatter(self._formatter_name)  # type: ignore[arg-type]
-            except Exception:
-                formatter = None
+        # The formatter name passed to the constructor was resolved there
+        formatter = self._formatter
         if formatter is None:
             formatter = self.get_config_formatter()
         if not formatter:
@@ -132,15 +149,12 @@ class XYPlotTabWidget(PlotTabWidget):
 
         # This instance's widgets are passed in to the formatter. 
         # Their values are queried to build the configuration.
-        widgets: List[Any] = []
-        if self.include_data_selection and self.data_selection_widget:
-            widgets.append(self.data_selection_widget)
-        if self.include_track_selection and self.track_selection_widget:
-            widgets.append(self.track_selection_widget)
-        widgets.extend(self.get_formatter_widgets())
+        if widgets is None:
+            widgets = self._formatter_widgets()
 
         # The formatter also takes the current application state (which contains all the data)
-        app_state = self.controller.get_state()
+        if app_state is None:
+            app_state = self.controller.get_state()
         try:
             built_cfg: Dict[str, Any] = formatter(app_state, widgets) or {}
         except Exception as e:
@@ -154,36 +168,78 @@ class XYPlotTabWidget(PlotTabWidget):
         built_cfg = self.modify_config(built_cfg)
         return built_cfg
 
-    def _update_xy_plot(self):
+    def snapshot_plot_inputs(self) -> Dict[str, Any]:
+        """Capture the formatter inputs on the Tk thread for compute_plot_data()."""
+        self._plot_generation += 1
+        # Widgets and the focus dataset are read here so the worker never touches
+        # Tk variables or model state the Tk thread may be replacing
+        widgets = [WidgetSnapshot(w) for w in self._formatter_widgets()]
+        app_state = StateSnapshot(self.controller.get_state()) if self.controller else None
+        return {'generation': self._plot_generation, 'widgets': widgets, 'app_state': app_state}
+
+    def compute_plot_data(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the formatter and PlotManager preparation; touches no Tk or Matplotlib objects."""
+        result: Dict[str, Any] = {'generation': inputs.get('generation'), 'plot_data': None, 'viz_cfg': None}
+        app_state = inputs.get('app_state')
+        if not (self.plot_manager and self.controller and app_state is not None):
+            return result
+
+        config = self._build_plot_config(inputs.get('widgets'), app_state)
+        plot_data = self.plot_manager.prepare_plot_data('generic_xy', app_state, config)
+
+        if plot_data and 'error' not in plot_data:
+            result['plot_data'] = plot_data
+            # Pass through labels and title to backend
+            result['viz_cfg'] = {
+                'title': config.get('title', 'XY Plot'),
+                'xlabel': config.get('xlabel', 'X'),
+                'ylabel': config.get('ylabel', 'Y'),
+                'style': config.get('style', 'line'),
+                'series_styles': config.get('series_styles'),
+                'y_ticks': config.get('y_ticks'),
+            }
+        return result
+
+    def apply_plot_data(self, result: Dict[str, Any], mode: str = 'blit'):
+        """Draw a compute_plot_data() result unless a newer snapshot superseded it."""
+        if result.get('generation') != self._plot_generation:
+            return
+        self._last_plot_result = result
         try:
-            if not (self.plot_manager and self.controller):
+            plot_data = result.get('plot_data')
+            if not plot_data:
                 self.clear_plot()
-                return
-
-            app_state = self.controller.get_state()
-            config = self._build_plot_config()
-            plot_data = self.plot_manager.prepare_plot_data('generic_xy', app_state, config)
-
-            if plot_data and 'error' not in plot_data:
-                # Pass through labels and title to backend
-                viz_cfg = {
-                    'title': config.get('title', 'XY Plot'),
-                    'xlabel': config.get('xlabel', 'X'),
-                    'ylabel': config.get('ylabel', 'Y'),
-                    'style': config.get('style', 'line'),
-                    'series_styles': config.get('series_styles'),
-                    'y_ticks': config.get('y_ticks'),
-                }
-                self.update_plot('generic_xy', plot_data, viz_cfg)
+            elif mode == 'blit':
+                self.plot_canvas.update_generic_xy(plot_data, result.get('viz_cfg'))
             else:
+                self.update_plot('generic_xy', plot_data, result.get('viz_cfg'))
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error applying XY plot data: {e}")
+            self.clear_plot()
+
+    def _update_xy_plot(self, mode: str = 'full'):
+        try:
+            if not (self.plot_manager and self.controller):
                 self.clear_plot()
+                return
+            self.apply_plot_data(self.compute_plot_data(self.snapshot_plot_inputs()), mode)
         except Exception as e:
             logging.getLogger(__name__).error(f"Error updating XY plot: {e}")
             self.clear_plot()
 
-    def auto_update(self):
+    def _on_state_restored(self, state: Dict[str, Any], same_dataset: bool):
+        result = state.get('plot_result') if same_dataset else None
+        if result is None:
+            self.request_update()
+            return
+        # Data and settings unchanged since the tab was released: redraw as-is
+        self._plot_generation += 1
+        self.apply_plot_data(dict(result, generation=self._plot_generation), mode='full')
+
+    def auto_update(self, mode: str = 'full'):
+        """Refresh after a dataset change; mode='blit' reuses the existing lines when possible."""
         self.on_focus_dataset_changed()
-        self._update_xy_plot()
+        self._update_xy_plot(mode)
 
     def on_focus_dataset_changed(self):
         try:
@@ -7,8 +7,12 @@ from typing import Any, Dict, Optional
 
 try:
     import yaml  # type: ignore
+    # Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 except Exception:  # pragma: no cover - runtime import error handled by caller
     yaml = None  # fallback when PyYAML is not installed
+    _YamlLoader = _YamlDumper = None
 
 
 DEFAULT_CONFIG: Dict[str, Any] = {
@@ -41,8 +45,7 @@ class ConfigLoader:
                 )
                 return config
 
-            with path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
 
             if not isinstance(data, dict):
                 self.logger.warning("Config file did not contain a mapping. Using defaults.")
@@ -53,26 +56,33 @@ class ConfigLoader:
                 if key in data:
                     config[key] = data[key]
 
-            # Normalize DatasetDirectory to Path if present
-            if config.get("DatasetDirectory"):
-                try:
-                    config["DatasetDirectory"] = Path(config["DatasetDirectory"]).expanduser()
-                except Exception:
-                    self.logger.warning("Invalid DatasetDirectory in config. Ignoring.")
-                    config["DatasetDirectory"] = None
-
-            return config
+            return self._normalize(config)
         except Exception as exc:  # pragma: no cover - defensive
             self.logger.error(f"Failed to load config: {exc}")
             return config
 
-    def save(self, path: Path, updates: Dict[str, Any]) -> Dict[str, Any]:
+    def _normalize(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize DatasetDirectory to a Path if present."""
+        if config.get("DatasetDirectory"):
+            try:
+                config["DatasetDirectory"] = Path(config["DatasetDirectory"]).expanduser()
+            except Exception:
+                self.logger.warning("Invalid DatasetDirectory in config. Ignoring.")
+                config["DatasetDirectory"] = None
+        return config
+
+    def save(self, path: Path, updates: Dict[str, Any],
+             current: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Save updates to the YAML config while preserving other keys.
         Returns the resulting config dict.
+
+        If ``current`` is given it is used as the existing config instead of
+        re-reading the file.
         """
         try:
-            current = self.load(path)
+            if current is None:
+                current = self.load(path)
             # Merge current + updates first
             to_save: Dict[str, Any] = {}
             to_save.update(current)
@@ -92,15 +102,18 @@ class ConfigLoader:
             # Ensure only known keys are persisted to keep file tidy
             ordered: Dict[str, Any] = {k: to_save.get(k, DEFAULT_CONFIG[k]) for k in DEFAULT_CONFIG.keys()}
 
+            if yaml is None:
+                self.logger.warning("PyYAML is not installed. Skipping config save.")
+                return self._normalize(dict(ordered))
+
+            # Serialize in memory, then write the file in one call
             path.parent.mkdir(parents=True, exist_ok=True)
-            import yaml as _yaml  # local import for save
-            with path.open("w", encoding="utf-8") as f:
-                _yaml.safe_dump(ordered, f, sort_keys=False)
+            text = yaml.dump(ordered, Dumper=_YamlDumper, sort_keys=False)
+            path.write_text(text, encoding="utf-8")
 
             self.logger.debug(f"Saved configuration to {path}")
-            # Return unified with normalized DatasetDirectory as Path
-            result = self.load(path)
-            return result
+            # Return unified with normalized DatasetDirectory as Path (no re-read needed)
+            return self._normalize(dict(ordered))
         except Exception as exc:
             self.logger.error(f"Failed to save config: {exc}")
             return self.load(path)
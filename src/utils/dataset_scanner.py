@@ -6,9 +6,10 @@ valid datasets according to the expected directory structure.
 """
 
 import logging
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from pathlib import Path
 import os
+import threading
 from datetime import datetime
 
 from ..models.application_state import DatasetInfo, DatasetStatus
@@ -40,27 +41,44 @@ class DatasetScanner:
         Returns:
             List of DatasetInfo objects for discovered datasets
         """
-        self.logger.info(f"Scanning directory for datasets: {directory_path}")
+        return list(self.iter_directory(directory_path))
+    
+    def iter_directory(self, directory_path: Path,
+                       cancel_event: Optional[threading.Event] = None) -> Iterator[DatasetInfo]:
+        """
+        Yield valid datasets in a directory as they are discovered.
         
-        datasets = []
+        Args:
+            directory_path: Path to the directory containing datasets
+            cancel_event: Optional event; the scan stops once it is set
+            
+        Yields:
+            DatasetInfo objects for discovered datasets
+        """
+        self.logger.info(f"Scanning directory for datasets: {directory_path}")
         
         if not directory_path.exists():
             self.logger.warning(f"Directory does not exist: {directory_path}")
-            return datasets
+            return
         
         if not directory_path.is_dir():
             self.logger.warning(f"Path is not a directory: {directory_path}")
-            return datasets
+            return
         
-        # Scan each subdirectory
-        for item in directory_path.iterdir():
-            if item.is_dir():
-                dataset_info = self._analyze_dataset_directory(item)
-                if dataset_info:
-                    datasets.append(dataset_info)
+        # Scan each subdirectory; scandir entries carry their type, saving a stat per entry
+        found = 0
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if cancel_event is not None and cancel_event.is_set():
+                    self.logger.info(f"Scan cancelled after {found} datasets")
+                    return
+                if entry.is_dir():
+                    dataset_info = self._analyze_dataset_directory(Path(entry.path))
+                    if dataset_info:
+                        found += 1
+                        yield dataset_info
         
-        self.logger.info(f"Found {len(datasets)} valid datasets")
-        return datasets
+        self.logger.info(f"Found {found} valid datasets")
     
     def _analyze_dataset_directory(self, dataset_path: Path) -> Optional[DatasetInfo]:
         """
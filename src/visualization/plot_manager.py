@@ -6,10 +6,11 @@ data preparation, and coordination between the business logic and visualization
 """
 
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
-from ..models.application_state import ApplicationState, DatasetInfo
+from ..models.application_state import ApplicationState, DatasetInfo, DatasetStatus
 from ..business.data_interface import DataInterface
 from ..utils.schema_access import get_col
 
@@ -32,8 +33,45 @@ class PlotManager:
         self.data_interface = data_interface
         self.logger = logging.getLogger(__name__)
         
+        # Small LRU cache of prepared geospatial plot data
+        self._plot_data_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._plot_data_cache_size = 8
+        
         self.logger.info("Plot manager initialized")
     
+    # Plot types whose prepared data depends only on the config and focus dataset
+    _CACHEABLE_PLOT_IDS = ('lat_lon_scatter', 'lat_lon_animation')
+    
+    def clear_cache(self):
+        """Discard all memoized plot data (e.g. after datasets are reloaded)."""
+        self._plot_data_cache.clear()
+    
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        """Convert a config value into a hashable form for cache keys."""
+        if isinstance(value, dict):
+            return tuple(sorted((str(k), cls._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return tuple(sorted(repr(v) for v in value))
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return repr(value)
+    
+    def _plot_data_cache_key(self, plot_id: str, app_state: ApplicationState,
+                             plot_config: Dict[str, Any]) -> Optional[tuple]:
+        """Build the memoization key for a plot request, or None if not cacheable."""
+        if plot_id not in self._CACHEABLE_PLOT_IDS:
+            return None
+        focus_info = app_state.get_focus_dataset_info()
+        if not focus_info or focus_info.status is not DatasetStatus.LOADED:
+            return None
+        return (plot_id, self._freeze(plot_config), focus_info.name,
+                id(focus_info.tracks_df), id(focus_info.truth_df))
+    
     def prepare_plot_data(self, plot_id: str, app_state: ApplicationState, 
                          plot_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -53,6 +91,31 @@ class PlotManager:
             
             self.logger.debug(f"Preparing data for plot: {plot_id}")
             
+            cache_key = self._plot_data_cache_key(plot_id, app_state, plot_config)
+            if cache_key is not None:
+                cached = self._plot_data_cache.get(cache_key)
+                if cached is not None:
+                    self._plot_data_cache.move_to_end(cache_key)
+                    self.logger.debug(f"Using cached plot data for: {plot_id}")
+                    return dict(cached)
+                
+                result = self._prepare_plot_data(plot_id, app_state, plot_config)
+                if 'error' not in result:
+                    self._plot_data_cache[cache_key] = result
+                    while len(self._plot_data_cache) > self._plot_data_cache_size:
+                        self._plot_data_cache.popitem(last=False)
+                return dict(result)
+            
+            return self._prepare_plot_data(plot_id, app_state, plot_config)
+        
+        except Exception as e:
+            self.logger.error(f"Error preparing plot data for {plot_id}: {e}")
+            return {'error': str(e)}
+    
+    def _prepare_plot_data(self, plot_id: str, app_state: ApplicationState,
+                           plot_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch plot data preparation by plot type."""
+        try:
             if plot_id == 'track_counts':
                 return self._prepare_track_counts_data(app_state, plot_config)
             elif plot_id == 'lat_lon_scatter':
@@ -79,13 +142,13 @@ class PlotManager:
         datasets_to_include = config.get('selected_datasets', [])
         if not datasets_to_include:
             datasets_to_include = [name for name, info in app_state.datasets.items() 
-                                 if info.status.value == "loaded"]
+                                 if info.status is DatasetStatus.LOADED]
         
         # Count tracks for each dataset
         for dataset_name in datasets_to_include:
             if dataset_name in app_state.datasets:
                 dataset_info = app_state.datasets[dataset_name]
-                if dataset_info.status.value == "loaded" and dataset_info.tracks_df is not None:
+                if dataset_info.status is DatasetStatus.LOADED and dataset_info.tracks_df is not None:
                     try:
                         schema = getattr(dataset_info, 'schema', None)
                         track_col = get_col(schema, 'tracks', 'track_id')
@@ -255,7 +318,7 @@ class PlotManager:
         """Prepare data for latitude/longitude scatter plot."""
         focus_dataset = app_state.get_focus_dataset_info()
         
-        if not focus_dataset or focus_dataset.status.value != "loaded":
+        if not focus_dataset or focus_dataset.status is not DatasetStatus.LOADED:
             return {'error': 'No loaded focus dataset available'}
 
         result = self._filter_tracks_and_truth_data(focus_dataset, config)
@@ -273,7 +336,7 @@ class PlotManager:
         """Prepare data for animated lat/lon plot."""        
         focus_dataset = app_state.get_focus_dataset_info()
 
-        if not focus_dataset or focus_dataset.status.value != "loaded":
+        if not focus_dataset or focus_dataset.status is not DatasetStatus.LOADED:
             return {'error': 'No loaded focus dataset available'}
         
         result = self._filter_tracks_and_truth_data(focus_dataset, config)        
@@ -313,7 +376,7 @@ class PlotManager:
         Only filter/sort on ids if corresponding config keys are present.
         """
         focus = app_state.get_focus_dataset_info()
-        if not focus or focus.status.value != "loaded":
+        if not focus or focus.status is not DatasetStatus.LOADED:
             return {'error': 'No loaded focus dataset available'}
 
         # Helper to coerce sequences (including pandas/np series) to list